@@ -0,0 +1,395 @@
+"""Benchmark ProfileStore and the sync hook against a local bare-repo remote.
+
+Sets up a bare git repository as a git+file:// profile source and drives the
+my_voice_profiles tool and the my-voice-sync hook through session traces:
+
+  cold_clone   - new device: session start, then the first read (waits on clone)
+  warm_start   - new process on a synced device: session start + first read
+  stale_start  - new process whose last sync is old: probes/pulls the remote
+  read_heavy   - message-tuner session: prompts, section reads, read_many,
+                 lint and score per message
+  write_heavy  - voice-analyst session: learnings, profile rewrites, flush
+
+Reports latency percentiles per operation and the git subprocesses each trace
+started (by subcommand). Run from the repo root with both modules and
+amplifier-core installed:
+
+    python benchmarks/bench_profile_store.py
+    python benchmarks/bench_profile_store.py --iterations 50 --json results.json
+
+Compare runs before and after a change to spot sync regressions.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TEMPLATE = REPO_ROOT / "templates" / "VOICE_PROFILE_TEMPLATE.md"
+
+# Let the benchmark run from a source checkout without installing the modules
+for module_dir in ("tool-my-voice-profiles", "hook-my-voice-sync"):
+    sys.path.insert(0, str(REPO_ROOT / "modules" / module_dir))
+
+from amplifier_module_my_voice_profiles import store as store_module
+from amplifier_module_my_voice_profiles.tool import MyVoiceProfilesTool
+from amplifier_module_my_voice_sync.hook import MyVoiceSyncHook
+
+# Commits made by save() need an identity even on a bare CI machine
+GIT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "bench",
+    "GIT_AUTHOR_EMAIL": "bench@example.com",
+    "GIT_COMMITTER_NAME": "bench",
+    "GIT_COMMITTER_EMAIL": "bench@example.com",
+}
+
+DRAFT = (
+    "Hey team, quick q on the launch - I hope this email finds you well. "
+    "tbh I think we should push the deploy to Thursday w/ the new checklist, "
+    "lmk if that works!!"
+)
+
+PROFILE_EXTRAS = """
+### NEVER DO
+- Open with "I hope this email finds you well"
+- Use 'utilize' instead of use
+
+## Anti-Patterns (What NOT To Do)
+
+### Don't over-apologize
+❌ Sorry to bother you
+✅ Just ask
+"""
+
+READ_QUICK_REFERENCE = {"operation": "read", "sections": ["Quick Reference Card"]}
+
+SAMPLES = [
+    "Hey team, quick q - are we still on for Thursday? lmk",
+    "tbh the deploy is blocked on review, gonna ping the owners",
+    "Sounds good!! shipping it w/ the new checklist",
+    "btw the dashboard is back up, thx for the quick fix",
+    "Quick q: who owns the release notes this week?",
+]
+
+
+@contextmanager
+def count_subprocesses() -> Iterator[Counter]:
+    """Count subprocesses started via asyncio inside the block, by git subcommand.
+
+    The store looks up asyncio.create_subprocess_exec on every call, so
+    patching the module attribute sees every git invocation.
+    """
+    counts: Counter[str] = Counter()
+    original = asyncio.create_subprocess_exec
+
+    async def counting_exec(program: str, *args: Any, **kwargs: Any):
+        name = f"git {args[0]}" if program == "git" and args else program
+        counts[name] += 1
+        return await original(program, *args, **kwargs)
+
+    asyncio.create_subprocess_exec = counting_exec
+    try:
+        yield counts
+    finally:
+        asyncio.create_subprocess_exec = original
+
+
+class Coordinator:
+    """Just enough of a coordinator for the hook to emit events into."""
+
+    class _Hooks:
+        def __init__(self) -> None:
+            self.events: list[tuple[str, dict]] = []
+
+        async def emit(self, event: str, data: dict) -> None:
+            self.events.append((event, data))
+
+    def __init__(self) -> None:
+        self.hooks = self._Hooks()
+
+
+class Recorder:
+    """Latency samples per (trace, operation) and subprocess counts per trace."""
+
+    def __init__(self) -> None:
+        self.samples: dict[tuple[str, str], list[float]] = defaultdict(list)
+        self.subprocesses: dict[str, Counter] = defaultdict(Counter)
+
+    async def time(self, trace: str, operation: str, awaitable: Any) -> Any:
+        started = time.perf_counter()
+        result = await awaitable
+        self.samples[(trace, operation)].append((time.perf_counter() - started) * 1000)
+        if hasattr(result, "success") and not result.success:
+            raise RuntimeError(f"{trace}/{operation} failed: {result.error}")
+        return result
+
+    @contextmanager
+    def counting(self, trace: str) -> Iterator[None]:
+        """Attribute subprocesses started in the block to trace (setup excluded)."""
+        with count_subprocesses() as counts:
+            yield
+        self.subprocesses[trace].update(counts)
+
+    def report(self) -> dict:
+        rows: dict[str, dict] = {}
+        for (trace, operation), values in self.samples.items():
+            ordered = sorted(values)
+            rows.setdefault(trace, {})[operation] = {
+                "n": len(ordered),
+                "p50_ms": round(_percentile(ordered, 0.5), 2),
+                "p90_ms": round(_percentile(ordered, 0.9), 2),
+                "p99_ms": round(_percentile(ordered, 0.99), 2),
+                "max_ms": round(ordered[-1], 2),
+                "mean_ms": round(statistics.fmean(ordered), 2),
+            }
+        return {
+            "latency": rows,
+            "subprocesses": {t: dict(c) for t, c in self.subprocesses.items()},
+        }
+
+
+def _percentile(ordered: list[float], share: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    index = min(len(ordered) - 1, max(0, round(share * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _git(*args: str, cwd: Path) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+def make_remote(root: Path, profiles: int) -> Path:
+    """Create a bare repo seeded with `profiles` profiles and decoder rings."""
+    remote = root / "remote.git"
+    seed = root / "seed"
+    _git("init", "-q", "--bare", "-b", "main", str(remote), cwd=root)
+    _git("clone", "-q", str(remote), str(seed), cwd=root)
+    content = TEMPLATE.read_text() + PROFILE_EXTRAS
+    for i in range(profiles):
+        name = "default" if i == 0 else f"colleague-{i}"
+        profile_dir = seed / "profiles" / name
+        profile_dir.mkdir(parents=True)
+        (profile_dir / "VOICE_PROFILE.md").write_text(content)
+        (profile_dir / "DECODER_RING.md").write_text(f"# Decoder Ring: {name}\n")
+    _git("add", "-A", cwd=seed)
+    _git("commit", "-q", "-m", "Seed profiles", cwd=seed)
+    _git("push", "-q", "origin", "HEAD:main", cwd=seed)
+    return remote
+
+
+def make_config(remote: Path, local_path: Path, args: argparse.Namespace) -> dict:
+    config = {
+        "profile_source": f"git+file://{remote}",
+        "local_path": str(local_path),
+        "background_sync": not args.blocking_sync,
+    }
+    if args.save_delay is not None:
+        config["save_delay"] = args.save_delay
+    return {"my-voice": config}
+
+
+def new_process(config: dict) -> tuple[MyVoiceProfilesTool, MyVoiceSyncHook]:
+    """Fresh tool + hook sharing a fresh store, as a new process would have."""
+    store_module.get_store(config["my-voice"], replace=True)
+    return MyVoiceProfilesTool(config), MyVoiceSyncHook(config, Coordinator())
+
+
+async def settle(rec: Recorder, trace: str, config: dict) -> None:
+    """Wait for a background sync so it's counted against this trace."""
+    store = store_module.get_store(config["my-voice"])
+    if store.sync_in_flight:
+        await rec.time(trace, "background_sync", store.sync())
+
+
+async def session_start(rec: Recorder, trace: str, config: dict) -> MyVoiceProfilesTool:
+    """New process: session:start hook, then the first profile read."""
+    tool, hook = new_process(config)
+    await rec.time(
+        trace, "session_start", hook.handle_session_start("session:start", {})
+    )
+    await rec.time(trace, "first_read", tool.execute(READ_QUICK_REFERENCE))
+    await settle(rec, trace, config)
+    return tool
+
+
+async def cold_clone(rec: Recorder, remote: Path, root: Path, args) -> None:
+    for i in range(args.iterations):
+        config = make_config(remote, root / f"cold-{i}", args)
+        with rec.counting("cold_clone"):
+            await session_start(rec, "cold_clone", config)
+        shutil.rmtree(root / f"cold-{i}")
+
+
+async def warm_start(rec: Recorder, remote: Path, root: Path, args) -> None:
+    config = make_config(remote, root / "warm", args)
+    tool, _ = new_process(config)
+    await tool.execute({"operation": "sync", "force": True})
+    for _ in range(args.iterations):
+        with rec.counting("warm_start"):
+            await session_start(rec, "warm_start", config)
+
+
+async def stale_start(rec: Recorder, remote: Path, root: Path, args) -> None:
+    config = make_config(remote, root / "stale", args)
+    tool, _ = new_process(config)
+    await tool.execute({"operation": "sync", "force": True})
+    store = store_module.get_store(config["my-voice"])
+    state_path = store.meta_dir / store_module.SYNC_STATE_FILE
+    for _ in range(args.iterations):
+        # Age the persisted sync state so the next process sees a stale copy
+        state = json.loads(state_path.read_text())
+        state["last_sync"] = time.time() - store_module.STALENESS_THRESHOLD - 1
+        state_path.write_text(json.dumps(state))
+        with rec.counting("stale_start"):
+            await session_start(rec, "stale_start", config)
+
+
+async def read_heavy(rec: Recorder, remote: Path, root: Path, args) -> None:
+    config = make_config(remote, root / "reads", args)
+    tool, hook = new_process(config)
+    await hook.handle_session_start("session:start", {})
+    await tool.execute({"operation": "build_style_vector", "samples": SAMPLES})
+    await tool.execute({"operation": "flush"})
+    await store_module.get_store(config["my-voice"]).drain_outbox()
+    operations = {
+        "read_sections": {
+            "operation": "read",
+            "sections": ["Quick Reference Card", "Chat"],
+        },
+        "read_many": {
+            "operation": "read_many",
+            "items": [
+                {"profile": "default", "sections": ["Quick Reference Card"]},
+                {"profile": "colleague-1", "artifact": "decoder_ring"},
+            ],
+        },
+        "lint": {"operation": "lint", "content": DRAFT},
+        "score": {"operation": "score", "drafts": [DRAFT, DRAFT.lower()]},
+        "status": {"operation": "status"},
+    }
+    with rec.counting("read_heavy"):
+        for _ in range(args.iterations):
+            await rec.time(
+                "read_heavy", "prompt", hook.handle_prompt("prompt:submit", {})
+            )
+            for name, request in operations.items():
+                await rec.time("read_heavy", name, tool.execute(request))
+
+
+async def write_heavy(rec: Recorder, remote: Path, root: Path, args) -> None:
+    config = make_config(remote, root / "writes", args)
+    tool, hook = new_process(config)
+    await hook.handle_session_start("session:start", {})
+    content = (await tool.execute({"operation": "read"})).output["content"]
+    with rec.counting("write_heavy"):
+        for i in range(args.iterations):
+            learning = {
+                "operation": "append_learning",
+                "observation": f"Observation {i}",
+                "adjustment": f"Adjustment {i}",
+            }
+            await rec.time("write_heavy", "append_learning", tool.execute(learning))
+            if i % 5 == 0:
+                rewrite = {
+                    "operation": "write",
+                    "content": f"{content}\n<!-- {i} -->\n",
+                }
+                await rec.time("write_heavy", "write", tool.execute(rewrite))
+                samples = {"operation": "add_samples", "samples": SAMPLES}
+                await rec.time("write_heavy", "add_samples", tool.execute(samples))
+        await rec.time("write_heavy", "flush", tool.execute({"operation": "flush"}))
+        save = {"operation": "save", "message": "Benchmark save"}
+        await rec.time("write_heavy", "save", tool.execute(save))
+        await rec.time(
+            "write_heavy", "session_end", hook.handle_session_end("session:end", {})
+        )
+
+
+TRACES = {
+    "cold_clone": cold_clone,
+    "warm_start": warm_start,
+    "stale_start": stale_start,
+    "read_heavy": read_heavy,
+    "write_heavy": write_heavy,
+}
+
+
+async def run(args: argparse.Namespace) -> dict:
+    os.environ.update({k: os.environ.get(k, v) for k, v in GIT_IDENTITY.items()})
+    rec = Recorder()
+    with tempfile.TemporaryDirectory(prefix="my-voice-bench-") as tmp:
+        root = Path(tmp)
+        remote = make_remote(root, args.profiles)
+        for name in args.traces:
+            await TRACES[name](rec, remote, root, args)
+    report = rec.report()
+    report["config"] = {
+        "iterations": args.iterations,
+        "profiles": args.profiles,
+        "background_sync": not args.blocking_sync,
+        "save_delay": (
+            store_module.SAVE_DELAY if args.save_delay is None else args.save_delay
+        ),
+    }
+    return report
+
+
+def print_report(report: dict) -> None:
+    columns = "".join(f"{name:>10}" for name in ("p50", "p90", "p99", "max"))
+    header = f"{'trace':<12} {'operation':<16} {'n':>4}{columns}"
+    print(header)
+    print("-" * len(header))
+    for trace, operations in report["latency"].items():
+        for operation, row in operations.items():
+            print(
+                f"{trace:<12} {operation:<16} {row['n']:>4} "
+                f"{row['p50_ms']:>7.2f}ms {row['p90_ms']:>7.2f}ms "
+                f"{row['p99_ms']:>7.2f}ms {row['max_ms']:>7.2f}ms"
+            )
+    print()
+    print("Subprocesses started per trace:")
+    for trace, counts in report["subprocesses"].items():
+        total = sum(counts.values())
+        detail = ", ".join(f"{name}={n}" for name, n in sorted(counts.items()))
+        print(f"  {trace:<12} {total:>4}  ({detail or 'none'})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument(
+        "--profiles", type=int, default=5, help="Profiles in the remote"
+    )
+    parser.add_argument(
+        "--traces", nargs="+", choices=list(TRACES), default=list(TRACES)
+    )
+    parser.add_argument(
+        "--blocking-sync", action="store_true", help="Disable background_sync"
+    )
+    parser.add_argument(
+        "--save-delay",
+        type=float,
+        help="save_delay for the stores (default: store default)",
+    )
+    parser.add_argument("--json", metavar="PATH", help="Also write results as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print_report(report)
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
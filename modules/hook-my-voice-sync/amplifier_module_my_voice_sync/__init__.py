@@ -7,7 +7,7 @@ async def mount(coordinator: Any, config: dict[str, Any] | None = None):
     """Mount function - register hook handlers."""
     from .hook import MyVoiceSyncHook
 
-    hook = MyVoiceSyncHook(config or {})
+    hook = MyVoiceSyncHook(config or {}, coordinator)
 
     # Register handlers with the hook registry
     unregister_session = coordinator.hooks.register(
@@ -16,10 +16,14 @@ async def mount(coordinator: Any, config: dict[str, Any] | None = None):
     unregister_prompt = coordinator.hooks.register(
         "prompt:submit", hook.handle_prompt, priority=10, name="my-voice-sync"
     )
+    unregister_session_end = coordinator.hooks.register(
+        "session:end", hook.handle_session_end, priority=10, name="my-voice-sync"
+    )
 
     # Return cleanup function
     def cleanup():
         unregister_session()
         unregister_prompt()
+        unregister_session_end()
 
     return cleanup
@@ -1,11 +1,20 @@
 """Voice profile sync hook - keeps profiles fresh across long sessions."""
 
+import asyncio
+import logging
 import time
 from typing import Any
 
 from amplifier_core import HookResult
+from amplifier_module_my_voice_profiles.metrics import Metrics, timed
+from amplifier_module_my_voice_profiles.store import (
+    PUSH_DRAIN_TIMEOUT,
+    STALENESS_THRESHOLD,
+    ProfileStore,
+    get_store,
+)
 
-from .store import ProfileStore, STALENESS_THRESHOLD
+logger = logging.getLogger(__name__)
 
 
 class MyVoiceSyncHook:
@@ -15,39 +24,132 @@ class MyVoiceSyncHook:
     The agents themselves handle first-run onboarding and user interaction.
     """
 
-    def __init__(self, config: dict[str, Any] | None = None):
-        my_voice_config = (config or {}).get("my-voice", {})
-        self._store = ProfileStore(my_voice_config)
+    def __init__(self, config: dict[str, Any] | None = None, coordinator: Any = None):
+        self._config: dict[str, Any] = (config or {}).get("my-voice", {})
+        self._coordinator = coordinator
         self._last_check: float = 0
         self._check_interval = STALENESS_THRESHOLD
+        # Pull in the background at session start instead of blocking the user
+        self._background_sync = bool(self._config.get("background_sync", True))
+        self._tasks: set[asyncio.Task] = set()
+        # Forward every timing span (git calls, syncs, reads, writes, these
+        # handlers) as a my-voice:span event - off by default, it's chatty
+        self._emit_metrics = bool(self._config.get("emit_metrics", False))
+        self._watched_metrics: Metrics | None = None
 
+    @property
+    def _store(self) -> ProfileStore:
+        """Shared store for the configured local_path (also used by the tool)."""
+        return get_store(self._config)
+
+    @property
+    def metrics(self) -> Metrics:
+        """The shared store's histograms - handler spans are recorded there."""
+        return self._store.metrics
+
+    def _watch_metrics(self) -> None:
+        """Subscribe to the current store's spans if emit_metrics is on."""
+        if not self._emit_metrics or self._watched_metrics is self.metrics:
+            return
+        self._watched_metrics = self.metrics
+        self._watched_metrics.add_listener(self._on_span)
+
+    def _on_span(self, name: str, duration_ms: float, ok: bool) -> None:
+        """Emit a finished span without making the timed call wait on it."""
+        task = asyncio.ensure_future(
+            self._emit(
+                "my-voice:span",
+                {"span": name, "duration_ms": round(duration_ms, 2), "success": ok},
+            )
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @timed("hook.session_start")
     async def handle_session_start(
         self, event: str, data: dict[str, Any]
     ) -> HookResult:
         """Handle session start - sync if configured, otherwise just continue."""
+        started = time.perf_counter()
+        self._watch_metrics()
         state = self._store.configuration_state
 
-        if state == "unconfigured":
-            # Don't inject guidance - agents handle first-run onboarding themselves
-            return HookResult(action="continue")
-
-        if state == "configured_needs_clone":
-            # Auto-sync for returning users on new devices
-            await self._store.sync(force=True)
+        # "unconfigured": don't inject guidance - agents handle first-run onboarding
+        # "configured_no_profile": storage ready but no profile - agents handle this
+        # "configured_needs_clone": auto-sync for returning users on new devices
+        # "ready": normal sync - skipped if any process on this machine synced
+        #          recently (the store persists its sync state under local_path)
+        if state in ("configured_needs_clone", "ready"):
+            await self._session_start_sync()
             self._last_check = time.time()
-            return HookResult(action="continue")
+            # No-op unless config.my-voice.watch is set (or nothing's cloned yet)
+            self._store.start_watching()
 
-        if state == "configured_no_profile":
-            # Storage ready but no profile - agents will handle this
-            return HookResult(action="continue")
+        await self._emit(
+            "my-voice:session_start",
+            {
+                "state": state,
+                "background_sync": self._background_sync,
+                "latency_ms": round((time.perf_counter() - started) * 1000, 2),
+            },
+        )
+        return HookResult(action="continue")
+
+    async def _session_start_sync(self) -> None:
+        """Sync if stale, in the background unless configured to block."""
+        if not self._background_sync:
+            await self._store.sync()
+            return
+
+        # Readers join this sync via the store if they need it to finish
+        sync = self._store.start_sync()
+        task = asyncio.ensure_future(self._report_sync(sync, time.perf_counter()))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _report_sync(self, sync: asyncio.Future, started: float) -> None:
+        """Wait for a background sync and report how it went."""
+        try:
+            result = await sync
+        except Exception as e:
+            logger.warning("Background profile sync failed", exc_info=True)
+            result = {"success": False, "error": str(e)}
+
+        await self._emit(
+            "my-voice:sync",
+            {
+                "trigger": "session:start",
+                "success": result.get("success", False),
+                "error": result.get("error"),
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+            },
+        )
+
+    async def _emit(self, event: str, data: dict[str, Any]) -> None:
+        """Emit a reporting event - failures here must never break the session."""
+        if self._coordinator is None:
+            return
+        try:
+            await self._coordinator.hooks.emit(event, data)
+        except Exception:
+            logger.debug("Could not emit %s", event, exc_info=True)
+
+    @timed("hook.session_end")
+    async def handle_session_end(self, event: str, data: dict[str, Any]) -> HookResult:
+        """Handle session end - commit queued writes and try to push them.
 
-        # Ready state - normal sync
-        await self._store.sync(force=True)
-        self._last_check = time.time()
+        Pushes still failing after PUSH_DRAIN_TIMEOUT stay in the outbox and
+        go out with the next session.
+        """
+        if self._store.is_configured:
+            await self._store.flush()
+            await self._store.drain_outbox(PUSH_DRAIN_TIMEOUT)
         return HookResult(action="continue")
 
+    @timed("hook.prompt")
     async def handle_prompt(self, event: str, data: dict[str, Any]) -> HookResult:
         """Check staleness before each prompt."""
+        self._watch_metrics()
         if not self._store.is_configured:
             return HookResult(action="continue")
 
@@ -0,0 +1,345 @@
+"""Stylometric feature extraction for writing samples.
+
+Counts the patterns voice-analyst looks for (openers, phrases, abbreviations,
+punctuation and emphasis habits, sentence lengths) so the analysis can cite
+reproducible numbers instead of eyeballed impressions.
+"""
+
+import json
+import re
+import zlib
+from collections import Counter
+from typing import Iterable
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:['’/.][a-z0-9]+)*/?")
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+|\n+")
+
+# Punctuation habits, counted per 1k words
+PUNCTUATION_PATTERNS = {
+    "exclamation": re.compile(r"!"),
+    "question": re.compile(r"\?"),
+    "ellipsis": re.compile(r"\.\.\.|…"),
+    "dash": re.compile(r"—|–|\s--?\s"),
+    "semicolon": re.compile(r";"),
+    "colon": re.compile(r":(?!//)"),
+    "parenthetical": re.compile(r"\("),
+}
+
+# Emphasis habits, counted per 1k words
+EMPHASIS_PATTERNS = {
+    "all_caps": re.compile(r"\b[A-Z]{2,}\b"),
+    "bold": re.compile(r"\*\*[^*\n]+\*\*|__[^_\n]+__"),
+    "italic": re.compile(
+        r"(?<![*\w])\*[^*\n]+\*(?![*\w])|(?<![_\w])_[^_\n]+_(?![_\w])"
+    ),
+    "repeated_punctuation": re.compile(r"[!?]{2,}"),
+    "elongation": re.compile(r"\b\w*([a-z])\1{2,}\w*\b", re.IGNORECASE),
+    "emoji": re.compile(r"[\U0001F300-\U0001FAFF☀-➿]|:[a-z_]+:"),
+}
+
+# Shorthand worth calling out in a profile (matched case-insensitively)
+KNOWN_ABBREVIATIONS = frozenset(
+    {
+        "w/", "w/o", "b/c", "bc", "btw", "imo", "imho", "tbh", "fwiw", "afaik",
+        "iirc", "fyi", "lmk", "idk", "asap", "eod", "eow", "eta", "thx", "ty",
+        "pls", "plz", "np", "rn", "tldr", "e.g", "i.e", "etc", "vs", "ppl",
+        "msg", "convo", "prob", "def", "gonna", "wanna", "kinda", "sorta",
+        "ya", "yep", "nope", "lol", "omg", "ftw", "ooo", "wfh", "q's",
+    }
+)  # fmt: skip
+
+# Words too common to make a phrase characteristic on their own
+STOPWORDS = frozenset(
+    {
+        "a", "an", "the", "and", "or", "but", "if", "of", "to", "in", "on",
+        "at", "for", "with", "is", "are", "was", "were", "be", "it", "this",
+        "that", "i", "you", "we", "they", "he", "she", "my", "your", "our",
+        "me", "us", "so", "as", "by", "from", "not", "do", "have", "has",
+    }
+)  # fmt: skip
+
+# Confidence levels match the analyst's High/Medium-Confidence output sections
+HIGH_CONFIDENCE_MIN_SAMPLES = 3
+HIGH_CONFIDENCE_MIN_SHARE = 0.1  # ...and at least this share of all samples
+MEDIUM_CONFIDENCE_MIN_SAMPLES = 2
+
+SENTENCE_LENGTH_BUCKETS = [(1, 5), (6, 10), (11, 20), (21, 30), (31, None)]
+
+# Running counts persisted in the profile's samples/ directory (beside the
+# corpus, excluded from the repo): magic, version byte, then zlib-compressed
+# JSON. A file that can't be read is kept aside under the second name.
+FEATURES_FILE = "FEATURE_COUNTS.bin"
+UNREADABLE_FEATURES_FILE = "FEATURE_COUNTS.unreadable.bin"
+FEATURES_MAGIC = b"MVFC"
+FEATURES_VERSION = 1
+
+# Distinct phrases tracked before the rarest are dropped (down to 3/4 of the
+# limit, one-sample phrases first). A dropped phrase restarts from zero if it
+# shows up again, so counts for rare phrases can run low.
+PHRASE_LIMIT = 200_000
+
+# Counter attributes, in serialization order
+COUNTERS = (
+    "sentence_lengths",
+    "openers",
+    "bigrams",
+    "trigrams",
+    "abbreviations",
+    "punctuation",
+    "emphasis",
+    "opener_samples",
+    "phrase_samples",
+    "abbreviation_samples",
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased word tokens, keeping shorthand like w/, b/c and e.g intact."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text into sentences on terminal punctuation and line breaks."""
+    return [s.strip() for s in SENTENCE_SPLIT_PATTERN.split(text) if s.strip()]
+
+
+class FeatureCounts:
+    """Running feature counts over a set of writing samples.
+
+    Counts are additive, so new samples can be folded in with add() without
+    revisiting the ones already counted.
+    """
+
+    def __init__(self) -> None:
+        self.samples = 0
+        self.sentences = 0
+        self.words = 0
+        self.sentence_lengths: Counter[int] = Counter()
+        self.openers: Counter[str] = Counter()
+        self.bigrams: Counter[str] = Counter()
+        self.trigrams: Counter[str] = Counter()
+        self.abbreviations: Counter[str] = Counter()
+        self.punctuation: Counter[str] = Counter()
+        self.emphasis: Counter[str] = Counter()
+        # How many samples each pattern appeared in - drives confidence
+        self.opener_samples: Counter[str] = Counter()
+        self.phrase_samples: Counter[str] = Counter()
+        self.abbreviation_samples: Counter[str] = Counter()
+
+    def add(self, text: str) -> None:
+        """Count one writing sample."""
+        sentences = split_sentences(text)
+        if not sentences:
+            return
+        self.samples += 1
+        self.sentences += len(sentences)
+
+        openers = []
+        for sentence in sentences:
+            words = tokenize(sentence)
+            if words:
+                self.sentence_lengths[len(words)] += 1
+                openers.append(words[0])
+                if len(words) > 1:
+                    openers.append(f"{words[0]} {words[1]}")
+        self.openers.update(openers)
+        self.opener_samples.update(set(openers))
+
+        tokens = tokenize(text)
+        self.words += len(tokens)
+        bigrams = [" ".join(pair) for pair in zip(tokens, tokens[1:])]
+        trigrams = [" ".join(tri) for tri in zip(tokens, tokens[1:], tokens[2:])]
+        self.bigrams.update(bigrams)
+        self.trigrams.update(trigrams)
+        self.phrase_samples.update(set(bigrams) | set(trigrams))
+
+        abbreviations = [t for t in tokens if t in KNOWN_ABBREVIATIONS]
+        self.abbreviations.update(abbreviations)
+        self.abbreviation_samples.update(set(abbreviations))
+
+        for name, pattern in PUNCTUATION_PATTERNS.items():
+            self.punctuation[name] += len(pattern.findall(text))
+        for name, pattern in EMPHASIS_PATTERNS.items():
+            self.emphasis[name] += len(pattern.findall(text))
+
+        if len(self.phrase_samples) > PHRASE_LIMIT:
+            self._prune_phrases()
+
+    def _prune_phrases(self) -> None:
+        """Drop the rarest phrases to bound memory and file size."""
+        min_samples = 2
+        while len(self.phrase_samples) > PHRASE_LIMIT * 3 // 4:
+            rare = [p for p, n in self.phrase_samples.items() if n < min_samples]
+            for phrase in rare:
+                del self.phrase_samples[phrase]
+                self.bigrams.pop(phrase, None)
+                self.trigrams.pop(phrase, None)
+            min_samples += 1
+
+    def merge(self, other: "FeatureCounts") -> "FeatureCounts":
+        """Add another set of counts into this one; returns self."""
+        self.samples += other.samples
+        self.sentences += other.sentences
+        self.words += other.words
+        for name in COUNTERS:
+            getattr(self, name).update(getattr(other, name))
+        if len(self.phrase_samples) > PHRASE_LIMIT:
+            self._prune_phrases()
+        return self
+
+    def to_bytes(self) -> bytes:
+        """Compact binary form for the FEATURE_COUNTS.bin sidecar."""
+        data = {
+            "samples": self.samples,
+            "sentences": self.sentences,
+            "words": self.words,
+            **{name: dict(getattr(self, name)) for name in COUNTERS},
+        }
+        payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        return (
+            FEATURES_MAGIC
+            + bytes([FEATURES_VERSION])
+            + zlib.compress(payload.encode(), 6)
+        )
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "FeatureCounts":
+        """Load counts written by to_bytes."""
+        header = FEATURES_MAGIC + bytes([FEATURES_VERSION])
+        if not blob.startswith(header):
+            raise ValueError("Not a feature counts file, or from another version")
+        data = json.loads(zlib.decompress(blob[len(header) :]))
+        counts = cls()
+        counts.samples = data["samples"]
+        counts.sentences = data["sentences"]
+        counts.words = data["words"]
+        for name in COUNTERS:
+            getattr(counts, name).update(data.get(name) or {})
+        # JSON object keys are strings - sentence lengths are ints
+        counts.sentence_lengths = Counter(
+            {int(length): n for length, n in counts.sentence_lengths.items()}
+        )
+        return counts
+
+    def update(self, texts: Iterable[str]) -> "FeatureCounts":
+        """Count many samples; returns self for chaining."""
+        for text in texts:
+            self.add(text)
+        return self
+
+    def confidence(self, sample_count: int) -> str:
+        """Confidence label for a pattern seen in sample_count samples."""
+        if (
+            sample_count >= HIGH_CONFIDENCE_MIN_SAMPLES
+            and sample_count >= HIGH_CONFIDENCE_MIN_SHARE * self.samples
+        ):
+            return "high"
+        if sample_count >= MEDIUM_CONFIDENCE_MIN_SAMPLES:
+            return "medium"
+        return "low"
+
+    def _ranked(
+        self, counts: Counter[str], sample_counts: Counter[str], key: str, top_n: int
+    ) -> list[dict]:
+        """Top patterns by count, with the samples they appeared in."""
+        ranked = []
+        for value, count in counts.most_common():
+            in_samples = sample_counts[value]
+            confidence = self.confidence(in_samples)
+            if confidence == "low":
+                continue
+            ranked.append(
+                {
+                    key: value,
+                    "count": count,
+                    "samples": in_samples,
+                    "confidence": confidence,
+                }
+            )
+            if len(ranked) >= top_n:
+                break
+        return ranked
+
+    def _characteristic_phrases(self, top_n: int) -> list[dict]:
+        """Repeated bigrams/trigrams that aren't just stopwords."""
+        candidates: Counter[str] = Counter()
+        for counts in (self.trigrams, self.bigrams):
+            for phrase, count in counts.items():
+                if count < MEDIUM_CONFIDENCE_MIN_SAMPLES:
+                    continue
+                if all(word in STOPWORDS for word in phrase.split()):
+                    continue
+                candidates[phrase] = count
+        return self._ranked(candidates, self.phrase_samples, "phrase", top_n)
+
+    def sentence_length_stats(self) -> dict:
+        """Mean/median/p90 words per sentence plus a bucketed histogram."""
+        total = sum(self.sentence_lengths.values())
+        if not total:
+            return {"mean": None, "median": None, "p90": None, "histogram": {}}
+
+        def percentile(share: float) -> int:
+            # Straight from the length counts - no need to expand them
+            rank = share * (total - 1)
+            seen = 0
+            for length in sorted(self.sentence_lengths):
+                seen += self.sentence_lengths[length]
+                if seen > rank:
+                    return length
+            return max(self.sentence_lengths)
+
+        histogram = {}
+        for low, high in SENTENCE_LENGTH_BUCKETS:
+            label = f"{low}+" if high is None else f"{low}-{high}"
+            histogram[label] = sum(
+                count
+                for length, count in self.sentence_lengths.items()
+                if length >= low and (high is None or length <= high)
+            )
+        lengths = self.sentence_lengths.items()
+        weighted = sum(length * count for length, count in lengths)
+        return {
+            "mean": round(weighted / total, 1),
+            "median": percentile(0.5),
+            "p90": percentile(0.9),
+            "histogram": histogram,
+        }
+
+    def rates(self) -> dict:
+        """Punctuation and emphasis occurrences per 1k words."""
+        per_k = 1000 / self.words if self.words else 0
+        punctuation = self.punctuation.items()
+        emphasis = self.emphasis.items()
+        return {
+            "punctuation_per_1k_words": {
+                name: round(count * per_k, 2) for name, count in punctuation
+            },
+            "emphasis_per_1k_words": {
+                name: round(count * per_k, 2) for name, count in emphasis
+            },
+        }
+
+    def summary(self, top_n: int = 10) -> dict:
+        """Compact, citable summary of the counted features."""
+        return {
+            "samples": self.samples,
+            "sentences": self.sentences,
+            "words": self.words,
+            "sentence_length": self.sentence_length_stats(),
+            "openers": self._ranked(self.openers, self.opener_samples, "opener", top_n),
+            "phrases": self._characteristic_phrases(top_n),
+            "abbreviations": self._ranked(
+                self.abbreviations, self.abbreviation_samples, "abbreviation", top_n
+            ),
+            **self.rates(),
+            "confidence_rule": (
+                f"high: in >= {HIGH_CONFIDENCE_MIN_SAMPLES} samples and >= "
+                f"{HIGH_CONFIDENCE_MIN_SHARE:.0%} of samples; medium: in >= "
+                f"{MEDIUM_CONFIDENCE_MIN_SAMPLES} samples"
+            ),
+        }
+
+
+def extract_features(samples: Iterable[str], top_n: int = 10) -> dict:
+    """Count features over writing samples and summarize them."""
+    return FeatureCounts().update(samples).summary(top_n)
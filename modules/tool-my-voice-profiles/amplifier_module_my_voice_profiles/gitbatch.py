@@ -0,0 +1,166 @@
+"""Persistent git object reader - one `git cat-file --batch` per store.
+
+Resolving a ref or reading a file at a revision normally forks a git process
+per call. GitBatch keeps a single `git cat-file --batch` coprocess running
+and talks to it over its pipes instead: write an object name ("HEAD",
+"refs/remotes/origin/main", "HEAD~2:profiles/default/VOICE_PROFILE.md"),
+read back the object id, type and content. Requests are serialized on a lock,
+and the coprocess is restarted transparently if it exits.
+
+Refs are re-read per request and new packs are picked up on a miss, so the
+coprocess stays correct across pulls and commits made by other git commands.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from .metrics import Metrics
+
+# How a dead coprocess shows up mid-request
+DIED = (BrokenPipeError, ConnectionResetError, asyncio.IncompleteReadError)
+
+
+class GitBatchError(OSError):
+    """The cat-file coprocess couldn't be started or kept answering."""
+
+
+class GitObject(NamedTuple):
+    oid: str
+    type: str  # "commit", "tree", "blob" or "tag"
+    data: bytes
+
+
+class GitBatch:
+    """A `git cat-file --batch` coprocess for one repository."""
+
+    def __init__(self, cwd: Path, metrics: Optional[Metrics] = None):
+        self.cwd = cwd
+        self._metrics = metrics
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        # Stopped by close() but maybe not exited yet - see wait_closed()
+        self._closing: list[
+            tuple[asyncio.AbstractEventLoop, asyncio.subprocess.Process]
+        ] = []
+        self.starts = 0
+        self.requests = 0
+
+    @property
+    def running(self) -> bool:
+        return self._proc is not None and self._proc.returncode is None
+
+    async def _start(self) -> asyncio.subprocess.Process:
+        """Start the coprocess if it isn't running (or belongs to a closed loop)."""
+        loop = asyncio.get_running_loop()
+        if self.running and self._loop is loop:
+            return self._proc
+        self.close()
+        started = time.perf_counter()
+        try:
+            self._proc = await asyncio.create_subprocess_exec(
+                "git",
+                "cat-file",
+                "--batch",
+                cwd=self.cwd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except OSError as e:
+            raise GitBatchError(f"Could not start git cat-file: {e}") from e
+        finally:
+            if self._metrics is not None:
+                self._metrics.record(
+                    "git.cat-file", (time.perf_counter() - started) * 1000
+                )
+        self._loop = loop
+        self.starts += 1
+        return self._proc
+
+    async def _request(self, name: str) -> Optional[GitObject]:
+        """One request/response exchange - raises if the coprocess died."""
+        proc = await self._start()
+        assert proc.stdin is not None and proc.stdout is not None
+        proc.stdin.write(name.encode() + b"\n")
+        await proc.stdin.drain()
+
+        header = await proc.stdout.readline()
+        if not header.endswith(b"\n"):
+            raise ConnectionResetError("git cat-file exited")
+        text = header.decode().rstrip("\n")
+        if text.endswith((" missing", " ambiguous")):
+            return None
+        oid, kind, size = text.split()
+        # Content is followed by a newline the protocol adds
+        data = await proc.stdout.readexactly(int(size) + 1)
+        return GitObject(oid, kind, data[:-1])
+
+    async def read(self, name: str) -> Optional[GitObject]:
+        """Look up an object by any revision expression, None if it's missing.
+
+        Retries once on a fresh coprocess if the current one has died.
+        """
+        if "\n" in name or not name.strip():
+            return None
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+
+        started = time.perf_counter()
+        ok = False
+        try:
+            async with self._lock:
+                self.requests += 1
+                try:
+                    result = await self._request(name)
+                except asyncio.CancelledError:
+                    # The reply may be half read - don't let the next caller see it
+                    self.close()
+                    raise
+                except DIED:
+                    self.close()
+                    try:
+                        result = await self._request(name)
+                    except DIED as e:
+                        self.close()
+                        raise GitBatchError(f"git cat-file failed: {e!r}") from e
+                ok = True
+                return result
+        finally:
+            if self._metrics is not None:
+                self._metrics.record(
+                    "git.batch", (time.perf_counter() - started) * 1000, ok
+                )
+
+    async def resolve(self, name: str) -> Optional[str]:
+        """Object id a ref or revision expression points to, None if unknown."""
+        obj = await self.read(name)
+        return obj.oid if obj else None
+
+    def close(self) -> None:
+        """Stop the coprocess - closing stdin makes cat-file exit on its own."""
+        proc, self._proc = self._proc, None
+        if proc is None or proc.returncode is not None:
+            return
+        try:
+            if proc.stdin is not None:
+                proc.stdin.close()
+        except RuntimeError:
+            # Its event loop is already closed - the pipe went with it
+            return
+        self._closing = [(lp, p) for lp, p in self._closing if p.returncode is None]
+        self._closing.append((self._loop, proc))
+
+    async def wait_closed(self) -> None:
+        """Wait for coprocesses stopped by close() to exit.
+
+        Needed before the event loop closes, which can't reap them after.
+        """
+        loop = asyncio.get_running_loop()
+        closing, self._closing = self._closing, []
+        for proc_loop, proc in closing:
+            if proc_loop is loop:
+                await proc.wait()
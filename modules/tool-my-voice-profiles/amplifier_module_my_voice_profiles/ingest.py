@@ -0,0 +1,424 @@
+"""Streaming ingestion of writing-sample exports into a profile's corpus.
+
+Every reader is a generator over a local file, so exports with many thousands
+of messages are processed one message at a time. Only the user's own messages
+are kept; they are normalized to one JSON object per line in
+profiles/<name>/samples/corpus.jsonl.
+"""
+
+import email.utils
+import hashlib
+import html
+import json
+import mailbox
+import os
+import re
+from email.message import Message
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional, TextIO
+
+CORPUS_DIR = "samples"
+CORPUS_FILE = "corpus.jsonl"
+
+FORMATS = ("mbox", "slack", "teams", "text")
+
+# Read size for streamed JSON exports
+CHUNK_SIZE = 64 * 1024
+
+WHITESPACE_PATTERN = re.compile(r"\s*")
+TAG_PATTERN = re.compile(r"<[^>]+>")
+BREAK_PATTERN = re.compile(r"<br\s*/?>|</p>|</div>", re.IGNORECASE)
+BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+
+# Where quoted history starts in an email reply
+REPLY_HEADER_PATTERN = re.compile(
+    r"^(On .+wrote:|-{2,}\s*Original Message\s*-{2,}|From: .+)$", re.IGNORECASE
+)
+
+# Slack markup: <@U123>, <#C123|general>, <https://url|label>, <https://url>
+SLACK_LINK_PATTERN = re.compile(r"<([@#!]?)([^>|]+)(?:\|([^>]+))?>")
+
+# Slack message subtypes that aren't something the user wrote
+SLACK_SKIP_SUBTYPES = frozenset(
+    {"channel_join", "channel_leave", "bot_message", "channel_topic",
+     "channel_purpose", "channel_name", "pinned_item", "tombstone"}
+)  # fmt: skip
+
+
+def iter_json_array(
+    fp: TextIO, keys: tuple[str, ...] = (), chunk_size: int = CHUNK_SIZE
+) -> Iterator[Any]:
+    """Yield the elements of a JSON array without loading the whole document.
+
+    The array is either the top-level value or, when the document is an
+    object, the first array found under one of keys (e.g. Graph API's
+    "value"). Elements are decoded one at a time with raw_decode, so memory
+    stays bounded by the largest single element plus one chunk.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    eof = False
+
+    def read_more() -> bool:
+        nonlocal buffer, eof
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            eof = True
+        buffer += chunk
+        return bool(chunk)
+
+    # Find the opening bracket
+    while not buffer.strip() and read_more():
+        pass
+    stripped = buffer.lstrip()
+    if stripped.startswith("["):
+        pos = len(buffer) - len(stripped) + 1
+    elif stripped.startswith("{") and keys:
+        names = "|".join(re.escape(key) for key in keys)
+        start = re.compile(rf'"(?:{names})"\s*:\s*\[')
+        while True:
+            match = start.search(buffer)
+            if match:
+                pos = match.end()
+                break
+            if not read_more():
+                return
+            # Keep only enough of the buffer to match a key split across chunks
+            keep = max(len(key) for key in keys) + 64
+            buffer = buffer[-(chunk_size + keep) :]
+    else:
+        raise ValueError("Expected a JSON array of messages")
+
+    while True:
+        pos = WHITESPACE_PATTERN.match(buffer, pos).end()
+        if pos < len(buffer) and buffer[pos] == ",":
+            pos = WHITESPACE_PATTERN.match(buffer, pos + 1).end()
+        if pos >= len(buffer):
+            if not read_more():
+                raise ValueError("Unexpected end of JSON array")
+            continue
+        if buffer[pos] == "]":
+            return
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if not read_more():
+                raise
+            continue
+        if end == len(buffer) and not eof:
+            # A scalar may continue in the next chunk - decode it again
+            if read_more():
+                continue
+        yield value
+        pos = end
+        if pos > chunk_size:
+            buffer = buffer[pos:]
+            pos = 0
+
+
+def _author_keys(authors: list[str]) -> set[str]:
+    """Normalized author identities to match messages against."""
+    return {a.strip().lower() for a in authors if a and a.strip()}
+
+
+def _matches_author(values: Iterable[Optional[str]], wanted: set[str]) -> bool:
+    """Check whether any identity value (name, email, id) is a wanted author."""
+    return any(v and v.strip().lower() in wanted for v in values)
+
+
+def _html_to_text(markup: str) -> str:
+    """Plain text from a chat/email HTML body."""
+    text = BREAK_PATTERN.sub("\n", markup)
+    text = html.unescape(TAG_PATTERN.sub("", text))
+    return BLANK_LINES_PATTERN.sub("\n\n", text).strip()
+
+
+def _email_body(message: Message) -> str:
+    """Text the sender wrote, without quoted history or signature."""
+    body = None
+    fallback = None
+    for part in message.walk():
+        if part.is_multipart() or part.get_filename():
+            continue
+        content_type = part.get_content_type()
+        if content_type not in ("text/plain", "text/html"):
+            continue
+        payload = part.get_payload(decode=True) or b""
+        charset = part.get_content_charset() or "utf-8"
+        try:
+            text = payload.decode(charset, errors="replace")
+        except LookupError:
+            text = payload.decode("utf-8", errors="replace")
+        if content_type == "text/plain":
+            body = text
+            break
+        if fallback is None:
+            fallback = _html_to_text(text)
+    if body is None:
+        body = fallback or ""
+
+    lines = []
+    for line in body.replace("\r\n", "\n").split("\n"):
+        if line.rstrip() == "--" or REPLY_HEADER_PATTERN.match(line.strip()):
+            break  # Signature or quoted history from here on
+        if line.lstrip().startswith(">"):
+            continue
+        lines.append(line.rstrip())
+    return "\n".join(lines).strip()
+
+
+def iter_mbox(path: Path, authors: list[str]) -> Iterator[dict]:
+    """Messages sent by authors from an mbox file."""
+    wanted = _author_keys(authors)
+    box = mailbox.mbox(str(path), create=False)
+    try:
+        for message in box.itervalues():
+            senders = email.utils.getaddresses([message.get("From", "")])
+            identities = [v for sender in senders for v in sender]
+            if not _matches_author(identities, wanted):
+                continue
+            yield {
+                "text": _email_body(message),
+                "timestamp": message.get("Date"),
+                "subject": message.get("Subject"),
+            }
+    finally:
+        box.close()
+
+
+def _slack_text(text: str) -> str:
+    """Replace Slack link/mention markup with readable text."""
+
+    def replace(match: re.Match) -> str:
+        kind, target, label = match.groups()
+        if label:
+            return label if kind != "#" else f"#{label}"
+        return f"@{target}" if kind == "@" else target
+
+    return html.unescape(SLACK_LINK_PATTERN.sub(replace, text)).strip()
+
+
+def _slack_user_ids(users_path: Path, authors: list[str]) -> set[str]:
+    """User ids in a Slack export's users.json matching authors."""
+    ids: set[str] = set()
+    wanted = _author_keys(authors)
+    if not users_path.exists():
+        return ids
+    with users_path.open(encoding="utf-8") as fp:
+        for user in iter_json_array(fp):
+            profile = user.get("profile") or {}
+            identities = [
+                user.get("id"),
+                user.get("name"),
+                user.get("real_name"),
+                profile.get("display_name"),
+                profile.get("real_name"),
+                profile.get("email"),
+            ]
+            if _matches_author(identities, wanted):
+                ids.add(user["id"])
+    return ids
+
+
+def iter_slack(path: Path, authors: list[str]) -> Iterator[dict]:
+    """Messages by authors from a Slack export directory or message file.
+
+    A directory is a standard workspace export: users.json plus one folder
+    per channel holding a JSON array of messages per day.
+    """
+    wanted = _author_keys(authors)
+    if path.is_dir():
+        user_ids = _slack_user_ids(path / "users.json", authors)
+        files = sorted(
+            f for f in path.glob("*/*.json") if f.parent.name != "integration_logs"
+        )
+    else:
+        user_ids = set()
+        files = [path]
+
+    for file in files:
+        channel = file.parent.name if path.is_dir() else None
+        with file.open(encoding="utf-8") as fp:
+            for message in iter_json_array(fp, keys=("messages",)):
+                if not isinstance(message, dict) or message.get("type") != "message":
+                    continue
+                if message.get("subtype") in SLACK_SKIP_SUBTYPES:
+                    continue
+                profile = message.get("user_profile") or {}
+                user = message.get("user")
+                if user not in user_ids and not _matches_author(
+                    [
+                        user,
+                        profile.get("name"),
+                        profile.get("real_name"),
+                        profile.get("display_name"),
+                    ],
+                    wanted,
+                ):
+                    continue
+                yield {
+                    "text": _slack_text(message.get("text") or ""),
+                    "timestamp": message.get("ts"),
+                    "channel": channel,
+                }
+
+
+def iter_teams(path: Path, authors: list[str]) -> Iterator[dict]:
+    """Messages by authors from a Teams (Graph API chatMessage) JSON export.
+
+    Accepts a bare array of messages or a response object holding them
+    under "value" or "messages".
+    """
+    wanted = _author_keys(authors)
+    with path.open(encoding="utf-8") as fp:
+        for message in iter_json_array(fp, keys=("value", "messages")):
+            if not isinstance(message, dict):
+                continue
+            if message.get("messageType", "message") != "message":
+                continue
+            sender = (message.get("from") or {}).get("user") or {}
+            if not _matches_author(
+                [
+                    sender.get("id"),
+                    sender.get("displayName"),
+                    sender.get("userPrincipalName"),
+                ],
+                wanted,
+            ):
+                continue
+            body = message.get("body") or {}
+            text = body.get("content") or ""
+            if body.get("contentType", "html").lower() == "html":
+                text = _html_to_text(text)
+            channel = message.get("channelIdentity") or {}
+            yield {
+                "text": text,
+                "timestamp": message.get("createdDateTime"),
+                "channel": channel.get("channelId") or message.get("chatId"),
+            }
+
+
+def iter_text(path: Path) -> Iterator[dict]:
+    """Samples from a plain text dump, separated by blank lines.
+
+    The whole file is taken to be the user's own writing.
+    """
+    lines: list[str] = []
+    with path.open(encoding="utf-8", errors="replace") as fp:
+        for line in fp:
+            if line.strip():
+                lines.append(line.rstrip())
+            elif lines:
+                yield {"text": "\n".join(lines)}
+                lines = []
+    if lines:
+        yield {"text": "\n".join(lines)}
+
+
+def detect_format(path: Path) -> Optional[str]:
+    """Guess an export's format from its name, or its first message."""
+    if path.is_dir():
+        return "slack"
+    suffix = path.suffix.lower()
+    if suffix in (".mbox", ".mbx") or path.name == "mbox":
+        return "mbox"
+    if suffix in (".txt", ".md", ".text"):
+        return "text"
+    if suffix == ".json":
+        with path.open(encoding="utf-8") as fp:
+            for message in iter_json_array(fp, keys=("value", "messages")):
+                if isinstance(message, dict) and "ts" in message:
+                    return "slack"
+                if isinstance(message, dict) and "createdDateTime" in message:
+                    return "teams"
+                break
+    return None
+
+
+def iter_samples(path: Path, fmt: str, authors: list[str]) -> Iterator[dict]:
+    """Stream the user's samples from an export in the given format."""
+    if fmt == "mbox":
+        return iter_mbox(path, authors)
+    if fmt == "slack":
+        return iter_slack(path, authors)
+    if fmt == "teams":
+        return iter_teams(path, authors)
+    if fmt == "text":
+        return iter_text(path)
+    raise ValueError(f"Unknown format: {fmt}. Use one of: {', '.join(FORMATS)}")
+
+
+def _sample_key(text: str) -> bytes:
+    """Digest used to skip samples already in the corpus."""
+    return hashlib.sha1(" ".join(text.split()).lower().encode()).digest()
+
+
+def write_corpus(
+    samples: Iterable[dict],
+    corpus_path: Path,
+    fmt: str,
+    source: str,
+    replace: bool = False,
+    on_added: Optional[Callable[[str], None]] = None,
+) -> dict:
+    """Stream samples into a JSONL corpus, skipping empties and duplicates.
+
+    Existing entries are kept (unless replace) and copied through a temp
+    file that replaces the corpus atomically. Only sample digests are held
+    in memory. on_added is called with the text of each new sample.
+    """
+    corpus_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = corpus_path.with_name(f".{corpus_path.name}.{os.getpid()}.tmp")
+    seen: set[bytes] = set()
+    stats = {"read": 0, "added": 0, "duplicates": 0, "empty": 0, "total": 0}
+
+    try:
+        with tmp_path.open("w", encoding="utf-8") as out:
+            if not replace and corpus_path.exists():
+                with corpus_path.open(encoding="utf-8") as existing:
+                    for line in existing:
+                        try:
+                            seen.add(_sample_key(json.loads(line)["text"]))
+                        except (ValueError, KeyError, TypeError):
+                            continue
+                        out.write(line if line.endswith("\n") else line + "\n")
+                        stats["total"] += 1
+
+            for sample in samples:
+                stats["read"] += 1
+                text = (sample.get("text") or "").strip()
+                if not text:
+                    stats["empty"] += 1
+                    continue
+                key = _sample_key(text)
+                if key in seen:
+                    stats["duplicates"] += 1
+                    continue
+                seen.add(key)
+                record = {"text": text, "format": fmt, "source": source}
+                record.update(
+                    (k, v) for k, v in sample.items() if k != "text" and v is not None
+                )
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                if on_added is not None:
+                    on_added(text)
+                stats["added"] += 1
+                stats["total"] += 1
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    os.replace(tmp_path, corpus_path)
+    return stats
+
+
+def iter_corpus(corpus_path: Path) -> Iterator[str]:
+    """Sample texts from a corpus file, one at a time."""
+    if not corpus_path.exists():
+        return
+    with corpus_path.open(encoding="utf-8") as fp:
+        for line in fp:
+            try:
+                yield json.loads(line)["text"]
+            except (ValueError, KeyError, TypeError):
+                continue
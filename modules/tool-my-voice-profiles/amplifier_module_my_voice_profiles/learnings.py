@@ -0,0 +1,165 @@
+"""Learnings Log compaction - moves old entries into an archive file."""
+
+import datetime
+import re
+from typing import Optional
+
+from .sections import (
+    LEARNINGS_SECTION,
+    LEARNINGS_TABLE_HEADER,
+    find_sections,
+    first_table_rows,
+    parse_sections,
+)
+
+ARCHIVE_FILE = "LEARNINGS_ARCHIVE.md"
+SUMMARY_HEADING = "### Archived Summary"
+
+SEPARATOR_PATTERN = re.compile(r"^\|?[\s:|-]+\|?$")
+
+
+def _cells(line: str) -> list[str]:
+    """Split a markdown table row into cells (escaped pipes stay in a cell)."""
+    inner = line.strip().removeprefix("|").removesuffix("|")
+    return [c.strip().replace("\\|", "|") for c in re.split(r"(?<!\\)\|", inner)]
+
+
+def _entry_date(line: str) -> Optional[datetime.date]:
+    """Date of a Learnings Log row, if its first cell is an ISO date."""
+    try:
+        return datetime.date.fromisoformat(_cells(line)[0][:10])
+    except ValueError:
+        return None
+
+
+def _section_lines(content: str) -> Optional[tuple[int, int, list[str]]]:
+    """(start, end, lines) of the Learnings Log section, or None."""
+    found = find_sections(parse_sections(content), [LEARNINGS_SECTION])
+    if LEARNINGS_SECTION not in found:
+        return None
+    section = found[LEARNINGS_SECTION]
+    lines = content[section.start : section.end].splitlines(keepends=True)
+    return section.start, section.end, lines
+
+
+def _entry_indexes(lines: list[str]) -> list[int]:
+    """Indexes of real entries in the log table (not header/separator/placeholder)."""
+    rows = first_table_rows(lines)
+    entries = []
+    for i in rows[1:]:  # First row is the header
+        stripped = lines[i].strip()
+        if SEPARATOR_PATTERN.match(stripped):
+            continue
+        first_cell = _cells(stripped)[0]
+        if first_cell.startswith("[") and first_cell.endswith("]"):
+            continue  # Template placeholder
+        entries.append(i)
+    return entries
+
+
+def count_learnings(content: str) -> int:
+    """Number of entries currently in the Learnings Log table."""
+    parsed = _section_lines(content)
+    if parsed is None:
+        return 0
+    lines = parsed[2]
+    summary_at = _summary_range(lines)
+    if summary_at is not None:
+        lines = lines[: summary_at[0]] + lines[summary_at[1] :]
+    return len(_entry_indexes(lines))
+
+
+def _summary_range(lines: list[str]) -> Optional[tuple[int, int]]:
+    """Line range of the archived-summary subsection, if present."""
+    for start, line in enumerate(lines):
+        if line.strip() == SUMMARY_HEADING:
+            end = start + 1
+            while end < len(lines):
+                stripped = lines[end].strip()
+                if stripped == "---" or stripped.startswith("#"):
+                    break
+                end += 1
+            return start, end
+    return None
+
+
+def compact_learnings(
+    content: str,
+    archive: Optional[str],
+    keep: Optional[int] = None,
+    max_age_days: Optional[int] = None,
+    today: Optional[datetime.date] = None,
+    profile_name: str = "default",
+) -> tuple[str, str, int]:
+    """Move old Learnings Log entries to the archive.
+
+    An entry moves if it's older than max_age_days, or if it isn't among the
+    newest `keep` entries (rows are in chronological order). The profile
+    keeps a per-month summary of everything archived.
+
+    Returns (new content, new archive, number of entries moved).
+    """
+    parsed = _section_lines(content)
+    if parsed is None:
+        return content, archive or "", 0
+    start, end, lines = parsed
+
+    # Pull out the existing summary so it can be merged and re-appended
+    counts: dict[str, int] = {}
+    summary = _summary_range(lines)
+    if summary is not None:
+        for line in lines[summary[0] : summary[1]]:
+            cells = _cells(line) if line.lstrip().startswith("|") else []
+            if len(cells) >= 2 and cells[1].isdigit():
+                counts[cells[0]] = int(cells[1])
+        del lines[summary[0] : summary[1]]
+
+    entries = _entry_indexes(lines)
+    cutoff = None
+    if max_age_days is not None:
+        cutoff = (today or datetime.date.today()) - datetime.timedelta(max_age_days)
+    overflow = len(entries) - keep if keep is not None else 0
+
+    moved = []
+    for position, i in enumerate(entries):
+        date = _entry_date(lines[i])
+        too_old = cutoff is not None and date is not None and date < cutoff
+        if too_old or position < overflow:
+            moved.append(i)
+    if not moved:
+        return content, archive or "", 0
+
+    moved_rows = []
+    for i in moved:
+        row = lines[i] if lines[i].endswith("\n") else lines[i] + "\n"
+        moved_rows.append(row)
+        date = _entry_date(row)
+        period = date.strftime("%Y-%m") if date else "undated"
+        counts[period] = counts.get(period, 0) + 1
+    for i in reversed(moved):
+        del lines[i]
+
+    # Re-append the summary before the section's trailing divider
+    insert_at = len(lines)
+    while insert_at > 1 and lines[insert_at - 1].strip() in ("", "---"):
+        insert_at -= 1
+    summary_rows = "".join(
+        f"| {period} | {count} |\n" for period, count in sorted(counts.items())
+    )
+    lines.insert(
+        insert_at,
+        f"\n{SUMMARY_HEADING}\n\n"
+        f"Older entries live in `{ARCHIVE_FILE}` next to this profile.\n\n"
+        "| Period | Entries archived |\n|--------|------------------|\n"
+        f"{summary_rows}",
+    )
+    new_content = content[:start] + "".join(lines) + content[end:]
+
+    if not archive or not archive.strip():
+        archive = (
+            f"# Learnings Archive: {profile_name}\n\n"
+            "Entries moved out of VOICE_PROFILE.md by compaction, oldest first.\n\n"
+            f"{LEARNINGS_TABLE_HEADER}"
+        )
+    new_archive = archive.rstrip("\n") + "\n" + "".join(moved_rows)
+    return new_content, new_archive, len(moved)
@@ -0,0 +1,167 @@
+"""Anti-pattern linting - flags a profile's forbidden phrases in a draft.
+
+Rules come from the profile's "NEVER DO" list and the ❌ lines under
+"Anti-Patterns". Quoted phrases (and /regex/ rules) become literal patterns;
+all of them are compiled into one alternation, so checking a draft is a
+single regex scan. Rules written as prose are returned as unchecked so the
+model can still judge them.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .sections import Section, find_sections
+
+NEVER_DO_SECTION = "NEVER DO"
+ANTI_PATTERNS_SECTION = "Anti-Patterns"
+
+# Quoted phrases in a rule: "double", “curly”, `code` or 'single' quotes
+QUOTED_PATTERN = re.compile(
+    r'"([^"\n]{2,}?)"|“([^”\n]{2,}?)”|`([^`\n]{2,}?)`'
+    r"|(?<!\w)'([^'\n]{2,}?)'(?!\w)"
+)
+# An explicit regex rule: /pattern/ or /pattern/i
+REGEX_RULE_PATTERN = re.compile(r"(?<!\S)/(.+?)/(i?)(?!\S)")
+PLACEHOLDER_PATTERN = re.compile(r"^\[[^\]]*\]$")
+BULLET_PATTERN = re.compile(r"^[-*+]\s+(.*)$")
+ELLIPSIS_PATTERN = re.compile(r"\s*(?:\.\.\.|…)\s*")
+
+# Unquoted ❌ examples this short are matched literally; longer ones are prose
+MAX_LITERAL_WORDS = 8
+
+# "..." inside a quoted phrase stands for any short run of text
+GAP = r".{0,40}?"
+
+
+@dataclass
+class LintRule:
+    """One forbidden pattern and where in the profile it came from."""
+
+    pattern: str  # The phrase or regex as written in the profile
+    regex: str
+    section: str
+    rule: str  # The full bullet / ❌ line
+    fix: Optional[str] = None  # The ✅ line that follows an anti-pattern
+
+
+@dataclass
+class LintMatcher:
+    """Compiled rules of one profile version."""
+
+    rules: list[LintRule] = field(default_factory=list)
+    unchecked: list[str] = field(default_factory=list)
+    regex: Optional[re.Pattern] = None
+
+    def lint(self, text: str) -> list[dict]:
+        """Spans of text that hit a rule, in order."""
+        if self.regex is None:
+            return []
+        matches = []
+        for match in self.regex.finditer(text):
+            rule = self.rules[int(match.lastgroup[1:])]
+            hit = {
+                "start": match.start(),
+                "end": match.end(),
+                "text": match.group(),
+                "pattern": rule.pattern,
+                "section": rule.section,
+                "rule": rule.rule,
+            }
+            if rule.fix:
+                hit["fix"] = rule.fix
+            matches.append(hit)
+        return matches
+
+
+def _phrase_regex(phrase: str) -> str:
+    """Case-insensitive regex for a literal phrase, flexible on whitespace."""
+    parts = [p for p in ELLIPSIS_PATTERN.split(phrase.strip()) if p]
+    if not parts:
+        return re.escape(phrase.strip())  # The rule is about the ellipsis itself
+    words = [r"\s+".join(re.escape(w) for w in part.split()) for part in parts]
+    regex = GAP.join(words)
+    if re.match(r"\w", phrase.strip()):
+        regex = r"\b" + regex
+    if re.search(r"\w$", phrase.strip()):
+        regex += r"\b"
+    return regex
+
+
+def _rule_patterns(text: str, literal_fallback: bool) -> list[tuple[str, str]]:
+    """(pattern as written, regex) pairs found in one rule's text."""
+    patterns = []
+    for match in REGEX_RULE_PATTERN.finditer(text):
+        body, flags = match.groups()
+        try:
+            # Must also work as one group of the combined alternation
+            re.compile(f"(?P<r0>{body})|(?P<r1>x)")
+        except re.error:
+            continue
+        patterns.append((match.group(), f"(?i:{body})" if flags else body))
+    for match in QUOTED_PATTERN.finditer(text):
+        phrase = next(g for g in match.groups() if g)
+        patterns.append((phrase, f"(?i:{_phrase_regex(phrase)})"))
+    if not patterns and literal_fallback:
+        words = text.split()
+        if 0 < len(words) <= MAX_LITERAL_WORDS:
+            patterns.append((text, f"(?i:{_phrase_regex(text)})"))
+    return patterns
+
+
+def compile_lint_rules(content: str, sections: list[Section]) -> LintMatcher:
+    """Compile a profile's NEVER DO and Anti-Patterns rules into a matcher."""
+    matcher = LintMatcher()
+    found = find_sections(sections, [NEVER_DO_SECTION, ANTI_PATTERNS_SECTION])
+
+    never_do = found.get(NEVER_DO_SECTION)
+    if never_do is not None:
+        for line in content[never_do.start : never_do.end].splitlines()[1:]:
+            bullet = BULLET_PATTERN.match(line.strip())
+            if bullet is None:
+                continue
+            rule = bullet.group(1).strip()
+            if not rule or PLACEHOLDER_PATTERN.match(rule):
+                continue
+            _add_rules(matcher, rule, NEVER_DO_SECTION, literal_fallback=False)
+
+    anti_patterns = found.get(ANTI_PATTERNS_SECTION)
+    if anti_patterns is not None:
+        lines = content[anti_patterns.start : anti_patterns.end].splitlines()
+        for i, line in enumerate(lines):
+            stripped = line.strip()
+            if not stripped.startswith("❌"):
+                continue
+            rule = stripped.removeprefix("❌").strip()
+            if not rule or PLACEHOLDER_PATTERN.match(rule):
+                continue
+            fix = None
+            for following in lines[i + 1 : i + 3]:
+                if following.strip().startswith("✅"):
+                    fix = following.strip().removeprefix("✅").strip()
+                    break
+            _add_rules(
+                matcher, rule, ANTI_PATTERNS_SECTION, literal_fallback=True, fix=fix
+            )
+
+    if matcher.rules:
+        # One named group per rule - lastgroup says which rule matched
+        matcher.regex = re.compile(
+            "|".join(f"(?P<r{i}>{r.regex})" for i, r in enumerate(matcher.rules))
+        )
+    return matcher
+
+
+def _add_rules(
+    matcher: LintMatcher,
+    rule: str,
+    section: str,
+    literal_fallback: bool,
+    fix: Optional[str] = None,
+) -> None:
+    """Add a rule's patterns to matcher, or list it as unchecked if it has none."""
+    patterns = _rule_patterns(rule, literal_fallback)
+    if not patterns:
+        matcher.unchecked.append(rule)
+    for pattern, regex in patterns:
+        matcher.rules.append(LintRule(pattern, regex, section, rule, fix))
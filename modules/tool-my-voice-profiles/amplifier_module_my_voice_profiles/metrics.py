@@ -0,0 +1,188 @@
+"""Timing metrics - in-memory latency histograms for the store's hot paths.
+
+Spans wrap git subprocesses, syncs, reads, writes, saves and the sync hook's
+handlers. Each span name gets a fixed-bucket histogram (no samples are kept,
+so memory stays constant however long the process runs); percentiles are
+estimated from the buckets. Listeners see every finished span, which is how
+the hook forwards them as coordinator events.
+"""
+
+import bisect
+import functools
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Bucket upper bounds in milliseconds - roughly 2.5x apart, from a cache hit
+# to a clone over a slow link; slower spans land in the overflow bucket
+BUCKET_BOUNDS_MS = (
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    30000,
+)
+
+# Called with (span name, duration in ms, succeeded)
+SpanListener = Callable[[str, float, bool], None]
+
+T = TypeVar("T")
+
+
+class Histogram:
+    """Latency distribution of one span name."""
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms = 0.0
+
+    def record(self, duration_ms: float, ok: bool = True) -> None:
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        if not ok:
+            self.errors += 1
+        if self.min_ms is None or duration_ms < self.min_ms:
+            self.min_ms = duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def percentile(self, share: float) -> float:
+        """Estimated percentile - the upper bound of the bucket it falls in.
+
+        Clamped to the observed max so a single slow call doesn't report the
+        bucket ceiling.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, round(share * self.count))
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                bound = BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else None
+                return self.max_ms if bound is None else min(bound, self.max_ms)
+        return self.max_ms
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "min_ms": round(self.min_ms or 0.0, 2),
+            "p50_ms": round(self.percentile(0.5), 2),
+            "p90_ms": round(self.percentile(0.9), 2),
+            "p99_ms": round(self.percentile(0.99), 2),
+            "max_ms": round(self.max_ms, 2),
+            "total_ms": round(self.total_ms, 2),
+        }
+
+
+class Metrics:
+    """Histograms per span name, plus listeners notified of each span."""
+
+    def __init__(self) -> None:
+        self._histograms: dict[str, Histogram] = {}
+        self._listeners: list[SpanListener] = []
+        self._since = time.time()
+
+    def record(self, name: str, duration_ms: float, ok: bool = True) -> None:
+        """Add one finished span."""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = Histogram()
+        histogram.record(duration_ms, ok)
+        for listener in list(self._listeners):
+            try:
+                listener(name, duration_ms, ok)
+            except Exception:
+                # Reporting must never break the operation being timed
+                logger.debug("Span listener failed for %s", name, exc_info=True)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the block as one span; an exception counts as an error."""
+        started = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.record(name, (time.perf_counter() - started) * 1000, ok)
+
+    def add_listener(self, listener: SpanListener) -> Callable[[], None]:
+        """Call listener for every span from now on; returns an unsubscribe."""
+        self._listeners.append(listener)
+
+        def remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove
+
+    def snapshot(self, prefix: Optional[str] = None) -> dict:
+        """Histogram summaries by span name, slowest total first."""
+        spans = {
+            name: histogram.summary()
+            for name, histogram in self._histograms.items()
+            if prefix is None or name.startswith(prefix)
+        }
+        return {
+            "since": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self._since)),
+            "bucket_bounds_ms": list(BUCKET_BOUNDS_MS),
+            "spans": dict(
+                sorted(spans.items(), key=lambda kv: kv[1]["total_ms"], reverse=True)
+            ),
+        }
+
+    def reset(self, prefix: Optional[str] = None) -> None:
+        """Drop histograms, or just those under prefix (listeners stay)."""
+        if prefix is None:
+            self._histograms.clear()
+            self._since = time.time()
+            return
+        for name in [n for n in self._histograms if n.startswith(prefix)]:
+            del self._histograms[name]
+
+
+def timed(
+    name: str,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Time an async method as span `name` in its owner's `metrics`.
+
+    A raised exception or a {"success": False} result counts as an error.
+    """
+
+    def decorate(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(method)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
+            started = time.perf_counter()
+            ok = False
+            try:
+                result = await method(self, *args, **kwargs)
+                ok = not (isinstance(result, dict) and result.get("success") is False)
+                return result
+            finally:
+                self.metrics.record(name, (time.perf_counter() - started) * 1000, ok)
+
+        return wrapper
+
+    return decorate
@@ -0,0 +1,299 @@
+"""Store pool - serves many users' profiles from one process.
+
+Each tenant is a (user, profile_source) pair with its own ProfileStore,
+checked out under tenants_dir so users never share a clone, cache or sync
+state. At most max_tenants stores are resident at a time; the least recently
+used idle one is flushed and closed when another is needed, and comes back
+without re-cloning because its checkout stays on disk. Cached profile content
+across all resident stores is held under a byte budget.
+
+Tenants come from config.my-voice.users, or from the configure operation,
+which records them in tenants_dir/tenants.json instead of settings.yaml.
+
+Requests name a tenant but not where its files are: profile names can't
+leave the tenant's checkout (check_profile_name), ingest reads only from the
+user's own imports directory, and a user's profile_source must be remote.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from .metrics import Metrics
+from .store import ProfileStore, _write_atomic
+
+TENANTS_DIR = "~/.amplifier/my-voice/tenants"
+TENANTS_FILE = "tenants.json"
+
+# Per user, under tenants_dir - the only place ingest reads exports from
+IMPORTS_DIR = "imports"
+
+# Resident stores - each holds a cache and a git cat-file coprocess
+MAX_TENANTS = 16
+
+# Cached profiles per tenant, and across all tenants
+TENANT_CACHE_SIZE = 8
+MAX_CACHE_MB = 64
+
+# Pool settings that aren't passed down to tenant stores
+POOL_KEYS = {
+    "users",
+    "tenants_dir",
+    "max_tenants",
+    "tenant_cache_size",
+    "max_cache_mb",
+    "local_path",
+    "profile_source",
+    "watch",
+    # The host's identity - each user names themselves under users
+    "author",
+    "ingest_root",
+}
+
+
+def check_profile_name(name: str) -> None:
+    """Reject profile names that would reach outside the tenant's profiles/."""
+    if (
+        not isinstance(name, str)
+        or not name
+        or name == "."
+        or ".." in name
+        or any(sep in name for sep in ("/", "\\", "\0"))
+        or os.path.isabs(name)
+    ):
+        raise ValueError(f"Invalid profile name: {name!r}")
+
+
+def _check_source(source: str) -> None:
+    """A user's profile_source must be their own remote repo (or local).
+
+    A file:// or path source could clone another tenant's checkout.
+    """
+    url = source[4:] if source.startswith("git+") else source
+    if source != "local" and (
+        url.startswith(("file:", "/", ".", "~")) or ":" not in url
+    ):
+        raise ValueError(
+            f"profile_source for a user must be a remote git URL or local: {source}"
+        )
+
+
+def _slug(value: str) -> str:
+    """Filesystem-safe, collision-free directory name for a user or source."""
+    safe = re.sub(r"[^A-Za-z0-9._-]+", "_", value).strip("._")[:40]
+    return f"{safe or 'x'}-{hashlib.sha1(value.encode()).hexdigest()[:8]}"
+
+
+@dataclass
+class Tenant:
+    """One (user, profile_source) and its store, if resident."""
+
+    user: str
+    config: dict
+    metrics: Metrics = field(default_factory=Metrics)  # Survives eviction
+    store: Optional[ProfileStore] = None
+    # An evicted store still flushing - its checkout isn't free until it's done
+    retiring: Optional[asyncio.Future] = None
+    in_use: int = 0
+    loads: int = 0
+    evictions: int = 0
+
+
+class ProfileStorePool:
+    """ProfileStores per tenant with LRU eviction and a cache byte budget."""
+
+    def __init__(self, config: dict):
+        self._base = {k: v for k, v in config.items() if k not in POOL_KEYS}
+        self._users: dict[str, dict] = dict(config.get("users") or {})
+        self.tenants_dir = Path(
+            os.path.expanduser(config.get("tenants_dir") or TENANTS_DIR)
+        )
+        self._max_tenants = max(1, int(config.get("max_tenants", MAX_TENANTS)))
+        self._tenant_cache_size = int(
+            config.get("tenant_cache_size", TENANT_CACHE_SIZE)
+        )
+        self._max_cache_bytes = int(
+            float(config.get("max_cache_mb", MAX_CACHE_MB)) * 1024 * 1024
+        )
+
+        self._registry: Optional[dict[str, dict]] = None  # tenants.json
+        # Keyed by (user, profile_source), least recently used first
+        self._tenants: OrderedDict[tuple[str, str], Tenant] = OrderedDict()
+        # Per-user locks - creating and reconfiguring a user's store never
+        # overlap, and a new store waits out the tenant's retiring one, so two
+        # stores never share a checkout
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._tasks: set[asyncio.Future] = set()
+
+    def _load_registry(self) -> dict[str, dict]:
+        if self._registry is None:
+            try:
+                self._registry = json.loads(
+                    (self.tenants_dir / TENANTS_FILE).read_text()
+                )
+            except (OSError, ValueError):
+                self._registry = {}
+        return self._registry
+
+    def tenant_config(self, user: str) -> dict:
+        """Store config for a user - pool defaults plus the user's settings."""
+        overrides = {
+            **self._users.get(user, {}),
+            **self._load_registry().get(user, {}),
+        }
+        source = overrides.get("profile_source")
+        if not source:
+            raise ValueError(
+                f"Unknown user: {user}. Add them under my-voice.users or run configure with user"
+            )
+        config = {"cache_size": self._tenant_cache_size, **self._base, **overrides}
+        user_dir = self.tenants_dir / _slug(user)
+        config["local_path"] = str(user_dir / _slug(source))
+        config["ingest_root"] = str(user_dir / IMPORTS_DIR)
+        return config
+
+    def _lock(self, user: str) -> asyncio.Lock:
+        if user not in self._locks:
+            self._locks[user] = asyncio.Lock()
+        return self._locks[user]
+
+    @asynccontextmanager
+    async def use(self, user: str) -> AsyncIterator[ProfileStore]:
+        """The user's store, kept resident for the duration of the block."""
+        tenant = await self._acquire(user)
+        try:
+            yield tenant.store
+        finally:
+            tenant.in_use -= 1
+            self._trim_caches()
+
+    async def _acquire(self, user: str) -> Tenant:
+        config = self.tenant_config(user)
+        key = (user, config["profile_source"])
+        async with self._lock(user):
+            tenant = self._tenants.get(key)
+            if tenant is None:
+                tenant = self._tenants[key] = Tenant(user, config)
+            if tenant.store is None:
+                if tenant.retiring is not None:
+                    await asyncio.wait([tenant.retiring])
+                    tenant.retiring = None
+                tenant.store = ProfileStore(tenant.config, metrics=tenant.metrics)
+                tenant.loads += 1
+            tenant.in_use += 1
+            self._tenants.move_to_end(key)
+        self._evict_idle()
+        return tenant
+
+    def _resident(self) -> list[Tenant]:
+        """Tenants with a store in memory, least recently used first."""
+        return [t for t in self._tenants.values() if t.store is not None]
+
+    def _evict_idle(self) -> None:
+        """Retire least recently used idle stores beyond max_tenants."""
+        resident = self._resident()
+        excess = len(resident) - self._max_tenants
+        for tenant in resident:
+            if excess <= 0:
+                break
+            if tenant.in_use:
+                continue
+            tenant.evictions += 1
+            excess -= 1
+            self._retire_tenant(tenant)
+
+    def _retire_tenant(self, tenant: Tenant) -> asyncio.Future:
+        """Take a tenant's store out of service and retire it in the background."""
+        store, tenant.store = tenant.store, None
+        tenant.retiring = asyncio.ensure_future(self._retire(store))
+        self._track(tenant.retiring)
+        return tenant.retiring
+
+    async def _retire(self, store: ProfileStore) -> None:
+        """Push an evicted store's queued writes, then release it."""
+        try:
+            await store.flush()
+            await store.drain_outbox()
+        finally:
+            store.close()
+            await store.wait_closed()
+
+    def _track(self, task: asyncio.Future) -> None:
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _trim_caches(self) -> None:
+        """Drop idle tenants' cached profiles, oldest first, until under budget."""
+        resident = self._resident()
+        total = sum(t.store.cache_bytes for t in resident)
+        for tenant in resident:
+            if total <= self._max_cache_bytes:
+                break
+            if tenant.in_use:
+                continue
+            total -= tenant.store.cache_bytes
+            tenant.store.invalidate_cache()
+
+    async def configure(self, user: str, profile_source: str) -> None:
+        """Point a user at a profile source, recorded in tenants.json.
+
+        The store for the user's previous source is flushed and released.
+        """
+        _check_source(profile_source)
+        async with self._lock(user):
+            registry = self._load_registry()
+            registry[user] = {
+                **registry.get(user, {}),
+                "profile_source": profile_source,
+            }
+            await asyncio.to_thread(
+                _write_atomic,
+                self.tenants_dir / TENANTS_FILE,
+                json.dumps(registry, indent=2, sort_keys=True),
+            )
+        for (name, source), tenant in self._tenants.items():
+            if name == user and source != profile_source and tenant.store:
+                if tenant.in_use:
+                    continue  # Left for LRU eviction once the caller is done
+                self._retire_tenant(tenant)
+
+    async def close(self) -> None:
+        """Flush and release every resident store."""
+        for tenant in self._resident():
+            await self._retire_tenant(tenant)
+
+    def stats(self, user: Optional[str] = None) -> dict:
+        """Per-tenant residency, cache and sync figures."""
+        tenants = []
+        for (name, source), tenant in self._tenants.items():
+            if user is not None and name != user:
+                continue
+            spans = tenant.metrics.snapshot()["spans"]
+            info = {
+                "user": name,
+                "profile_source": source,
+                "resident": tenant.store is not None,
+                "in_use": tenant.in_use,
+                "loads": tenant.loads,
+                "evictions": tenant.evictions,
+                "syncs": spans.get("sync", {}).get("count", 0),
+                "sync_p90_ms": spans.get("sync", {}).get("p90_ms"),
+                "reads": spans.get("read", {}).get("count", 0),
+            }
+            if tenant.store is not None:
+                info["cache"] = tenant.store.cache_stats()
+            tenants.append(info)
+        return {
+            "resident": len(self._resident()),
+            "max_tenants": self._max_tenants,
+            "cache_bytes": sum(t.store.cache_bytes for t in self._resident()),
+            "max_cache_bytes": self._max_cache_bytes,
+            "tenants": tenants,
+        }
@@ -0,0 +1,185 @@
+"""Markdown section parsing for voice profiles."""
+
+import re
+from dataclasses import dataclass
+
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+FENCE_PATTERN = re.compile(r"^\s*(```|~~~)")
+
+LEARNINGS_SECTION = "Learnings Log"
+LEARNINGS_TABLE_HEADER = (
+    "| Date | Observation | Adjustment |\n|------|-------------|------------|\n"
+)
+
+
+@dataclass
+class Section:
+    """A heading and the span of content it covers.
+
+    start/end are character offsets into the profile; the span runs from the
+    heading line up to the next heading of the same or a higher level.
+    """
+
+    title: str
+    level: int
+    start: int
+    end: int
+
+
+def parse_sections(content: str) -> list[Section]:
+    """Parse markdown headings into sections, in document order.
+
+    Headings inside fenced code blocks are ignored.
+    """
+    headings: list[tuple[str, int, int]] = []
+    offset = 0
+    in_fence = False
+    for line in content.splitlines(keepends=True):
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        elif not in_fence:
+            match = HEADING_PATTERN.match(line.rstrip("\r\n"))
+            if match:
+                headings.append((match.group(2), len(match.group(1)), offset))
+        offset += len(line)
+
+    sections = []
+    for i, (title, level, start) in enumerate(headings):
+        end = len(content)
+        for _, next_level, next_start in headings[i + 1 :]:
+            if next_level <= level:
+                end = next_start
+                break
+        sections.append(Section(title=title, level=level, start=start, end=end))
+    return sections
+
+
+def find_sections(sections: list[Section], names: list[str]) -> dict[str, Section]:
+    """Match requested names to sections, case-insensitively.
+
+    A name matches a title exactly or as a prefix, so "Chat" finds
+    "Chat (Teams/Slack/Discord)". Exact matches win over prefix matches and
+    the first match in document order wins among equals.
+    """
+    found = {}
+    for name in names:
+        wanted = name.strip().lower()
+        exact = [s for s in sections if s.title.lower() == wanted]
+        prefix = [s for s in sections if s.title.lower().startswith(wanted)]
+        match = (exact or prefix or [None])[0]
+        if match is not None:
+            found[name] = match
+    return found
+
+
+def extract_sections(
+    content: str,
+    sections: list[Section],
+    names: list[str],
+    max_chars: int | None = None,
+) -> dict:
+    """Extract the requested sections, optionally within a character budget.
+
+    Sections are added whole, in the order requested, while they fit in
+    max_chars; the rest are reported as omitted. If not even the first
+    section fits it is truncated so the caller always gets something.
+    """
+    found = find_sections(sections, names)
+    missing = [name for name in names if name not in found]
+
+    # Drop sections nested inside another requested section
+    chosen: list[Section] = []
+    for section in found.values():
+        if section in chosen:
+            continue
+        if any(o.start <= section.start and section.end <= o.end for o in chosen):
+            continue
+        chosen = [
+            o for o in chosen if not (section.start <= o.start and o.end <= section.end)
+        ]
+        chosen.append(section)
+
+    parts: list[str] = []
+    included: list[str] = []
+    omitted: list[str] = []
+    truncated = False
+    used = 0
+    for section in chosen:
+        text = content[section.start : section.end].rstrip()
+        text = text.removesuffix("---").rstrip() + "\n"  # Drop trailing divider
+        cost = len(text) + (1 if parts else 0)  # Parts are joined by newlines
+        if max_chars is not None and used + cost > max_chars:
+            if not parts:
+                parts.append(text[:max_chars])
+                included.append(section.title)
+                truncated = True
+                used = max_chars
+            else:
+                omitted.append(section.title)
+            continue
+        parts.append(text)
+        included.append(section.title)
+        used += cost
+
+    return {
+        "content": "\n".join(parts),
+        "sections": included,
+        "missing": missing,
+        "omitted": omitted,
+        "truncated": truncated,
+    }
+
+
+def first_table_rows(lines: list[str]) -> list[int]:
+    """Indexes of the lines making up the first markdown table in lines."""
+    rows: list[int] = []
+    for i, line in enumerate(lines):
+        if line.lstrip().startswith("|"):
+            rows.append(i)
+        elif rows:
+            break
+    return rows
+
+
+def _table_cell(value: str) -> str:
+    """Make text safe for a single markdown table cell."""
+    return " ".join(value.split()).replace("|", "\\|")
+
+
+def append_table_row(
+    content: str,
+    section_name: str,
+    cells: list[str],
+    header: str = LEARNINGS_TABLE_HEADER,
+) -> str:
+    """Append a row to the first table in a section, creating what's missing.
+
+    A template placeholder row (first cell like "[DATE]") is replaced rather
+    than kept. If the section has no table, one is started with header; if
+    the section is missing, it's appended to the end of the document.
+    """
+    row = "| " + " | ".join(_table_cell(c) for c in cells) + " |\n"
+    found = find_sections(parse_sections(content), [section_name])
+    if section_name not in found:
+        body = content.rstrip() + "\n\n" if content.strip() else ""
+        return f"{body}## {section_name}\n\n{header}{row}"
+
+    section = found[section_name]
+    lines = content[section.start : section.end].splitlines(keepends=True)
+    table_rows = first_table_rows(lines)
+    if table_rows:
+        last = table_rows[-1]
+        if not lines[last].endswith("\n"):
+            lines[last] += "\n"
+        first_cell = lines[last].strip().strip("|").split("|")[0].strip()
+        if first_cell.startswith("[") and first_cell.endswith("]"):
+            lines[last] = row  # Template placeholder
+        else:
+            lines.insert(last + 1, row)
+    else:
+        # Insert before the trailing divider/blank lines of the section
+        insert_at = len(lines)
+        while insert_at > 1 and lines[insert_at - 1].strip() in ("", "---"):
+            insert_at -= 1
+        lines.insert(insert_at, f"\n{header}{row}")
+    return content[: section.start] + "".join(lines) + content[section.end :]
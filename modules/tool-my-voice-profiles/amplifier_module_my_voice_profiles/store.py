@@ -1,28 +1,269 @@
 """Profile storage management - handles git sync for voice profiles."""
 
 import asyncio
+import datetime
+import itertools
+import json
 import os
+import random
+import re
 import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, Optional
+
+from .features import FEATURES_FILE, UNREADABLE_FEATURES_FILE, FeatureCounts
+from .gitbatch import GitBatch, GitBatchError
+from .ingest import (
+    CORPUS_DIR,
+    CORPUS_FILE,
+    detect_format,
+    iter_corpus,
+    iter_samples,
+    write_corpus,
+)
+from .learnings import ARCHIVE_FILE, compact_learnings, count_learnings
+from .lint import compile_lint_rules
+from .metrics import Metrics, timed
+from .sections import (
+    LEARNINGS_SECTION,
+    Section,
+    append_table_row,
+    extract_sections,
+    parse_sections,
+)
+from .style import BASELINE_SAMPLES, STYLE_VECTOR_FILE, StyleVector
+from .watcher import POLL_INTERVAL, FileWatcher
 
 # Staleness threshold - pull if last sync was more than this many seconds ago
 STALENESS_THRESHOLD = 300  # 5 minutes
 
+# Maximum number of profiles kept in the in-memory read cache
+PROFILE_CACHE_SIZE = 32
+
+# Sync metadata shared by every process using the same local_path
+SYNC_STATE_FILE = "sync-state.json"
+
+# Index of profiles (size, mtime, hash, sections) used instead of directory scans
+MANIFEST_FILE = "manifest.json"
+
+# Quiet period before queued profile writes are committed and pushed together
+SAVE_DELAY = 10  # seconds
+
+# Amplifier settings - the configure operation writes config.my-voice here
+SETTINGS_FILE = "~/.amplifier/settings.yaml"
+
+# Local commits not pushed yet, kept under the metadata dir across restarts
+OUTBOX_FILE = "outbox.json"
+
+# Commit messages of writes waiting out save_delay, so a process that exits
+# before committing them leaves them for the next one
+PENDING_SAVES_FILE = "pending-saves.json"
+
+# Push retry backoff - doubles per failure up to the max, with +/-50% jitter
+PUSH_RETRY_BASE = 5  # seconds
+PUSH_RETRY_MAX = 600  # seconds
+
+# How long session end waits for queued pushes before leaving them queued
+PUSH_DRAIN_TIMEOUT = 10  # seconds
+
+# Push refused because the remote has commits we don't - rebase, then retry
+PUSH_REJECTED_PATTERN = re.compile(r"\[rejected\]|non-fast-forward|fetch first")
+
+# Files a profile directory can hold, by the names read_many accepts
+ARTIFACTS = {
+    "voice_profile": "VOICE_PROFILE.md",
+    "decoder_ring": "DECODER_RING.md",
+}
+
+# Learnings Log compaction - entries kept in the profile, and the entry count
+# at which append_learning compacts automatically
+LEARNINGS_KEEP = 20
+LEARNINGS_AUTO_COMPACT_AT = 50
+
+
+@dataclass
+class CachedProfile:
+    """A profile file held in the read cache, keyed by its file signature."""
+
+    signature: tuple[int, int]  # (mtime_ns, size) of the file
+    content: str
+    sections: Optional[list[Section]] = None  # Parsed on first section read
+    # Objects built from this content (style vector, ...), dropped with it
+    derived: dict[str, Any] = field(default_factory=dict)
+
+    def section_index(self) -> list[Section]:
+        """Headings of this profile, parsed once per cached version."""
+        if self.sections is None:
+            self.sections = parse_sections(self.content)
+        return self.sections
+
+
+def _write_atomic(path: Path, data: str | bytes) -> None:
+    """Write a file via rename so concurrent readers never see partial content."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    if isinstance(data, bytes):
+        tmp_path.write_bytes(data)
+    else:
+        tmp_path.write_text(data)
+    os.replace(tmp_path, path)
+
+
+def _dir_size(path: Path) -> int:
+    """Total size in bytes of all files under path."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def _resolve_local_path(config: dict) -> Path:
+    """Resolve the configured local_path (bundle config uses ~ paths)."""
+    local_path = config.get("local_path") or "~/.amplifier/my-voice/profiles"
+    return Path(os.path.expanduser(local_path))
+
 
 class ProfileStore:
     """Manages voice profile storage with git sync."""
 
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, metrics: Optional[Metrics] = None):
+        self._config = dict(config)
         self.profile_source = config.get("profile_source", "unconfigured")
-        self.local_path = Path(
-            config.get(
-                "local_path", os.path.expanduser("~/.amplifier/my-voice/profiles")
-            )
-        )
+        self.local_path = _resolve_local_path(config)
         self._last_sync: float = 0
+        self._last_sync_kind: Optional[str] = None  # "clone", "fetch" or "probe"
         self._initialized = False
 
+        # Probe the remote tip with ls-remote before pulling, skipping the pull
+        # when nothing changed. Upstream (remote, remote ref, tracking ref) is
+        # resolved once and persisted with the sync state, keyed by branch.
+        self._probe_remote = bool(config.get("probe_remote", True))
+        self._upstream: Optional[tuple[str, str, str]] = None
+        self._upstream_branch: Optional[str] = None
+        self._remote_tip: Optional[str] = None
+
+        # Last sync outcome, persisted under the metadata dir so new processes
+        # (and other sessions sharing local_path) don't treat the store as stale
+        self._last_sync_result: Optional[dict] = None
+        self._sync_state_mtime: Optional[int] = None
+        self._load_sync_state()
+
+        # Write-behind saves - auto-saved writes queue their commit message and
+        # are folded into one commit+push after save_delay seconds of quiet
+        # (0 saves inline on every write)
+        self._save_delay = float(config.get("save_delay", SAVE_DELAY))
+        self._pending_saves: list[str] = []
+        self._save_timer: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Future] = None
+        self._load_pending_saves()
+
+        # Offline-first pushes - save returns once the commit is local and the
+        # commit waits in a durable outbox; a background worker pushes it,
+        # backing off exponentially (with jitter) while the remote is
+        # unreachable. background_push: false pushes inline (still queued on
+        # failure).
+        self._background_push = bool(config.get("background_push", True))
+        self._outbox: list[dict] = []
+        self._push_attempts = 0
+        self._next_push: float = 0  # Wall clock time of the next attempt
+        self._last_push_error: Optional[str] = None
+        self._push_task: Optional[asyncio.Future] = None
+        self._push_wakeup: Optional[asyncio.Event] = None
+        self._load_outbox()
+
+        # Parsed `git status --porcelain=v2 --branch`, reused until a write,
+        # sync or save invalidates it
+        self._git_status_cache: Optional[dict] = None
+
+        # Clone strategy for new devices (config.my-voice.clone):
+        #   depth: N                 - shallow clone
+        #   filter: blob:none        - partial clone, blobs fetched on demand
+        #   sparse_profiles: [names] - sparse checkout of just these profiles
+        # Sparse checkouts widen automatically when another profile is used.
+        clone_config = config.get("clone") or {}
+        self._clone_depth = clone_config.get("depth")
+        self._clone_filter = clone_config.get("filter")
+        self._sparse_profiles: list[str] = list(
+            clone_config.get("sparse_profiles") or []
+        )
+        self._checked_out: Optional[set[str]] = None  # None = not known yet
+        self._last_clone: Optional[dict] = None
+
+        # Profile manifest - loaded from the metadata dir on first use, verified
+        # by a stat of profiles/ and of each profile file, and rescanned only
+        # when profiles/ changes or a pull touched the worktree
+        self._manifest: Optional[dict] = None
+        self._manifest_dirty = False
+        self._manifest_unsaved = False  # Changed since last written to disk
+
+        # Serializes read-modify-write edits (e.g. append_learning) per profile
+        self._profile_locks: dict[str, asyncio.Lock] = {}
+
+        # Learnings Log compaction (config.my-voice.learnings): keep, max_age_days,
+        # auto_compact_at (0 disables automatic compaction)
+        learnings_config = config.get("learnings") or {}
+        self._learnings_keep = learnings_config.get("keep", LEARNINGS_KEEP)
+        self._learnings_max_age = learnings_config.get("max_age_days")
+        self._learnings_auto_compact = learnings_config.get(
+            "auto_compact_at", LEARNINGS_AUTO_COMPACT_AT
+        )
+
+        # Who "me" is in sample exports (config.my-voice.author) - names,
+        # emails or chat user ids, matched case-insensitively
+        author = config.get("author") or []
+        self._authors: list[str] = [author] if isinstance(author, str) else list(author)
+
+        # Directory ingest may read exports from (set per user by the store
+        # pool) - paths are taken relative to it. None allows any path.
+        ingest_root = config.get("ingest_root")
+        self._ingest_root: Optional[Path] = (
+            Path(os.path.expanduser(ingest_root)).resolve() if ingest_root else None
+        )
+
+        # Optional file watching (config.my-voice.watch: true, or "poll" to
+        # skip inotify) - while it runs, cached files are served without a
+        # stat and dropped when they change on disk, and settings.yaml edits
+        # reload this store's configuration
+        self._watch = config.get("watch", False)
+        self._watch_poll_interval = float(
+            config.get("watch_poll_interval", POLL_INTERVAL)
+        )
+        self._watcher: Optional[FileWatcher] = None
+        self._settings_path = Path(os.path.expanduser(SETTINGS_FILE))
+        self._reload_task: Optional[asyncio.Future] = None
+
+        # LRU cache of profile content - entries are validated against the
+        # file's mtime/size on every read and dropped when a pull moves HEAD
+        self._cache_size = int(config.get("cache_size", PROFILE_CACHE_SIZE))
+        # Keyed by (profile name, file name)
+        self._profile_cache: OrderedDict[tuple[str, str], CachedProfile] = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+        # Single-flight sync - concurrent callers await one shared pull, and
+        # worktree-mutating git commands never overlap (avoids index.lock races)
+        self._sync_task: Optional[asyncio.Future] = None
+        self._sync_forced = False  # Whether the sync in flight pulls regardless
+        self._syncs_started = 0
+        self._syncs_coalesced = 0
+        self._git_lock = asyncio.Lock()
+
+        # Latency histograms for git calls, syncs, reads and writes (the sync
+        # hook records its handlers here too) - see the metrics operation.
+        # A store pool passes its tenant's metrics so they outlive the store.
+        self.metrics = metrics or Metrics()
+
+        # Long-lived `git cat-file --batch` for ref lookups and reads at a
+        # revision, so those don't fork a git process each
+        self._batch = GitBatch(self.local_path, self.metrics)
+
     @property
     def is_configured(self) -> bool:
         """Check if profile storage is configured."""
@@ -41,13 +282,81 @@ class ProfileStore:
         # git+https://github.com/user/repo -> https://github.com/user/repo
         return self.profile_source[4:]
 
+    @property
+    def meta_dir(self) -> Path:
+        """Directory for store metadata that must never be committed."""
+        if self.is_git_source:
+            return self.local_path / ".git" / "my-voice"
+        return self.local_path / ".my-voice"
+
     @property
     def is_stale(self) -> bool:
         """Check if local copy might be stale (needs pull)."""
         if not self.is_git_source:
             return False
+        if (time.time() - self._last_sync) <= STALENESS_THRESHOLD:
+            return False
+        # Another process sharing local_path may have synced since
+        self._load_sync_state()
         return (time.time() - self._last_sync) > STALENESS_THRESHOLD
 
+    def _load_sync_state(self) -> None:
+        """Pick up sync metadata persisted by this or another process."""
+        if not self.is_git_source:
+            return
+        path = self.meta_dir / SYNC_STATE_FILE
+        try:
+            mtime = path.stat().st_mtime_ns
+            if mtime == self._sync_state_mtime:
+                return
+            state = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return
+
+        self._sync_state_mtime = mtime
+        if state.get("last_sync", 0) > self._last_sync:
+            self._last_sync = state["last_sync"]
+            self._last_sync_kind = state.get("last_sync_kind")
+            self._remote_tip = state.get("remote_tip")
+            self._last_sync_result = state.get("last_result")
+        upstream = state.get("upstream")
+        if self._upstream is None and upstream and len(upstream["ref"]) == 3:
+            self._upstream_branch = upstream["branch"]
+            self._upstream = tuple(upstream["ref"])
+
+    def _save_sync_state(self) -> None:
+        """Persist sync metadata for other processes - best effort."""
+        if not (self.local_path / ".git").exists():
+            return
+        path = self.meta_dir / SYNC_STATE_FILE
+        state = {
+            "last_sync": self._last_sync,
+            "last_sync_kind": self._last_sync_kind,
+            "remote_tip": self._remote_tip,
+            "last_result": self._last_sync_result,
+        }
+        if self._upstream is not None:
+            state["upstream"] = {
+                "branch": self._upstream_branch,
+                "ref": list(self._upstream),
+            }
+        try:
+            _write_atomic(path, json.dumps(state, indent=2))
+            self._sync_state_mtime = path.stat().st_mtime_ns
+        except OSError:
+            pass
+
+    def _record_sync(self, kind: Optional[str], result: dict) -> dict:
+        """Record a sync outcome (kind=None for failures) and persist it."""
+        if result.get("success"):
+            self._last_sync = time.time()
+            self._last_sync_kind = kind
+        self._last_sync_result = {
+            key: result[key] for key in ("success", "message", "error") if key in result
+        }
+        self._save_sync_state()
+        return result
+
     @property
     def configuration_state(self) -> str:
         """Determine user's setup state for appropriate UX flow.
@@ -67,31 +376,210 @@ class ProfileStore:
                 return "configured_needs_clone"
 
         # Check if any profiles exist
-        profiles_dir = self.local_path / "profiles"
-        if profiles_dir.exists():
-            profiles = [
-                p
-                for p in profiles_dir.iterdir()
-                if p.is_dir() and (p / "VOICE_PROFILE.md").exists()
-            ]
-            if profiles:
-                return "ready"
+        manifest = self.profile_manifest()
+        if any(entry["size"] is not None for entry in manifest.values()):
+            return "ready"
 
         return "configured_no_profile"
 
+    def profile_manifest(self) -> dict[str, dict]:
+        """Index of profile directories, kept current without full scans.
+
+        Maps profile name to {size, mtime_ns}; size is None for directories
+        without a VOICE_PROFILE.md. The profiles/ mtime only shows directories
+        coming and going, so each VOICE_PROFILE.md is also stat'ed - a file
+        added, replaced or deleted inside an existing directory is picked up
+        without rescanning. Changes are kept in memory; status() and sync
+        persist them.
+        """
+        profiles_dir = self.local_path / "profiles"
+        try:
+            # Changes whenever a profile directory is added or removed
+            dir_mtime: Optional[int] = profiles_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            dir_mtime = None
+
+        if self._manifest is None:
+            self._manifest = self._load_manifest()
+        if self._manifest_dirty or self._manifest["profiles_mtime_ns"] != dir_mtime:
+            self._rebuild_manifest(profiles_dir, dir_mtime)
+        else:
+            self._refresh_manifest()
+        return self._manifest["profiles"]
+
+    def _refresh_manifest(self) -> None:
+        """Re-stat each profile file, updating entries whose file changed."""
+        profiles = self._manifest["profiles"]
+        for name, previous in profiles.items():
+            entry = self._manifest_entry(name)
+            if entry != previous:
+                profiles[name] = entry
+                self._manifest_unsaved = True
+
+    def _load_manifest(self) -> dict:
+        """Load the persisted manifest, or an empty one."""
+        try:
+            manifest = json.loads((self.meta_dir / MANIFEST_FILE).read_text())
+            if isinstance(manifest.get("profiles"), dict):
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {"profiles_mtime_ns": None, "profiles": {}}
+
+    def _rebuild_manifest(self, profiles_dir: Path, dir_mtime: Optional[int]) -> None:
+        """Rescan profiles/ - one stat per profile directory."""
+        profiles = {}
+        if dir_mtime is not None:
+            for entry in os.scandir(profiles_dir):
+                if entry.is_dir():
+                    profiles[entry.name] = self._manifest_entry(entry.name)
+        self._manifest = {"profiles_mtime_ns": dir_mtime, "profiles": profiles}
+        self._manifest_dirty = False
+        self._manifest_unsaved = True
+
+    def _manifest_entry(self, profile_name: str) -> dict:
+        """Build one manifest entry from a stat of the profile file."""
+        profile_path = self.local_path / "profiles" / profile_name / "VOICE_PROFILE.md"
+        try:
+            stat = profile_path.stat()
+        except FileNotFoundError:
+            return {"size": None, "mtime_ns": None}
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _update_manifest(self, profile_name: str) -> None:
+        """Refresh one profile's manifest entry after we wrote it."""
+        self.profile_manifest()[profile_name] = self._manifest_entry(profile_name)
+        self._manifest_unsaved = True
+        self._save_manifest()
+
+    def _save_manifest(self) -> None:
+        """Persist unsaved manifest changes - best effort, it can be rebuilt."""
+        if not self._manifest_unsaved or self._manifest["profiles_mtime_ns"] is None:
+            return
+        self._manifest_unsaved = False
+        try:
+            _write_atomic(self.meta_dir / MANIFEST_FILE, json.dumps(self._manifest))
+        except OSError:
+            pass
+
+    def _cache_get(
+        self, key: tuple[str, str], signature: tuple[int, int]
+    ) -> Optional[CachedProfile]:
+        """Return the cached file if its signature still matches."""
+        entry = self._profile_cache.get(key)
+        if entry is None or entry.signature != signature:
+            self._cache_misses += 1
+            return None
+        self._profile_cache.move_to_end(key)
+        self._cache_hits += 1
+        return entry
+
+    def _cache_put(
+        self, key: tuple[str, str], signature: tuple[int, int], content: str
+    ) -> CachedProfile:
+        """Store file content, evicting the least recently used entry."""
+        entry = CachedProfile(signature, content)
+        if self._cache_size <= 0:
+            return entry
+        self._profile_cache[key] = entry
+        self._profile_cache.move_to_end(key)
+        while len(self._profile_cache) > self._cache_size:
+            self._profile_cache.popitem(last=False)
+        return entry
+
+    @property
+    def cache_bytes(self) -> int:
+        """Approximate memory held by cached file content."""
+        return sum(len(entry.content) for entry in self._profile_cache.values())
+
+    def cache_stats(self) -> dict:
+        return {
+            "entries": len(self._profile_cache),
+            "max_entries": self._cache_size,
+            "bytes": self.cache_bytes,
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+        }
+
+    def invalidate_cache(self, profile_name: Optional[str] = None) -> None:
+        """Drop one profile's cached files, or everything."""
+        if profile_name is None:
+            self._profile_cache.clear()
+        else:
+            for key in [k for k in self._profile_cache if k[0] == profile_name]:
+                del self._profile_cache[key]
+
     async def _run_git(
         self, *args: str, cwd: Optional[Path] = None
     ) -> tuple[int, str, str]:
-        """Run a git command."""
-        proc = await asyncio.create_subprocess_exec(
-            "git",
-            *args,
-            cwd=cwd or self.local_path,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await proc.communicate()
-        return proc.returncode or 0, stdout.decode(), stderr.decode()
+        """Run a git command, timed as a git.<subcommand> span."""
+        started = time.perf_counter()
+        code = -1
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "git",
+                *args,
+                cwd=cwd or self.local_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, stderr = await proc.communicate()
+            code = proc.returncode or 0
+            return code, stdout.decode(), stderr.decode()
+        finally:
+            self.metrics.record(
+                f"git.{args[0]}", (time.perf_counter() - started) * 1000, code == 0
+            )
+
+    async def _rev_parse(self, *revisions: str) -> Optional[list[str]]:
+        """Object ids of revisions via the batch reader, None if any is unknown.
+
+        Falls back to `git rev-parse` if the batch reader can't be used.
+        """
+        try:
+            oids = [await self._batch.resolve(rev) for rev in revisions]
+        except GitBatchError:
+            code, stdout, _ = await self._run_git("rev-parse", *revisions)
+            oids = stdout.split() if code == 0 else [None]
+        return None if None in oids else oids
+
+    async def _git_status(self, refresh: bool = False) -> dict:
+        """Branch, HEAD, ahead/behind and dirty state from a single git call."""
+        if self._git_status_cache is not None and not refresh:
+            return self._git_status_cache
+
+        code, stdout, _ = await self._run_git("status", "--porcelain=v2", "--branch")
+        status: dict = {
+            "branch": None,
+            "head": None,
+            "upstream": None,
+            "ahead": None,
+            "behind": None,
+            "has_changes": None,
+        }
+        if code != 0:
+            return status
+
+        has_changes = False
+        for line in stdout.splitlines():
+            if not line.startswith("# "):
+                has_changes = True  # Changed, unmerged or untracked entry
+                continue
+            key, _, value = line[2:].partition(" ")
+            if key == "branch.oid":
+                status["head"] = None if value == "(initial)" else value
+            elif key == "branch.head":
+                status["branch"] = None if value == "(detached)" else value
+            elif key == "branch.upstream":
+                status["upstream"] = value
+            elif key == "branch.ab":
+                ahead, behind = value.split()
+                status["ahead"] = int(ahead)
+                status["behind"] = -int(behind)
+        status["has_changes"] = has_changes
+
+        self._git_status_cache = status
+        return status
 
     async def ensure_initialized(self) -> dict:
         """Ensure profile storage is initialized. Clone if needed."""
@@ -107,8 +595,10 @@ class ProfileStore:
         if self.is_git_source:
             git_dir = self.local_path / ".git"
             if not git_dir.exists():
-                # Clone the repo
-                return await self._clone()
+                async with self._git_lock:
+                    # Re-check - another caller may have cloned while we waited
+                    if not git_dir.exists():
+                        return await self._clone()
 
         self._initialized = True
         return {"success": True, "message": "Profile storage ready"}
@@ -129,50 +619,355 @@ class ProfileStore:
 
             shutil.rmtree(self.local_path)
 
+        args = ["clone"]
+        if self._clone_depth:
+            args += ["--depth", str(int(self._clone_depth))]
+        if self._clone_filter:
+            args.append(f"--filter={self._clone_filter}")
+        if self._sparse_profiles:
+            args.append("--sparse")
+
+        started = time.perf_counter()
         code, stdout, stderr = await self._run_git(
-            "clone", url, str(self.local_path), cwd=parent
+            *args, url, str(self.local_path), cwd=parent
         )
 
+        self._git_status_cache = None
         if code != 0:
             return {"success": False, "error": f"Clone failed: {stderr}"}
 
-        self._last_sync = time.time()
+        if self._sparse_profiles:
+            dirs = [f"profiles/{name}" for name in self._sparse_profiles]
+            code, _, stderr = await self._run_git("sparse-checkout", "set", *dirs)
+            if code != 0:
+                return {"success": False, "error": f"Sparse checkout failed: {stderr}"}
+            self._checked_out = set(self._sparse_profiles)
+
+        self._last_clone = {
+            "seconds": round(time.perf_counter() - started, 3),
+            "size_bytes": _dir_size(self.local_path),
+            "depth": self._clone_depth,
+            "filter": self._clone_filter,
+            "sparse_profiles": self._sparse_profiles or None,
+        }
         self._initialized = True
-        return {"success": True, "message": f"Cloned profile repo to {self.local_path}"}
+        return self._record_sync(
+            "clone",
+            {
+                "success": True,
+                "message": f"Cloned profile repo to {self.local_path}",
+                "cloned": True,
+                "clone": self._last_clone,
+            },
+        )
+
+    async def _ensure_checked_out(self, profile_name: str) -> bool:
+        """Widen a sparse checkout to include a profile.
+
+        Returns True if the checkout changed. Full checkouts are a no-op.
+        """
+        if not self.is_git_source or not (self.local_path / ".git").exists():
+            return False
+        if self._checked_out is None:
+            code, stdout, _ = await self._run_git("sparse-checkout", "list")
+            if code != 0:
+                self._checked_out = set()  # Not a sparse checkout
+                self._sparse_profiles = []
+                return False
+            self._checked_out = {
+                line.split("/", 1)[1]
+                for line in stdout.splitlines()
+                if line.startswith("profiles/")
+            }
+            self._sparse_profiles = sorted(self._checked_out) or ["default"]
+        if not self._sparse_profiles or profile_name in self._checked_out:
+            return False
+
+        async with self._git_lock:
+            code, _, _ = await self._run_git(
+                "sparse-checkout", "add", f"profiles/{profile_name}"
+            )
+        if code != 0:
+            return False
+        self._checked_out.add(profile_name)
+        self._git_status_cache = None
+        return True
+
+    @property
+    def sync_in_flight(self) -> bool:
+        """Check if a sync is currently running."""
+        return self._sync_task is not None and not self._sync_task.done()
+
+    def start_sync(self, force: bool = False) -> asyncio.Future:
+        """Start a sync without waiting for it, returning the shared future.
+
+        Joins the sync already in flight if there is one - unless this one is
+        forced and that one isn't, since it may have skipped the pull as not
+        stale. The forced sync then runs once the current one finishes.
+        """
+        if self.sync_in_flight and (self._sync_forced or not force):
+            self._syncs_coalesced += 1
+        else:
+            self._syncs_started += 1
+            if self.sync_in_flight:
+                sync = self._sync_after(self._sync_task)
+            else:
+                sync = self._sync(force)
+            self._sync_task = asyncio.ensure_future(sync)
+            self._sync_task.add_done_callback(lambda _: self._save_manifest())
+            self._sync_forced = force
+            # Commits left unpushed by an earlier session go out now too
+            self._start_push()
+        return self._sync_task
+
+    async def _sync_after(self, pending: asyncio.Future) -> dict:
+        """Forced sync queued behind an unforced one still in flight."""
+        await asyncio.wait([pending])  # Its outcome belongs to its own callers
+        return await self._sync(True)
 
     async def sync(self, force: bool = False) -> dict:
-        """Pull latest from remote if git source and stale (or forced)."""
+        """Pull latest from remote if git source and stale (or forced).
+
+        Concurrent callers are coalesced onto the sync already in flight and
+        share its result instead of starting a second pull.
+        """
+        # Shield so a cancelled caller doesn't abort the pull for everyone else
+        return await asyncio.shield(self.start_sync(force))
+
+    @timed("sync")
+    async def _sync(self, force: bool) -> dict:
+        """Run a single sync - see sync()."""
         init_result = await self.ensure_initialized()
-        if not init_result["success"]:
+        if not init_result["success"] or init_result.get("cloned"):
+            # A fresh clone is as synced as it gets
             return init_result
 
         if not self.is_git_source:
             return {"success": True, "message": "Local storage - no sync needed"}
 
+        if self._pending_saves and self._save_timer is None:
+            # Left by a process that exited before its quiet period ended
+            await self._commit_pending()
+
         if not force and not self.is_stale:
             return {"success": True, "message": "Already up to date (not stale)"}
 
+        if self._probe_remote and await self._remote_unchanged():
+            return self._record_sync(
+                "probe",
+                {"success": True, "message": "Already up to date (remote unchanged)"},
+            )
+
+        # Writes waiting out save_delay leave tracked files dirty, which a
+        # rebase won't run over - commit them now (the push follows the pull).
+        # --autostash covers edits made outside the store.
+        if self._pending_saves:
+            await self._commit_pending()
+
         # Pull latest
-        code, stdout, stderr = await self._run_git("pull", "--rebase")
+        async with self._git_lock:
+            code, stdout, stderr = await self._run_git(
+                "pull", "--rebase", "--autostash"
+            )
+            git_dir = self.local_path / ".git"
+            if code != 0 and any(
+                (git_dir / name).exists() for name in ("rebase-merge", "rebase-apply")
+            ):
+                # Don't leave the checkout mid-rebase - local commits stay
+                # queued and the next sync tries again
+                await self._run_git("rebase", "--abort")
+        self._git_status_cache = None
 
         if code != 0:
             # Try to handle conflicts gracefully
             if "conflict" in stderr.lower():
-                return {
-                    "success": False,
-                    "error": f"Merge conflict - manual resolution needed: {stderr}",
-                }
-            return {"success": False, "error": f"Pull failed: {stderr}"}
+                return self._record_sync(
+                    None,
+                    {
+                        "success": False,
+                        "error": f"Merge conflict - manual resolution needed: {stderr}",
+                    },
+                )
+            return self._record_sync(
+                None, {"success": False, "error": f"Pull failed: {stderr}"}
+            )
 
-        self._last_sync = time.time()
-        return {
-            "success": True,
-            "message": "Synced with remote",
-            "output": stdout.strip(),
-        }
+        if "up to date" not in stdout.lower():
+            # HEAD moved - cached content may no longer match the worktree
+            self.invalidate_cache()
+            self._manifest_dirty = True
+        return self._record_sync(
+            "fetch",
+            {
+                "success": True,
+                "message": "Synced with remote",
+                "output": stdout.strip(),
+            },
+        )
+
+    async def _resolve_upstream(self) -> Optional[tuple[str, str, str]]:
+        """Resolve (remote, remote ref, tracking ref) for the current branch.
+
+        The branch comes from .git/HEAD directly; the upstream is looked up
+        once per branch and remembered in the sync state.
+        """
+        try:
+            head = (self.local_path / ".git" / "HEAD").read_text().strip()
+            branch = head[5:] if head.startswith("ref: ") else None
+        except OSError:
+            code, stdout, _ = await self._run_git("symbolic-ref", "-q", "HEAD")
+            branch = stdout.strip() if code == 0 else None
+        if branch is None:
+            return None  # Detached HEAD
 
+        if self._upstream is None or self._upstream_branch != branch:
+            code, stdout, _ = await self._run_git(
+                "for-each-ref",
+                "--format=%(upstream:remotename) %(upstream:remoteref) %(upstream)",
+                branch,
+            )
+            parts = stdout.split()
+            if code != 0 or len(parts) != 3:
+                return None  # No upstream configured
+            self._upstream = (parts[0], parts[1], parts[2])
+            self._upstream_branch = branch
+        return self._upstream
+
+    async def _remote_unchanged(self) -> bool:
+        """Cheaply check whether a pull would be a no-op.
+
+        Compares the remote branch tip (ls-remote, no object transfer) with
+        local HEAD and with the tracking ref from our last fetch. Any probe
+        failure returns False so the caller falls back to a real pull.
+        """
+        upstream = await self._resolve_upstream()
+        if upstream is None:
+            return False
+        remote, remote_ref, tracking_ref = upstream
+
+        code, stdout, _ = await self._run_git("ls-remote", remote, remote_ref)
+        if code != 0 or not stdout.strip():
+            return False
+        self._remote_tip = stdout.split()[0]
+
+        oids = await self._rev_parse("HEAD", tracking_ref)
+        if oids is None:
+            return False
+        head, tracked = oids
+
+        if self._remote_tip == head:
+            return True
+        if self._remote_tip == tracked:
+            # Remote hasn't moved since our last fetch - HEAD is only different
+            # if it has local commits on top, which a pull wouldn't change
+            code, _, _ = await self._run_git(
+                "merge-base", "--is-ancestor", tracked, "HEAD"
+            )
+            return code == 0
+        return False
+
+    def _schedule_save(self, message: str) -> None:
+        """Queue a commit message and restart the quiet-period timer."""
+        if message not in self._pending_saves:
+            self._pending_saves.append(message)
+            self._save_pending_saves()
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = asyncio.get_running_loop().call_later(
+            self._save_delay, self._flush_in_background
+        )
+
+    def _flush_in_background(self) -> None:
+        """Timer callback - flush queued writes without blocking anyone."""
+        self._save_timer = None
+        self._flush_task = asyncio.ensure_future(self.flush())
+        # Retrieve the outcome so a failed flush isn't reported as unhandled
+        self._flush_task.add_done_callback(
+            lambda task: task.cancelled() or task.exception()
+        )
+
+    async def flush(self) -> dict:
+        """Commit and push queued writes now instead of after the quiet period."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+
+        count = len(self._pending_saves)
+        if not count:
+            if self._flush_task is not None and not self._flush_task.done():
+                # A timed flush is already running - let the caller see it land
+                return await asyncio.shield(self._flush_task)
+            if not self._outbox:
+                return {"success": True, "message": "No pending writes", "outbox": 0}
+            # Nothing left to commit, but earlier commits haven't reached the
+            # remote - retry them now, as an explicit save would
+
+        result = await self.save(
+            self._pending_message() if count else "Update voice profile"
+        )
+        result["writes_flushed"] = count
+        result.setdefault("outbox", len(self._outbox))
+        return result
+
+    def _pending_message(self) -> str:
+        """One commit message covering every queued write."""
+        messages = self._pending_saves
+        if len(messages) == 1:
+            return messages[0]
+        summary = "\n".join(f"- {m}" for m in messages)
+        return f"Update voice profiles\n\n{summary}"
+
+    async def _commit_pending(self) -> dict:
+        """Commit queued writes ahead of a pull, leaving the push to the worker."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+        message = self._pending_message()
+        self._pending_saves = []
+        self._save_pending_saves()
+        async with self._git_lock:
+            try:
+                result = await self._commit(message)
+            finally:
+                self._git_status_cache = None
+        self._start_push()
+        return result
+
+    def _load_pending_saves(self) -> None:
+        """Pick up writes an earlier process queued but never committed."""
+        if not self.is_git_source:
+            return
+        try:
+            messages = json.loads((self.meta_dir / PENDING_SAVES_FILE).read_text())
+        except (OSError, ValueError):
+            return
+        if isinstance(messages, list):
+            self._pending_saves = [m for m in messages if isinstance(m, str)]
+
+    def _save_pending_saves(self) -> None:
+        """Persist queued write messages (removed once empty) - best effort."""
+        if not self.is_git_source:
+            return
+        path = self.meta_dir / PENDING_SAVES_FILE
+        try:
+            if not self._pending_saves:
+                path.unlink(missing_ok=True)
+                return
+            _write_atomic(path, json.dumps(self._pending_saves))
+        except OSError:
+            pass
+
+    @timed("save")
     async def save(self, message: str = "Update voice profile") -> dict:
         """Commit and push changes if git source."""
+        # This commit picks up everything queued for write-behind as well
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+        if self._pending_saves:
+            self._pending_saves = []
+            self._save_pending_saves()
+
         if not self._initialized:
             init_result = await self.ensure_initialized()
             if not init_result["success"]:
@@ -181,9 +976,40 @@ class ProfileStore:
         if not self.is_git_source:
             return {"success": True, "message": "Local storage - changes saved locally"}
 
-        # Check for changes
-        code, stdout, _ = await self._run_git("status", "--porcelain")
-        if not stdout.strip():
+        async with self._git_lock:
+            try:
+                result = await self._commit(message)
+            finally:
+                self._git_status_cache = None
+        if not result["success"] or (not result.get("commit") and not self._outbox):
+            return result
+
+        # An explicit save retries a backed-off push straight away
+        self._next_push = 0
+        if self._background_push:
+            self._start_push()
+            if result.get("commit"):
+                result["message"] = f"Saved: {message} (push queued)"
+            result["outbox"] = len(self._outbox)
+            return result
+
+        push_result = await self._push_once()
+        if not push_result["success"]:
+            self._start_push()  # Keep retrying in the background
+            return {**push_result, "commit": result.get("commit"), "queued": True}
+        if result.get("commit"):
+            result["message"] = f"Saved and pushed: {message}"
+        return result
+
+    async def _commit(self, message: str) -> dict:
+        """Commit all changes and queue them for push - caller holds the git lock."""
+        # Check for changes - a cached "dirty" is trusted (commit copes if it's
+        # wrong), a cached "clean" is re-checked in case of edits outside the store
+        was_cached = self._git_status_cache is not None
+        git_status = await self._git_status()
+        if not git_status["has_changes"] and was_cached:
+            git_status = await self._git_status(refresh=True)
+        if not git_status["has_changes"]:
             return {"success": True, "message": "No changes to save"}
 
         # Add all changes
@@ -192,7 +1018,7 @@ class ProfileStore:
             return {"success": False, "error": f"Add failed: {stderr}"}
 
         # Commit
-        code, _, stderr = await self._run_git(
+        code, stdout, stderr = await self._run_git(
             "commit",
             "-m",
             message,
@@ -202,37 +1028,339 @@ class ProfileStore:
             "Co-Authored-By: Amplifier <240397093+microsoft-amplifier@users.noreply.github.com>",
         )
         if code != 0:
+            if "nothing to commit" in stdout:
+                return {"success": True, "message": "No changes to save"}
             return {"success": False, "error": f"Commit failed: {stderr}"}
 
-        # Push
-        code, _, stderr = await self._run_git("push")
-        if code != 0:
-            return {"success": False, "error": f"Push failed: {stderr}"}
+        oids = await self._rev_parse("HEAD")
+        commit = oids[0] if oids else None
+        self._outbox.append(
+            {
+                "commit": commit,
+                "message": message.splitlines()[0],
+                "queued_at": time.time(),
+            }
+        )
+        self._save_outbox()
+        return {"success": True, "message": f"Saved: {message}", "commit": commit}
+
+    def _load_outbox(self) -> None:
+        """Pick up commits an earlier process queued but never pushed."""
+        if not self.is_git_source:
+            return
+        try:
+            state = json.loads((self.meta_dir / OUTBOX_FILE).read_text())
+        except (OSError, ValueError):
+            return
+        self._outbox = list(state.get("commits") or [])
+        self._push_attempts = state.get("attempts", 0)
+        self._next_push = state.get("next_attempt", 0)
+        self._last_push_error = state.get("last_error")
+
+    def _save_outbox(self) -> None:
+        """Persist the outbox (removed once empty) - best effort."""
+        path = self.meta_dir / OUTBOX_FILE
+        try:
+            if not self._outbox:
+                path.unlink(missing_ok=True)
+                return
+            state = {
+                "commits": self._outbox,
+                "attempts": self._push_attempts,
+                "next_attempt": self._next_push,
+                "last_error": self._last_push_error,
+            }
+            _write_atomic(path, json.dumps(state, indent=2))
+        except OSError:
+            pass
+
+    def _start_push(self) -> Optional[asyncio.Future]:
+        """Run the push worker in the background if anything is queued."""
+        if not self._outbox:
+            return None
+        if self._push_wakeup is None:
+            self._push_wakeup = asyncio.Event()
+        if self._push_task is None or self._push_task.done():
+            self._push_task = asyncio.ensure_future(self._push_worker())
+            # Retrieve the outcome so a failed worker isn't reported as unhandled
+            self._push_task.add_done_callback(
+                lambda task: task.cancelled() or task.exception()
+            )
+        else:
+            self._push_wakeup.set()  # Re-check _next_push if it's backing off
+        return self._push_task
+
+    async def _push_worker(self) -> None:
+        """Push until the outbox is empty, waiting out the backoff in between."""
+        while self._outbox:
+            delay = self._next_push - time.time()
+            if delay > 0:
+                self._push_wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._push_wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._push_once()
+
+    async def _push_once(self) -> dict:
+        """One push attempt; a failure schedules the next with backoff and jitter."""
+        async with self._git_lock:
+            queued = len(self._outbox)  # Commits made so far - all in this push
+            code, _, stderr = await self._run_git("push")
+        if code != 0 and PUSH_REJECTED_PATTERN.search(stderr):
+            # The remote moved on - rebase onto it (a normal sync) and retry
+            sync_result = await self.sync(force=True)
+            if sync_result["success"]:
+                async with self._git_lock:
+                    queued = len(self._outbox)
+                    code, _, stderr = await self._run_git("push")
+            else:
+                stderr = sync_result.get("error") or stderr
+        self._git_status_cache = None
+
+        if code == 0:
+            del self._outbox[:queued]
+            self._push_attempts = 0
+            self._next_push = 0
+            self._last_push_error = None
+            self._save_outbox()
+            # Local and remote now match, which counts as a sync
+            self._last_sync = time.time()
+            self._save_sync_state()
+            return {"success": True, "pushed": queued}
+
+        self._push_attempts += 1
+        backoff = min(PUSH_RETRY_MAX, PUSH_RETRY_BASE * 2 ** (self._push_attempts - 1))
+        self._next_push = time.time() + backoff * random.uniform(0.5, 1.5)
+        self._last_push_error = stderr.strip()
+        self._save_outbox()
+        return {"success": False, "error": f"Push failed: {stderr}"}
+
+    async def drain_outbox(self, timeout: float = PUSH_DRAIN_TIMEOUT) -> dict:
+        """Push queued commits now, waiting up to timeout (e.g. at session end)."""
+        if not self._outbox:
+            return {"success": True, "outbox": 0}
+        self._next_push = 0
+        task = self._start_push()
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return {
+            "success": not self._outbox,
+            "outbox": len(self._outbox),
+            "error": self._last_push_error,
+        }
+
+    @timed("read")
+    async def read_profile(
+        self,
+        profile_name: str = "default",
+        sections: Optional[list[str]] = None,
+        max_chars: Optional[int] = None,
+        revision: Optional[str] = None,
+    ) -> dict:
+        """Read a voice profile, syncing first if stale.
 
-        self._last_sync = time.time()
-        return {"success": True, "message": f"Saved and pushed: {message}"}
+        With sections, only those sections are returned (matched by title or
+        title prefix, e.g. "Chat"), fitted into max_chars if given. With a
+        revision (e.g. "HEAD~3", "origin/main"), the profile as committed
+        there is read instead of the working copy.
+        """
+        profile_path = self.local_path / "profiles" / profile_name / "VOICE_PROFILE.md"
+        await self._sync_before_read([profile_path])
+        return await self._read_file(
+            profile_name, "VOICE_PROFILE.md", sections, max_chars, revision
+        )
+
+    @timed("read_many")
+    async def read_many(self, items: list[dict]) -> dict:
+        """Read several profiles/artifacts in one call.
+
+        Each item is {"profile": name, "artifact": "voice_profile" |
+        "decoder_ring", "sections": [...], "max_chars": n, "revision": rev};
+        all but profile are optional. One staleness check covers the whole batch and the
+        files are read concurrently. Results come back in request order.
+        """
+        requests = []
+        for item in items:
+            profile_name = item.get("profile", "default")
+            artifact = item.get("artifact", "voice_profile")
+            requests.append((profile_name, artifact, item))
+
+        paths = [
+            self.local_path / "profiles" / name / ARTIFACTS[artifact]
+            for name, artifact, _ in requests
+            if artifact in ARTIFACTS
+        ]
+        await self._sync_before_read(paths)
 
-    async def read_profile(self, profile_name: str = "default") -> dict:
-        """Read a voice profile, syncing first if stale."""
-        # Sync if stale
-        if self.is_stale:
+        async def read_one(profile_name: str, artifact: str, item: dict) -> dict:
+            if artifact not in ARTIFACTS:
+                return {
+                    "profile": profile_name,
+                    "artifact": artifact,
+                    "success": False,
+                    "error": f"Unknown artifact: {artifact}. Use one of: {', '.join(ARTIFACTS)}",
+                }
+            result = await self._read_file(
+                profile_name,
+                ARTIFACTS[artifact],
+                item.get("sections"),
+                item.get("max_chars"),
+                item.get("revision"),
+            )
+            return {"profile": profile_name, "artifact": artifact, **result}
+
+        results = await asyncio.gather(*(read_one(*r) for r in requests))
+        return {
+            "success": all(r["success"] for r in results),
+            "results": list(results),
+        }
+
+    async def _sync_before_read(self, paths: list[Path]) -> None:
+        """Bring the local copy up to date before a read, if it's worth waiting."""
+        if self.sync_in_flight:
+            # Background sync running - serve the local copy if we have one,
+            # only block when this is a fresh clone that hasn't landed yet
+            if not all(path.exists() for path in paths):
+                await self.sync()
+        elif self.is_stale:
             sync_result = await self.sync()
             if not sync_result["success"]:
                 # Log warning but continue with local copy
                 pass
 
-        profile_path = self.local_path / "profiles" / profile_name / "VOICE_PROFILE.md"
+    async def _read_file(
+        self,
+        profile_name: str,
+        filename: str,
+        sections: Optional[list[str]] = None,
+        max_chars: Optional[int] = None,
+        revision: Optional[str] = None,
+    ) -> dict:
+        """Read one file from a profile directory through the cache.
 
-        if not profile_path.exists():
+        With a revision the file is read from that commit instead.
+        """
+        profile_path = self.local_path / "profiles" / profile_name / filename
+        if revision is not None:
+            result = await self._read_file_at(profile_name, filename, revision)
+            if not result["success"]:
+                return {**result, "path": str(profile_path)}
+            profile = result["profile"]
+        else:
+            profile = await self._cached_file(profile_name, filename)
+        if profile is None:
+            if filename != "VOICE_PROFILE.md":
+                return {
+                    "success": False,
+                    "error": f"{filename} not found for profile {profile_name}",
+                    "path": str(profile_path),
+                }
             return {
                 "success": False,
                 "error": f"Profile not found: {profile_name}. Run voice-analyst to create one.",
                 "path": str(profile_path),
             }
 
-        content = profile_path.read_text()
-        return {"success": True, "content": content, "path": str(profile_path)}
+        if sections is None:
+            content = profile.content
+            if max_chars is not None and len(content) > max_chars:
+                return {
+                    "success": True,
+                    "content": content[:max_chars],
+                    "truncated": True,
+                    "path": str(profile_path),
+                }
+            return {"success": True, "content": content, "path": str(profile_path)}
 
+        index = profile.section_index()
+        result = extract_sections(profile.content, index, sections, max_chars)
+        if not result["sections"]:
+            return {
+                "success": False,
+                "error": f"No matching sections in {profile_name}: {', '.join(sections)}",
+                "available": [s.title for s in index if s.level == 2],
+                "path": str(profile_path),
+            }
+        return {"success": True, **result, "path": str(profile_path)}
+
+    async def _read_file_at(
+        self, profile_name: str, filename: str, revision: str
+    ) -> dict:
+        """A profile file as committed at revision, via the batch reader.
+
+        Blobs are immutable, so the parsed file is cached by blob id.
+        """
+        if not self.is_git_source or not (self.local_path / ".git").exists():
+            return {
+                "success": False,
+                "error": "Reading at a revision needs git profile storage",
+            }
+        if not revision.strip() or any(c in revision for c in ":\n\r\0"):
+            # The path is appended after a colon - anything past one would
+            # re-point the lookup, and a path outside the tree kills cat-file
+            return {"success": False, "error": f"Invalid revision: {revision!r}"}
+        path = f"profiles/{profile_name}/{filename}"
+        try:
+            blob = await self._batch.read(f"{revision}:{path}")
+        except GitBatchError as e:
+            return {"success": False, "error": str(e)}
+        if blob is None or blob.type != "blob":
+            return {
+                "success": False,
+                "error": f"{filename} not found for profile {profile_name} at {revision}",
+            }
+        key = (profile_name, f"{filename}@{blob.oid}")
+        signature = (0, len(blob.data))
+        profile = self._cache_get(key, signature) or self._cache_put(
+            key, signature, blob.data.decode()
+        )
+        return {"success": True, "profile": profile}
+
+    async def _cached_file(
+        self, profile_name: str, filename: str
+    ) -> Optional[CachedProfile]:
+        """A file from a profile directory through the cache, None if missing."""
+        key = (profile_name, filename)
+        if self.start_watching():
+            # The watcher drops entries that change on disk - no stat needed
+            entry = self._profile_cache.get(key)
+            if entry is not None:
+                self._profile_cache.move_to_end(key)
+                self._cache_hits += 1
+                return entry
+
+        profile_path = self.local_path / "profiles" / profile_name / filename
+        if not profile_path.exists():
+            # Sparse clone - the profile may exist upstream but not be checked out
+            await self._ensure_checked_out(profile_name)
+
+        try:
+            stat = profile_path.stat()
+        except FileNotFoundError:
+            self._profile_cache.pop(key, None)
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        profile = self._cache_get(key, signature)
+        if profile is None:
+            content = await asyncio.to_thread(profile_path.read_text)
+            profile = self._cache_put(key, signature, content)
+        return profile
+
+    async def read_section(
+        self,
+        section: str,
+        profile_name: str = "default",
+        max_chars: Optional[int] = None,
+        revision: Optional[str] = None,
+    ) -> dict:
+        """Read a single section of a voice profile."""
+        return await self.read_profile(profile_name, [section], max_chars, revision)
+
+    @timed("write")
     async def write_profile(
         self, content: str, profile_name: str = "default", auto_save: bool = True
     ) -> dict:
@@ -241,24 +1369,687 @@ class ProfileStore:
         if not init_result["success"]:
             return init_result
 
-        profile_dir = self.local_path / "profiles" / profile_name
-        profile_dir.mkdir(parents=True, exist_ok=True)
-
-        profile_path = profile_dir / "VOICE_PROFILE.md"
-        profile_path.write_text(content)
+        # Sparse clones must include the profile or git won't commit it
+        await self._ensure_checked_out(profile_name)
 
+        profile_path = self._write_profile_file(profile_name, content)
         result = {
             "success": True,
             "message": f"Wrote profile to {profile_path}",
             "path": str(profile_path),
         }
 
-        if auto_save and self.is_git_source:
-            save_result = await self.save(f"Update {profile_name} voice profile")
-            result["save_result"] = save_result
+        if auto_save:
+            await self._auto_save(f"Update {profile_name} voice profile", result)
+
+        return result
+
+    def _write_profile_file(self, profile_name: str, content: str) -> Path:
+        """Atomically write VOICE_PROFILE.md and update cache and manifest."""
+        profile_path = self.local_path / "profiles" / profile_name / "VOICE_PROFILE.md"
+        _write_atomic(profile_path, content)
+        self._git_status_cache = None
+
+        # Write-through so the next read is served from memory
+        stat = profile_path.stat()
+        self._cache_put(
+            (profile_name, "VOICE_PROFILE.md"),
+            (stat.st_mtime_ns, stat.st_size),
+            content,
+        )
+        self._update_manifest(profile_name)
+        return profile_path
+
+    async def _auto_save(self, message: str, result: dict) -> None:
+        """Commit+push after a write - queued unless save_delay is 0."""
+        if not self.is_git_source:
+            return
+        if self._save_delay > 0:
+            # Return once the file is on disk - commit+push happens later
+            self._schedule_save(message)
+            result["save_pending"] = True
+        else:
+            result["save_result"] = await self.save(message)
+
+    @timed("append_learning")
+    async def append_learning(
+        self,
+        observation: str,
+        adjustment: str,
+        profile_name: str = "default",
+        date: Optional[str] = None,
+        auto_save: bool = True,
+    ) -> dict:
+        """Append one entry to a profile's Learnings Log.
+
+        Only the new row travels through the caller; the file is edited on
+        disk and replaced atomically, so the commit is a one-line diff.
+        """
+        init_result = await self.ensure_initialized()
+        if not init_result["success"]:
+            return init_result
+        await self._ensure_checked_out(profile_name)
+
+        profile_path = self.local_path / "profiles" / profile_name / "VOICE_PROFILE.md"
+        lock = self._profile_locks.setdefault(profile_name, asyncio.Lock())
+        async with lock:
+            try:
+                content = profile_path.read_text()
+            except FileNotFoundError:
+                return {
+                    "success": False,
+                    "error": f"Profile not found: {profile_name}. Run voice-analyst to create one.",
+                    "path": str(profile_path),
+                }
+
+            entry_date = date or datetime.date.today().isoformat()
+            content = append_table_row(
+                content, LEARNINGS_SECTION, [entry_date, observation, adjustment]
+            )
+            compacted = 0
+            if (
+                self._learnings_auto_compact
+                and count_learnings(content) > self._learnings_auto_compact
+            ):
+                content, compacted = self._compact_content(
+                    profile_name,
+                    content,
+                    self._learnings_keep,
+                    self._learnings_max_age,
+                )
+            self._write_profile_file(profile_name, content)
+
+        result = {
+            "success": True,
+            "message": f"Added learning to {profile_name} profile",
+            "entry": {
+                "date": entry_date,
+                "observation": observation,
+                "adjustment": adjustment,
+            },
+            "path": str(profile_path),
+        }
+        if compacted:
+            result["compacted"] = compacted
+        if auto_save:
+            await self._auto_save(
+                f"Add learning to {profile_name} voice profile", result
+            )
+        return result
+
+    async def compact_learnings(
+        self,
+        profile_name: str = "default",
+        keep: Optional[int] = None,
+        max_age_days: Optional[int] = None,
+        auto_save: bool = True,
+    ) -> dict:
+        """Move old Learnings Log entries into the profile's archive file.
 
+        Entries beyond the newest `keep`, or older than max_age_days, move to
+        LEARNINGS_ARCHIVE.md; the profile keeps a per-month summary table.
+        Unset limits fall back to the learnings config.
+        """
+        init_result = await self.ensure_initialized()
+        if not init_result["success"]:
+            return init_result
+        await self._ensure_checked_out(profile_name)
+
+        if keep is None:
+            keep = self._learnings_keep
+        if max_age_days is None:
+            max_age_days = self._learnings_max_age
+
+        profile_dir = self.local_path / "profiles" / profile_name
+        lock = self._profile_locks.setdefault(profile_name, asyncio.Lock())
+        async with lock:
+            try:
+                content = (profile_dir / "VOICE_PROFILE.md").read_text()
+            except FileNotFoundError:
+                return {
+                    "success": False,
+                    "error": f"Profile not found: {profile_name}. Run voice-analyst to create one.",
+                }
+            content, moved = self._compact_content(
+                profile_name, content, keep, max_age_days
+            )
+            if moved:
+                self._write_profile_file(profile_name, content)
+
+        result = {
+            "success": True,
+            "message": f"Archived {moved} learnings from {profile_name} profile",
+            "moved": moved,
+            "remaining": count_learnings(content),
+            "archive_path": str(profile_dir / ARCHIVE_FILE),
+        }
+        if moved and auto_save:
+            await self._auto_save(f"Compact {profile_name} learnings log", result)
+        return result
+
+    def _compact_content(
+        self,
+        profile_name: str,
+        content: str,
+        keep: Optional[int],
+        max_age_days: Optional[int],
+    ) -> tuple[str, int]:
+        """Archive old learnings from content; returns (new content, moved).
+
+        Writes the archive file; the caller writes the profile.
+        """
+        archive_path = self.local_path / "profiles" / profile_name / ARCHIVE_FILE
+        try:
+            archive: Optional[str] = archive_path.read_text()
+        except FileNotFoundError:
+            archive = None
+        content, archive, moved = compact_learnings(
+            content, archive, keep, max_age_days, profile_name=profile_name
+        )
+        if moved:
+            _write_atomic(archive_path, archive)
+        return content, moved
+
+    async def ingest_samples(
+        self,
+        source_path: str,
+        fmt: Optional[str] = None,
+        authors: Optional[list[str]] = None,
+        profile_name: str = "default",
+        replace: bool = False,
+    ) -> dict:
+        """Stream a writing-sample export into the profile's sample corpus.
+
+        Only the user's own messages (matched against authors, falling back
+        to config.my-voice.author) are kept. Parsing runs in a worker thread
+        one message at a time. The corpus stays on this device - it is
+        excluded from the profile repo so raw messages are never pushed.
+        """
+        if self._ingest_root is None:
+            path = Path(os.path.expanduser(source_path))
+        else:
+            path = (self._ingest_root / source_path).resolve()
+            if not path.is_relative_to(self._ingest_root):
+                return {
+                    "success": False,
+                    "error": f"Exports must be inside {self._ingest_root}",
+                }
+        if not path.exists():
+            return {"success": False, "error": f"Export not found: {path}"}
+        fmt = fmt or await asyncio.to_thread(detect_format, path)
+        if fmt is None:
+            return {
+                "success": False,
+                "error": f"Can't tell the format of {path.name}. Pass format: mbox, slack, teams or text",
+            }
+        authors = authors or self._authors
+        if fmt != "text" and not authors:
+            return {
+                "success": False,
+                "error": "author is required to pick out your own messages (name, email or chat user id)",
+            }
+
+        init_result = await self.ensure_initialized()
+        if not init_result["success"]:
+            return init_result
+        await self._ensure_checked_out(profile_name)
+        self._exclude_corpus()
+
+        corpus_path = (
+            self.local_path / "profiles" / profile_name / CORPUS_DIR / CORPUS_FILE
+        )
+        # New samples are counted as they're written and merged into the
+        # profile's feature counts, so the corpus is never re-read
+        counts = FeatureCounts()
+        lock = self._profile_locks.setdefault(profile_name, asyncio.Lock())
+        async with lock:
+            stats = await asyncio.to_thread(
+                write_corpus,
+                iter_samples(path, fmt, authors),
+                corpus_path,
+                fmt,
+                path.name,
+                replace,
+                counts.add,
+            )
+            untracked = self._untrack_features(profile_name)
+            if counts.samples or replace:
+                # The corpus already holds these samples, so unreadable counts
+                # are rebuilt from it alone
+                _, rebuilt = await asyncio.to_thread(
+                    self._merge_features, profile_name, counts, replace, True
+                )
+        result = {
+            "success": True,
+            "message": f"Added {stats['added']} samples to {profile_name} corpus",
+            "format": fmt,
+            "path": str(corpus_path),
+            **stats,
+        }
+        if (counts.samples or replace) and rebuilt:
+            result["warning"] = self._rebuilt_warning(profile_name)
+        if untracked:
+            await self._auto_save(
+                f"Stop tracking {profile_name} feature counts", result
+            )
+        return result
+
+    async def feature_summary(
+        self, profile_name: str = "default", top_n: int = 10
+    ) -> dict:
+        """Feature summary of every sample the profile has seen.
+
+        Served from the FEATURE_COUNTS.bin sidecar; the first call on a
+        profile with only an ingested corpus builds the sidecar from it.
+        """
+        features_path = self._features_path(profile_name)
+        corpus_path = features_path.parent / CORPUS_FILE
+        lock = self._profile_locks.setdefault(profile_name, asyncio.Lock())
+        async with lock:
+            untracked = self._untrack_features(profile_name)
+            rebuilt = False
+            if features_path.exists():
+                try:
+                    counts = await asyncio.to_thread(self._load_features, profile_name)
+                except ValueError as e:
+                    try:
+                        counts = await asyncio.to_thread(
+                            self._recover_features, profile_name, e
+                        )
+                    except ValueError:
+                        return {
+                            "success": False,
+                            "error": self._unreadable_error(profile_name, e),
+                        }
+                    await asyncio.to_thread(
+                        self._merge_features, profile_name, counts, True
+                    )
+                    rebuilt = True
+            elif corpus_path.exists():
+                counts = await asyncio.to_thread(
+                    FeatureCounts().update, iter_corpus(corpus_path)
+                )
+                await asyncio.to_thread(
+                    self._merge_features, profile_name, counts, True
+                )
+            else:
+                return {
+                    "success": False,
+                    "error": f"No samples recorded for {profile_name}. Ingest an export or use add_samples first.",
+                }
+        result = {"success": True, "path": str(features_path), **counts.summary(top_n)}
+        if rebuilt:
+            result["warning"] = self._rebuilt_warning(profile_name)
+        if untracked:
+            await self._auto_save(
+                f"Stop tracking {profile_name} feature counts", result
+            )
         return result
 
+    async def add_samples(
+        self,
+        samples: list[str],
+        profile_name: str = "default",
+        top_n: int = 10,
+        auto_save: bool = True,
+    ) -> dict:
+        """Count new samples into the profile's feature counts.
+
+        Only the new samples are analyzed; they're merged into the stored
+        counts and confidence is re-derived from the totals.
+        """
+        init_result = await self.ensure_initialized()
+        if not init_result["success"]:
+            return init_result
+        await self._ensure_checked_out(profile_name)
+
+        counts = await asyncio.to_thread(FeatureCounts().update, samples)
+        lock = self._profile_locks.setdefault(profile_name, asyncio.Lock())
+        async with lock:
+            untracked = self._untrack_features(profile_name)
+            try:
+                merged, rebuilt = await asyncio.to_thread(
+                    self._merge_features, profile_name, counts
+                )
+            except ValueError as e:
+                return {
+                    "success": False,
+                    "error": self._unreadable_error(profile_name, e),
+                }
+        result = {
+            "success": True,
+            "message": f"Added {counts.samples} samples to {profile_name} feature counts",
+            "added": counts.samples,
+            "path": str(self._features_path(profile_name)),
+            **merged.summary(top_n),
+        }
+        if rebuilt:
+            result["warning"] = self._rebuilt_warning(profile_name)
+        if auto_save and untracked:
+            await self._auto_save(
+                f"Stop tracking {profile_name} feature counts", result
+            )
+        return result
+
+    def _features_path(self, profile_name: str) -> Path:
+        """The profile's feature counts - beside its corpus, never committed.
+
+        The counts keep every phrase from the user's messages, so they stay on
+        this device just like the corpus they're built from.
+        """
+        profile_dir = self.local_path / "profiles" / profile_name
+        return profile_dir / CORPUS_DIR / FEATURES_FILE
+
+    def _untrack_features(self, profile_name: str) -> bool:
+        """Move counts committed by earlier versions under samples/.
+
+        Returns True if the tracked copy was removed, so the caller can commit
+        its deletion.
+        """
+        self._exclude_corpus()
+        legacy_path = self.local_path / "profiles" / profile_name / FEATURES_FILE
+        if not legacy_path.exists():
+            return False
+        features_path = self._features_path(profile_name)
+        if features_path.exists():
+            legacy_path.unlink()
+        else:
+            features_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(legacy_path, features_path)
+        self._git_status_cache = None
+        return True
+
+    def _load_features(self, profile_name: str) -> FeatureCounts:
+        """The profile's stored feature counts (empty if there are none yet).
+
+        Raises ValueError if the file exists but can't be parsed.
+        """
+        try:
+            blob = self._features_path(profile_name).read_bytes()
+        except FileNotFoundError:
+            return FeatureCounts()
+        try:
+            return FeatureCounts.from_bytes(blob)
+        except (ValueError, KeyError, TypeError, zlib.error) as e:
+            raise ValueError(f"{type(e).__name__}: {e}") from e
+
+    def _recover_features(self, profile_name: str, error: ValueError) -> FeatureCounts:
+        """Rebuild unreadable counts from the corpus, keeping the old file aside.
+
+        Blocking. Re-raises error when there's no corpus - the unreadable file
+        is never replaced by counts that would silently start from zero.
+        """
+        features_path = self._features_path(profile_name)
+        corpus_path = features_path.parent / CORPUS_FILE
+        if not corpus_path.exists():
+            raise error
+        os.replace(features_path, features_path.with_name(UNREADABLE_FEATURES_FILE))
+        return FeatureCounts().update(iter_corpus(corpus_path))
+
+    def _merge_features(
+        self,
+        profile_name: str,
+        counts: FeatureCounts,
+        replace: bool = False,
+        in_corpus: bool = False,
+    ) -> tuple[FeatureCounts, bool]:
+        """Merge counts into the stored ones and write them back.
+
+        Returns the merged counts and whether unreadable stored counts were
+        rebuilt from the corpus (in_corpus: counts are already in it). Raises
+        ValueError, writing nothing, if they can't be. Blocking - run in a
+        thread with the profile's lock held.
+        """
+        rebuilt = False
+        if replace:
+            merged = counts
+        else:
+            try:
+                merged = self._load_features(profile_name).merge(counts)
+            except ValueError as e:
+                merged = self._recover_features(profile_name, e)
+                if not in_corpus:
+                    merged.merge(counts)
+                rebuilt = True
+        _write_atomic(self._features_path(profile_name), merged.to_bytes())
+        return merged, rebuilt
+
+    def _unreadable_error(self, profile_name: str, error: ValueError) -> str:
+        path = self._features_path(profile_name)
+        return f"Feature counts for {profile_name} can't be read ({error}) and there's no sample corpus to rebuild them from. Move {path} aside to start counting afresh."
+
+    def _rebuilt_warning(self, profile_name: str) -> str:
+        return f"Stored feature counts for {profile_name} were unreadable - rebuilt from the corpus (old file kept as {CORPUS_DIR}/{UNREADABLE_FEATURES_FILE})"
+
+    def _exclude_corpus(self) -> None:
+        """Keep corpora and feature counts out of commits via .git/info/exclude."""
+        if not self.is_git_source:
+            return
+        exclude_path = self.local_path / ".git" / "info" / "exclude"
+        pattern = f"profiles/*/{CORPUS_DIR}/"
+        try:
+            existing = exclude_path.read_text()
+        except FileNotFoundError:
+            existing = ""
+        if pattern in existing.splitlines():
+            return
+        exclude_path.parent.mkdir(parents=True, exist_ok=True)
+        with exclude_path.open("a") as fp:
+            if existing and not existing.endswith("\n"):
+                fp.write("\n")
+            fp.write(pattern + "\n")
+
+    async def build_style_vector(
+        self,
+        profile_name: str = "default",
+        samples: Optional[list[str]] = None,
+        auto_save: bool = True,
+    ) -> dict:
+        """Build the profile's style vector from samples or its ingested corpus.
+
+        Written to STYLE_VECTOR.json next to the profile. It holds hashed
+        n-gram counts and stat totals only - no sample text.
+        """
+        init_result = await self.ensure_initialized()
+        if not init_result["success"]:
+            return init_result
+        await self._ensure_checked_out(profile_name)
+
+        profile_dir = self.local_path / "profiles" / profile_name
+        corpus_path = profile_dir / CORPUS_DIR / CORPUS_FILE
+        if not samples and not corpus_path.exists():
+            return {
+                "success": False,
+                "error": f"No samples given and no sample corpus for {profile_name}. Pass samples or ingest an export first.",
+            }
+
+        def texts() -> Iterator[str]:
+            return iter(samples) if samples else iter_corpus(corpus_path)
+
+        def build() -> StyleVector:
+            vector = StyleVector().update(texts())
+            vector.calibrate(itertools.islice(texts(), BASELINE_SAMPLES))
+            return vector
+
+        vector = await asyncio.to_thread(build)
+        if not vector.samples:
+            return {"success": False, "error": "Samples are all empty"}
+
+        vector_path = profile_dir / STYLE_VECTOR_FILE
+        _write_atomic(vector_path, json.dumps(vector.to_dict(), separators=(",", ":")))
+        self._git_status_cache = None
+        self._profile_cache.pop((profile_name, STYLE_VECTOR_FILE), None)
+
+        result = {
+            "success": True,
+            "message": f"Built style vector for {profile_name} from {vector.samples} samples",
+            "samples": vector.samples,
+            "baseline": vector.baseline,
+            "path": str(vector_path),
+        }
+        if auto_save:
+            await self._auto_save(f"Update {profile_name} style vector", result)
+        return result
+
+    async def score_drafts(
+        self, drafts: list[str], profile_name: str = "default"
+    ) -> dict:
+        """Score drafts against the profile's style vector.
+
+        Each result has a 0-1 score, whether it's in the range the user's own
+        samples score in, and the stats/phrases that deviate most.
+        """
+        vector_path = self.local_path / "profiles" / profile_name / STYLE_VECTOR_FILE
+        await self._sync_before_read([vector_path])
+        cached = await self._cached_file(profile_name, STYLE_VECTOR_FILE)
+        if cached is None:
+            return {
+                "success": False,
+                "error": f"No style vector for {profile_name}. Build one with operation=build_style_vector.",
+                "path": str(vector_path),
+            }
+        vector = cached.derived.get("style")
+        if vector is None:
+            vector = StyleVector.from_dict(json.loads(cached.content))
+            cached.derived["style"] = vector
+
+        return {
+            "success": True,
+            "results": [vector.score(draft) for draft in drafts],
+            "baseline": vector.baseline,
+            "samples": vector.samples,
+        }
+
+    async def lint_drafts(
+        self, drafts: list[str], profile_name: str = "default"
+    ) -> dict:
+        """Find the profile's NEVER DO / Anti-Patterns phrases in drafts.
+
+        The rules are compiled once per cached version of the profile, so
+        linting only recompiles after the profile changes.
+        """
+        profile_path = self.local_path / "profiles" / profile_name / "VOICE_PROFILE.md"
+        await self._sync_before_read([profile_path])
+        cached = await self._cached_file(profile_name, "VOICE_PROFILE.md")
+        if cached is None:
+            return {
+                "success": False,
+                "error": f"Profile not found: {profile_name}. Run voice-analyst to create one.",
+                "path": str(profile_path),
+            }
+        matcher = cached.derived.get("lint")
+        if matcher is None:
+            matcher = compile_lint_rules(cached.content, cached.section_index())
+            cached.derived["lint"] = matcher
+
+        results = []
+        for draft in drafts:
+            matches = matcher.lint(draft)
+            results.append({"clean": not matches, "matches": matches})
+        return {
+            "success": True,
+            "results": results,
+            "rules": len(matcher.rules),
+            # Prose rules with no phrase to match - still need judging by eye
+            "unchecked": matcher.unchecked,
+        }
+
+    def start_watching(self) -> bool:
+        """Start the file watcher if configured; True while it's running."""
+        if not self._watch:
+            return False
+        if self._watcher is None:
+            self._watcher = FileWatcher(
+                self.local_path / "profiles",
+                self._on_files_changed,
+                files=(self._settings_path,),
+                poll_interval=self._watch_poll_interval,
+                use_inotify=self._watch != "poll",
+            )
+        if not self._watcher.running:
+            try:
+                if not self._watcher.start():
+                    return False  # Nothing cloned yet
+            except RuntimeError:
+                return False  # No event loop to watch from
+            # Entries cached before now were never watched - re-read them once
+            self.invalidate_cache()
+        return True
+
+    def _on_files_changed(self, paths: set[Path]) -> None:
+        """Watcher callback - drop cache entries for files that changed."""
+        profiles_dir = self.local_path / "profiles"
+        for path in paths:
+            if path == self._settings_path:
+                if self._reload_task is None or self._reload_task.done():
+                    self._reload_task = asyncio.ensure_future(self._reload_settings())
+                continue
+            if path == profiles_dir:
+                # Queue overflow or profiles/ replaced - anything may differ
+                self.invalidate_cache()
+                self._manifest_dirty = True
+                continue
+            try:
+                parts = path.relative_to(profiles_dir).parts
+            except ValueError:
+                continue
+            if len(parts) == 1:
+                # A profile directory came, went or was replaced
+                self.invalidate_cache(parts[0])
+                self._manifest_dirty = True
+                continue
+            key = (parts[0], parts[1])
+            entry = self._profile_cache.get(key)
+            if entry is not None:
+                try:
+                    stat = path.stat()
+                    current = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    current = None
+                if current == entry.signature:
+                    continue  # Our own write - the cache already has it
+                del self._profile_cache[key]
+            if parts[1] == "VOICE_PROFILE.md":
+                self._manifest_dirty = True
+
+    async def _reload_settings(self) -> None:
+        """Rebind this store's local_path to the config now in settings.yaml."""
+        try:
+            import yaml
+        except ImportError:
+            return
+        try:
+            text = await asyncio.to_thread(self._settings_path.read_text)
+            settings = yaml.safe_load(text) or {}
+            fresh = (settings.get("config") or {}).get("my-voice") or {}
+        except (OSError, UnicodeDecodeError, yaml.YAMLError, AttributeError):
+            return  # Deleted, half-written or unparseable - keep what we have
+        config = {**self._config, **fresh}
+        if config == self._config or self not in _stores.values():
+            return
+        # Queued writes belong to this configuration - push them first
+        await self.flush()
+        _rebind(self, config)
+
+    def close(self) -> None:
+        """Stop the batch reader, watcher and push worker.
+
+        Each restarts if the store is used again; queued pushes stay in the
+        outbox file.
+        """
+        self._batch.close()
+        if self._push_task is not None and not self._push_task.done():
+            try:
+                self._push_task.cancel()
+            except RuntimeError:
+                pass  # Its event loop is already closed
+        if self._watcher is not None:
+            self._watcher.stop()
+
+    async def wait_closed(self) -> None:
+        """Wait for the batch reader stopped by close() to exit."""
+        await self._batch.wait_closed()
+
     async def status(self) -> dict:
         """Get current status of profile storage."""
         info = {
@@ -267,6 +2058,13 @@ class ProfileStore:
             "local_path": str(self.local_path),
             "is_git": self.is_git_source,
             "initialized": self._initialized,
+            "pending_saves": len(self._pending_saves),
+            "sync": {
+                "in_flight": self.sync_in_flight,
+                "started": self._syncs_started,
+                "coalesced": self._syncs_coalesced,
+            },
+            "cache": self.cache_stats(),
         }
 
         if self.is_git_source:
@@ -274,21 +2072,83 @@ class ProfileStore:
             info["seconds_since_sync"] = (
                 int(time.time() - self._last_sync) if self._last_sync else None
             )
+            # "probe" = remote unchanged so the pull was skipped, "fetch" = real pull
+            info["last_sync_kind"] = self._last_sync_kind
+            info["last_sync_result"] = self._last_sync_result
+            if self._last_clone:
+                info["last_clone"] = self._last_clone
+            info["outbox"] = {
+                "depth": len(self._outbox),
+                "pushing": self._push_task is not None and not self._push_task.done(),
+                "attempts": self._push_attempts,
+                "next_retry_in": (
+                    max(0, round(self._next_push - time.time()))
+                    if self._outbox and self._next_push
+                    else None
+                ),
+                "last_error": self._last_push_error,
+            }
+            info["git_batch"] = {
+                "running": self._batch.running,
+                "starts": self._batch.starts,
+                "requests": self._batch.requests,
+            }
 
             if self._initialized:
-                # Get git status
-                code, stdout, _ = await self._run_git("status", "--porcelain")
-                info["has_changes"] = bool(stdout.strip())
+                # Branch, commit, ahead/behind and dirty state in one git call
+                git_status = await self._git_status()
+                info["has_changes"] = git_status["has_changes"]
+                head = git_status["head"]
+                info["current_commit"] = head[:7] if head else None
+                info["branch"] = git_status["branch"]
+                info["upstream"] = git_status["upstream"]
+                info["ahead"] = git_status["ahead"]
+                info["behind"] = git_status["behind"]
 
-                # Get current commit
-                code, stdout, _ = await self._run_git("rev-parse", "--short", "HEAD")
-                info["current_commit"] = stdout.strip() if code == 0 else None
+        if self._watcher is not None:
+            info["watcher"] = {
+                "backend": self._watcher.backend,
+                "events": self._watcher.events,
+            }
 
         # List available profiles
-        profiles_dir = self.local_path / "profiles"
-        if profiles_dir.exists():
-            info["profiles"] = [p.name for p in profiles_dir.iterdir() if p.is_dir()]
-        else:
-            info["profiles"] = []
+        info["profiles"] = sorted(self.profile_manifest())
+        self._save_manifest()
 
         return info
+
+
+# Process-wide stores keyed by local_path. The tool and hook modules both
+# resolve their store here, so they share sync state and the content cache.
+_stores: dict[Path, ProfileStore] = {}
+
+
+def get_store(config: dict, replace: bool = False) -> ProfileStore:
+    """Get the shared ProfileStore for config's local_path.
+
+    The first caller's config wins; pass replace=True to rebind the path to a
+    new configuration (e.g. after the configure operation).
+    """
+    key = _resolve_local_path(config).resolve()
+    store = _stores.get(key)
+    if store is None or replace:
+        if store is not None:
+            store.close()
+        store = ProfileStore(config)
+        _stores[key] = store
+    return store
+
+
+def _rebind(old: ProfileStore, config: dict) -> ProfileStore:
+    """Replace a store everywhere it's shared with one built from config.
+
+    Callers still holding the old config (e.g. the hook, after settings.yaml
+    moved local_path) resolve to the new store too.
+    """
+    store = ProfileStore(config)
+    for key, value in list(_stores.items()):
+        if value is old:
+            _stores[key] = store
+    _stores[_resolve_local_path(config).resolve()] = store
+    old.close()
+    return store
@@ -0,0 +1,325 @@
+"""Style-match scoring - how much a draft reads like the profile's samples.
+
+A style vector combines hashed word/character n-gram counts with
+per-message stylometric stats (mean and spread). A draft scores by cosine
+similarity of its n-grams to the profile's, blended with how close its stats
+sit to the profile's typical range. Everything is plain counting, so a score
+takes well under a millisecond once the vector is loaded.
+"""
+
+import math
+import zlib
+from typing import Callable, Iterable, Optional
+
+from .features import (
+    EMPHASIS_PATTERNS,
+    KNOWN_ABBREVIATIONS,
+    PUNCTUATION_PATTERNS,
+    split_sentences,
+    tokenize,
+)
+
+STYLE_VECTOR_FILE = "STYLE_VECTOR.json"
+STYLE_VECTOR_VERSION = 2  # 2: baseline from held-out scores
+
+# Hashed n-gram buckets (power of two so the hash can be masked)
+NGRAM_DIMS = 1 << 14
+
+# Share of the score from n-gram similarity; the rest comes from stats
+NGRAM_WEIGHT = 0.6
+
+# Own samples scored at build time to calibrate what a match looks like -
+# each against the vector without it, as an unseen message would be
+BASELINE_SAMPLES = 200
+
+# Deviations and unfamiliar phrases reported per draft
+TOP_DEVIATIONS = 5
+
+# Per-message stats, scaled per 100 words where they're rates
+STAT_NAMES = (
+    "words",
+    "words_per_sentence",
+    "chars_per_word",
+    "abbreviations_per_100_words",
+    "contractions_per_100_words",
+    "lowercase_sentence_starts",
+    *(f"{name}_per_100_words" for name in PUNCTUATION_PATTERNS),
+    *(f"{name}_per_100_words" for name in EMPHASIS_PATTERNS),
+)
+
+
+def _bucket(gram: str) -> int:
+    """Stable hash bucket for an n-gram (crc32 - fast and not salted)."""
+    return zlib.crc32(gram.encode()) & (NGRAM_DIMS - 1)
+
+
+def _ngrams(text: str) -> tuple[list[str], list[str]]:
+    """(word uni/bigrams, character trigrams) of a text.
+
+    Word grams carry vocabulary; character trigrams keep casing and
+    punctuation habits that tokenizing throws away.
+    """
+    words = tokenize(text)
+    word_grams = [f"w:{w}" for w in words]
+    word_grams += [f"w:{a} {b}" for a, b in zip(words, words[1:])]
+    squashed = " ".join(text.split())
+    char_grams = [f"c:{squashed[i : i + 3]}" for i in range(len(squashed) - 2)]
+    return word_grams, char_grams
+
+
+def ngram_counts(text: str) -> dict[int, int]:
+    """Hashed n-gram counts of a text."""
+    counts: dict[int, int] = {}
+    for grams in _ngrams(text):
+        for gram in grams:
+            bucket = _bucket(gram)
+            counts[bucket] = counts.get(bucket, 0) + 1
+    return counts
+
+
+def _weight(count: int) -> float:
+    """Log-scaled weight so common grams don't swamp the rest."""
+    return 1 + math.log(count) if count > 0 else 0.0
+
+
+def _weights(counts: dict[int, int]) -> dict[int, float]:
+    """Unit-length weights of n-gram counts."""
+    weights = {bucket: _weight(count) for bucket, count in counts.items()}
+    norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+    return {bucket: w / norm for bucket, w in weights.items()}
+
+
+def _cosine(a: dict[int, float], b: dict[int, float]) -> float:
+    """Cosine similarity of two unit-length sparse vectors."""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(w * b.get(bucket, 0.0) for bucket, w in a.items())
+
+
+def _moments(total: float, squares: float, n: int) -> tuple[float, float]:
+    """(mean, spread) from running totals over n samples.
+
+    The spread has a floor so a stat that never varied in the samples
+    doesn't make every small difference look extreme.
+    """
+    n = n or 1
+    mean = total / n
+    variance = max(squares / n - mean * mean, 0.0)
+    return mean, max(math.sqrt(variance), 0.25 * abs(mean), 0.5)
+
+
+def message_stats(text: str) -> dict[str, float]:
+    """Stylometric stats of one message."""
+    words = tokenize(text)
+    sentences = split_sentences(text)
+    per_100 = 100 / len(words) if words else 0.0
+    starts = [s.lstrip("\"'*_([") for s in sentences]
+    stats = {
+        "words": float(len(words)),
+        "words_per_sentence": len(words) / len(sentences) if sentences else 0.0,
+        "chars_per_word": sum(map(len, words)) / len(words) if words else 0.0,
+        "abbreviations_per_100_words": per_100
+        * sum(1 for w in words if w in KNOWN_ABBREVIATIONS),
+        "contractions_per_100_words": per_100
+        * sum(1 for w in words if "'" in w or "’" in w),
+        "lowercase_sentence_starts": (
+            sum(1 for s in starts if s[:1].islower()) / len(starts) if starts else 0.0
+        ),
+    }
+    for name, pattern in PUNCTUATION_PATTERNS.items():
+        stats[f"{name}_per_100_words"] = per_100 * len(pattern.findall(text))
+    for name, pattern in EMPHASIS_PATTERNS.items():
+        stats[f"{name}_per_100_words"] = per_100 * len(pattern.findall(text))
+    return stats
+
+
+def _stats_similarity(
+    stats: dict[str, float], moments: Callable[[str], tuple[float, float]]
+) -> tuple[float, list[dict]]:
+    """Mean closeness of stats to the profile's, and deviations (largest first)."""
+    deviations = []
+    closeness = []
+    for name, value in stats.items():
+        mean, spread = moments(name)
+        z = (value - mean) / spread
+        closeness.append(math.exp(-z * z / 2))
+        deviations.append(
+            {
+                "feature": name,
+                "draft": round(value, 2),
+                "profile": round(mean, 2),
+                "z": round(z, 2),
+            }
+        )
+    deviations.sort(key=lambda d: abs(d["z"]), reverse=True)
+    return sum(closeness) / len(closeness), deviations
+
+
+def _blend(ngram_similarity: float, stats_similarity: float) -> float:
+    """Overall 0-1 score."""
+    return round(
+        NGRAM_WEIGHT * ngram_similarity + (1 - NGRAM_WEIGHT) * stats_similarity, 3
+    )
+
+
+class StyleVector:
+    """A profile's style: n-gram counts plus per-message stat moments.
+
+    Everything but the baseline is a running total, so add() can extend a
+    vector loaded from disk.
+    """
+
+    def __init__(self) -> None:
+        self.samples = 0
+        self.ngrams: dict[int, int] = {}
+        self.stat_sums: dict[str, float] = dict.fromkeys(STAT_NAMES, 0.0)
+        self.stat_squares: dict[str, float] = dict.fromkeys(STAT_NAMES, 0.0)
+        self.baseline: Optional[dict] = None
+        self._weights: Optional[dict[int, float]] = None
+        self._norm_squared: Optional[float] = None  # Of the unnormalized weights
+
+    def add(self, text: str) -> None:
+        """Fold one writing sample into the vector."""
+        if not text.strip():
+            return
+        self.samples += 1
+        for bucket, count in ngram_counts(text).items():
+            self.ngrams[bucket] = self.ngrams.get(bucket, 0) + count
+        for name, value in message_stats(text).items():
+            self.stat_sums[name] += value
+            self.stat_squares[name] += value * value
+        self._weights = None
+        self._norm_squared = None
+
+    def update(self, texts: Iterable[str]) -> "StyleVector":
+        """Fold in many samples; returns self for chaining."""
+        for text in texts:
+            self.add(text)
+        return self
+
+    def stat_moments(self, name: str) -> tuple[float, float]:
+        """(mean, spread) of a stat across samples."""
+        return _moments(self.stat_sums[name], self.stat_squares[name], self.samples)
+
+    def score(self, text: str) -> dict:
+        """How closely a draft matches this style (0-1), and why not."""
+        if self._weights is None:
+            self._weights = _weights(self.ngrams)
+        ngram_similarity = _cosine(_weights(ngram_counts(text)), self._weights)
+        stats_similarity, deviations = _stats_similarity(
+            message_stats(text), self.stat_moments
+        )
+        score = _blend(ngram_similarity, stats_similarity)
+        result = {
+            "score": score,
+            "ngram_similarity": round(ngram_similarity, 3),
+            "stats_similarity": round(stats_similarity, 3),
+            "deviations": [d for d in deviations if abs(d["z"]) >= 1][:TOP_DEVIATIONS],
+            "unfamiliar_phrases": self._unfamiliar_phrases(text),
+        }
+        if self.baseline:
+            result["matches"] = score >= self.baseline["p10"]
+        return result
+
+    def _unfamiliar_phrases(self, text: str) -> list[str]:
+        """Draft word pairs the profile's samples never used."""
+        word_grams, _ = _ngrams(text)
+        unfamiliar = []
+        for gram in word_grams:
+            if " " in gram and _bucket(gram) not in self.ngrams:
+                phrase = gram[2:]
+                if phrase not in unfamiliar:
+                    unfamiliar.append(phrase)
+            if len(unfamiliar) >= TOP_DEVIATIONS:
+                break
+        return unfamiliar
+
+    def held_out_score(self, text: str) -> Optional[float]:
+        """Score of a sample against this vector with that sample taken out.
+
+        The text must be one of the samples added. Scoring a sample against a
+        vector that includes it flatters it, so this is what calibrates a
+        match. None if the text is the only sample.
+        """
+        if self.samples < 2 or not text.strip():
+            return None
+        counts = ngram_counts(text)
+        if self._norm_squared is None:
+            self._norm_squared = sum(_weight(c) ** 2 for c in self.ngrams.values())
+
+        # Only the text's own buckets change when it's removed
+        norm_squared = self._norm_squared
+        held_out: dict[int, float] = {}
+        for bucket, count in counts.items():
+            total = self.ngrams.get(bucket, 0)
+            held_out[bucket] = _weight(total - count)
+            norm_squared -= _weight(total) ** 2 - held_out[bucket] ** 2
+        norm = math.sqrt(max(norm_squared, 0.0)) or 1.0
+        ngram_similarity = sum(
+            w * held_out[bucket] / norm for bucket, w in _weights(counts).items()
+        )
+
+        stats = message_stats(text)
+        n = self.samples - 1
+        stats_similarity, _ = _stats_similarity(
+            stats,
+            lambda name: _moments(
+                self.stat_sums[name] - stats[name],
+                self.stat_squares[name] - stats[name] ** 2,
+                n,
+            ),
+        )
+        return _blend(ngram_similarity, stats_similarity)
+
+    def calibrate(self, texts: Iterable[str]) -> None:
+        """Record how the profile's own samples score when held out.
+
+        texts must be samples already added to the vector.
+        """
+        scores = sorted(
+            score for score in map(self.held_out_score, texts) if score is not None
+        )
+        if not scores:
+            return
+        self.baseline = {
+            "samples": len(scores),
+            "mean": round(sum(scores) / len(scores), 3),
+            "p10": scores[int(len(scores) * 0.1)],
+        }
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form for STYLE_VECTOR.json."""
+        return {
+            "version": STYLE_VECTOR_VERSION,
+            "dims": NGRAM_DIMS,
+            "samples": self.samples,
+            "baseline": self.baseline,
+            "stats": {
+                name: [
+                    round(self.stat_sums[name], 4),
+                    round(self.stat_squares[name], 4),
+                ]
+                for name in STAT_NAMES
+            },
+            "ngrams": {
+                str(bucket): count for bucket, count in sorted(self.ngrams.items())
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StyleVector":
+        """Load a vector written by to_dict."""
+        if (
+            data.get("version") != STYLE_VECTOR_VERSION
+            or data.get("dims") != NGRAM_DIMS
+        ):
+            raise ValueError("Style vector was built by another version - rebuild it")
+        vector = cls()
+        vector.samples = data["samples"]
+        vector.baseline = data.get("baseline")
+        for name, (total, squares) in data["stats"].items():
+            if name in vector.stat_sums:
+                vector.stat_sums[name] = total
+                vector.stat_squares[name] = squares
+        vector.ngrams = {int(bucket): count for bucket, count in data["ngrams"].items()}
+        return vector
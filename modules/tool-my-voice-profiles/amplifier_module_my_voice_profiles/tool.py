@@ -2,11 +2,13 @@
 
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from amplifier_core import ToolResult
 
-from .store import ProfileStore
+from .features import extract_features
+from .pool import ProfileStorePool, check_profile_name
+from .store import SETTINGS_FILE, ProfileStore, get_store
 
 
 class MyVoiceProfilesTool:
@@ -16,8 +18,20 @@ class MyVoiceProfilesTool:
     """
 
     def __init__(self, config: dict[str, Any] | None = None):
-        my_voice_config = (config or {}).get("my-voice", {})
-        self._store = ProfileStore(my_voice_config)
+        self._config: dict[str, Any] = (config or {}).get("my-voice", {})
+        # Per-user stores, created on the first request that names a user
+        self._pool: Optional[ProfileStorePool] = None
+
+    @property
+    def _store(self) -> ProfileStore:
+        """Shared store for the configured local_path (also used by the hook)."""
+        return get_store(self._config)
+
+    def _get_pool(self) -> ProfileStorePool:
+        """Store pool for multi-user service (config.my-voice.users)."""
+        if self._pool is None:
+            self._pool = ProfileStorePool(self._config)
+        return self._pool
 
     @property
     def name(self) -> str:
@@ -30,18 +44,45 @@ class MyVoiceProfilesTool:
 Operations:
 - sync: Pull latest profiles from remote (if git source)
 - status: Get current profile storage status
-- read: Read a voice profile
+- read: Read a voice profile (optionally only some sections, within a size budget)
+- read_section: Read one section of a voice profile
+- read_many: Read several profiles/decoder rings in one call
 - write: Write/update a voice profile
-- save: Commit and push changes to remote
+- append_learning: Add one entry to the profile's Learnings Log (no full rewrite)
+- compact_learnings: Move old Learnings Log entries to LEARNINGS_ARCHIVE.md
+- ingest: Import your messages from an email/chat export (mbox, Slack, Teams, text) into the profile's sample corpus
+- build_style_vector: Build the profile's style vector (for score) from samples or the ingested corpus
+- score: Score drafts 0-1 for how much they sound like the user, with the features that deviate most
+- lint: Find the profile's NEVER DO / Anti-Patterns phrases in drafts (match spans)
+- analyze_samples: Count stylometric features (openers, phrases, abbreviations, punctuation, sentence lengths) in writing samples, or for all samples the profile has seen if none are given
+- add_samples: Merge new writing samples into the profile's stored feature counts (only the new samples are analyzed)
+- save: Commit changes and queue a push to remote (retried until it lands)
+- flush: Commit queued writes now and start pushing (writes are batched after a quiet period)
 - configure: Set up profile storage (for new users or new devices)
+- metrics: Latency histograms (count, p50/p90/p99, errors) for git calls, syncs, reads, writes and the sync hook
 
 Examples:
 - Sync profiles: {"operation": "sync"}
 - Check status: {"operation": "status"}
 - Read profile: {"operation": "read", "profile": "default"}
+- Read sections: {"operation": "read", "sections": ["Quick Reference Card", "Chat"], "max_chars": 4000}
+- Read one section: {"operation": "read_section", "section": "Learnings Log"}
+- Read as last synced from remote: {"operation": "read", "revision": "origin/main", "sections": ["Quick Reference Card"]}
+- Read several: {"operation": "read_many", "items": [{"profile": "default", "sections": ["Quick Reference Card"]}, {"profile": "alex", "artifact": "decoder_ring"}]}
 - Write profile: {"operation": "write", "profile": "default", "content": "..."}
+- Add a learning: {"operation": "append_learning", "observation": "Drops greetings in chat", "adjustment": "Don't add 'Hi all'"}
+- Compact learnings: {"operation": "compact_learnings", "keep": 20, "max_age_days": 180}
+- Ingest an export: {"operation": "ingest", "path": "~/Downloads/slack-export", "format": "slack", "author": "alex"}
+- Build style vector: {"operation": "build_style_vector", "profile": "default"}
+- Score drafts: {"operation": "score", "drafts": ["draft one...", "draft two..."]}
+- Lint a draft: {"operation": "lint", "content": "I hope this email finds you well..."}
+- Analyze samples: {"operation": "analyze_samples", "samples": ["first sample...", "second sample..."], "top_n": 10}
+- Add samples to a profile: {"operation": "add_samples", "profile": "default", "samples": ["new sample..."]}
 - Save changes: {"operation": "save", "message": "Added new learnings"}
+- Flush queued writes: {"operation": "flush"}
 - Configure storage: {"operation": "configure", "storage_type": "github", "git_url": "https://github.com/user/my-voice-profiles"}
+- Show git timings: {"operation": "metrics", "prefix": "git."}
+- Serve another user's profile (shared service): {"operation": "read", "user": "alex", "sections": ["Quick Reference Card"]}
 """
 
     @property
@@ -52,25 +93,142 @@ Examples:
             "properties": {
                 "operation": {
                     "type": "string",
-                    "enum": ["sync", "status", "read", "write", "save", "configure"],
+                    "enum": [
+                        "sync",
+                        "status",
+                        "read",
+                        "read_section",
+                        "read_many",
+                        "write",
+                        "append_learning",
+                        "compact_learnings",
+                        "ingest",
+                        "analyze_samples",
+                        "add_samples",
+                        "build_style_vector",
+                        "score",
+                        "lint",
+                        "save",
+                        "flush",
+                        "configure",
+                        "metrics",
+                    ],
                     "description": "Operation to perform",
                 },
                 "profile": {
                     "type": "string",
                     "description": "Profile name (default: 'default')",
                 },
+                "user": {
+                    "type": "string",
+                    "description": "Whose profiles to use when one process serves several users (default: the configured storage)",
+                },
                 "content": {
                     "type": "string",
                     "description": "Profile content (for write operation)",
                 },
+                "sections": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Section titles to read, e.g. 'Quick Reference Card' or 'Chat' (title prefixes match)",
+                },
+                "section": {
+                    "type": "string",
+                    "description": "Section title (for read_section operation)",
+                },
+                "max_chars": {
+                    "type": "integer",
+                    "description": "Size budget for read/read_section output, in characters",
+                },
+                "revision": {
+                    "type": "string",
+                    "description": "Read the profile as committed at this git revision, e.g. 'HEAD~1' or 'origin/main' (for read/read_section; default: working copy)",
+                },
+                "items": {
+                    "type": "array",
+                    "description": "Files to fetch (for read_many operation)",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "profile": {"type": "string"},
+                            "artifact": {
+                                "type": "string",
+                                "enum": ["voice_profile", "decoder_ring"],
+                            },
+                            "sections": {"type": "array", "items": {"type": "string"}},
+                            "max_chars": {"type": "integer"},
+                            "revision": {"type": "string"},
+                        },
+                    },
+                },
                 "message": {
                     "type": "string",
                     "description": "Commit message (for save operation)",
                 },
+                "observation": {
+                    "type": "string",
+                    "description": "What you learned (for append_learning)",
+                },
+                "adjustment": {
+                    "type": "string",
+                    "description": "How to apply it (for append_learning)",
+                },
+                "date": {
+                    "type": "string",
+                    "description": "Entry date, YYYY-MM-DD (for append_learning, default: today)",
+                },
+                "keep": {
+                    "type": "integer",
+                    "description": "Newest learnings to keep in the profile (for compact_learnings)",
+                },
+                "max_age_days": {
+                    "type": "integer",
+                    "description": "Archive learnings older than this (for compact_learnings)",
+                },
+                "path": {
+                    "type": "string",
+                    "description": "Local export file or Slack export directory (for ingest)",
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["mbox", "slack", "teams", "text"],
+                    "description": "Export format (for ingest, default: detected from the file)",
+                },
+                "author": {
+                    "type": ["string", "array"],
+                    "items": {"type": "string"},
+                    "description": "Your name, email or chat user id(s) in the export (for ingest)",
+                },
+                "replace": {
+                    "type": "boolean",
+                    "description": "Replace the corpus instead of adding to it (for ingest)",
+                },
+                "samples": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Writing samples, one per item (for analyze_samples/add_samples/build_style_vector)",
+                },
+                "drafts": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Candidate messages (for score/lint; content checks a single draft)",
+                },
+                "top_n": {
+                    "type": "integer",
+                    "description": "Patterns to report per feature (for analyze_samples, default: 10)",
+                },
                 "force": {
                     "type": "boolean",
                     "description": "Force sync even if not stale",
                 },
+                "prefix": {
+                    "type": "string",
+                    "description": "Only spans whose name starts with this, e.g. 'git.' or 'hook.' (for metrics)",
+                },
+                "reset": {
+                    "type": "boolean",
+                    "description": "Clear the histograms after reading them (for metrics)",
+                },
                 "storage_type": {
                     "type": "string",
                     "enum": ["github", "local"],
@@ -86,6 +244,27 @@ Examples:
 
     async def execute(self, input: dict[str, Any]) -> ToolResult:
         """Execute tool with given input."""
+        user = input.get("user")
+        if not user:
+            return await self._execute(input, self._store)
+        if input.get("operation") == "configure":
+            # Doesn't need the user to be known yet - this is how they get known
+            return await self._execute(input, None)
+        try:
+            # Profile names become paths - keep them inside this user's checkout
+            check_profile_name(input.get("profile", "default"))
+            for item in input.get("items") or []:
+                if isinstance(item, dict):
+                    check_profile_name(item.get("profile", "default"))
+            async with self._get_pool().use(user) as store:
+                return await self._execute(input, store)
+        except ValueError as e:
+            return ToolResult(success=False, error={"message": str(e)})
+
+    async def _execute(
+        self, input: dict[str, Any], store: Optional[ProfileStore]
+    ) -> ToolResult:
+        """Run one operation against store (None only for a user's configure)."""
         operation = input.get("operation")
         profile = input.get("profile", "default")
         content = input.get("content")
@@ -94,29 +273,137 @@ Examples:
 
         try:
             if operation == "sync":
-                result = await self._store.sync(force=force)
+                result = await store.sync(force=force)
             elif operation == "status":
-                result = await self._store.status()
+                result = await store.status()
                 # Add configuration_state to status
-                result["configuration_state"] = self._store.configuration_state
+                result["configuration_state"] = store.configuration_state
             elif operation == "read":
-                result = await self._store.read_profile(profile)
+                result = await store.read_profile(
+                    profile,
+                    sections=input.get("sections"),
+                    max_chars=input.get("max_chars"),
+                    revision=input.get("revision"),
+                )
+            elif operation == "read_section":
+                section = input.get("section")
+                if not section:
+                    return ToolResult(
+                        success=False,
+                        error={"message": "section is required for read_section"},
+                    )
+                result = await store.read_section(
+                    section,
+                    profile_name=profile,
+                    max_chars=input.get("max_chars"),
+                    revision=input.get("revision"),
+                )
+            elif operation == "read_many":
+                items = input.get("items")
+                if not items:
+                    return ToolResult(
+                        success=False,
+                        error={"message": "items is required for read_many operation"},
+                    )
+                result = await store.read_many(items)
             elif operation == "write":
                 if content is None:
                     return ToolResult(
                         success=False,
                         error={"message": "content is required for write operation"},
                     )
-                result = await self._store.write_profile(
+                result = await store.write_profile(
                     content=content,
                     profile_name=profile,
                 )
-            elif operation == "save":
-                result = await self._store.save(
-                    message=message or "Update voice profile"
+            elif operation == "append_learning":
+                observation = input.get("observation")
+                adjustment = input.get("adjustment")
+                if not observation or not adjustment:
+                    return ToolResult(
+                        success=False,
+                        error={
+                            "message": "observation and adjustment are required for append_learning"
+                        },
+                    )
+                result = await store.append_learning(
+                    observation,
+                    adjustment,
+                    profile_name=profile,
+                    date=input.get("date"),
+                )
+            elif operation == "compact_learnings":
+                result = await store.compact_learnings(
+                    profile_name=profile,
+                    keep=input.get("keep"),
+                    max_age_days=input.get("max_age_days"),
+                )
+            elif operation == "ingest":
+                path = input.get("path")
+                if not path:
+                    return ToolResult(
+                        success=False,
+                        error={"message": "path is required for ingest operation"},
+                    )
+                author = input.get("author")
+                result = await store.ingest_samples(
+                    path,
+                    fmt=input.get("format"),
+                    authors=[author] if isinstance(author, str) else author,
+                    profile_name=profile,
+                    replace=input.get("replace", False),
                 )
+            elif operation == "analyze_samples":
+                samples = input.get("samples")
+                top_n = input.get("top_n") or 10
+                if samples:
+                    result = extract_features(samples, top_n=top_n)
+                else:
+                    # No samples given - everything the profile has seen so far
+                    result = await store.feature_summary(profile, top_n=top_n)
+            elif operation == "add_samples":
+                samples = input.get("samples")
+                if not samples:
+                    return ToolResult(
+                        success=False,
+                        error={"message": "samples is required for add_samples"},
+                    )
+                result = await store.add_samples(
+                    samples, profile_name=profile, top_n=input.get("top_n") or 10
+                )
+            elif operation == "build_style_vector":
+                result = await store.build_style_vector(
+                    profile_name=profile, samples=input.get("samples")
+                )
+            elif operation == "score":
+                drafts = input.get("drafts") or ([content] if content else None)
+                if not drafts:
+                    return ToolResult(
+                        success=False,
+                        error={"message": "drafts (or content) is required for score"},
+                    )
+                result = await store.score_drafts(drafts, profile_name=profile)
+            elif operation == "lint":
+                drafts = input.get("drafts") or ([content] if content else None)
+                if not drafts:
+                    return ToolResult(
+                        success=False,
+                        error={"message": "drafts (or content) is required for lint"},
+                    )
+                result = await store.lint_drafts(drafts, profile_name=profile)
+            elif operation == "save":
+                result = await store.save(message=message or "Update voice profile")
+            elif operation == "flush":
+                result = await store.flush()
             elif operation == "configure":
                 result = await self._configure_storage(input)
+            elif operation == "metrics":
+                metrics = store.metrics
+                result = metrics.snapshot(prefix=input.get("prefix"))
+                if input.get("reset"):
+                    metrics.reset(prefix=input.get("prefix"))
+                if self._pool is not None:
+                    result["pool"] = self._pool.stats(user=input.get("user"))
             else:
                 return ToolResult(
                     success=False,
@@ -132,9 +419,14 @@ Examples:
             )
 
     async def _configure_storage(self, input: dict[str, Any]) -> dict[str, Any]:
-        """Configure profile storage - helps users set up on first run or new device."""
+        """Configure profile storage - helps users set up on first run or new device.
+
+        With a user, only that user's storage in the store pool changes;
+        settings.yaml and everyone else's storage are left alone.
+        """
         storage_type = input.get("storage_type")
         git_url = input.get("git_url")
+        user = input.get("user")
 
         if not storage_type:
             return {
@@ -143,9 +435,9 @@ Examples:
             }
 
         # Read existing settings
-        settings_path = Path(os.path.expanduser("~/.amplifier/settings.yaml"))
+        settings_path = Path(os.path.expanduser(SETTINGS_FILE))
 
-        if settings_path.exists():
+        if settings_path.exists() and not user:
             import yaml
 
             settings = yaml.safe_load(settings_path.read_text()) or {}
@@ -188,45 +480,34 @@ Examples:
                 "error": f"Unknown storage_type: {storage_type}. Use 'github' or 'local'",
             }
 
+        if user:
+            pool = self._get_pool()
+            profile_source = settings["config"]["my-voice"]["profile_source"]
+            await pool.configure(user, profile_source)
+            local_path = pool.tenant_config(user)["local_path"]
+            if storage_type == "github":
+                async with pool.use(user) as store:
+                    return await self._first_sync(store, message)
+            return {
+                "success": True,
+                "message": f"{message} for {user}",
+                "local_path": local_path,
+                "next_step": f"Profiles for {user} will be stored at {local_path}/profiles/",
+            }
+
         # Write settings back
         import yaml
 
         settings_path.parent.mkdir(parents=True, exist_ok=True)
         settings_path.write_text(yaml.dump(settings, default_flow_style=False))
 
-        # Reinitialize the store with new config
-        self._store = ProfileStore(settings["config"]["my-voice"])
+        # Reinitialize the shared store with new config
+        self._config = settings["config"]["my-voice"]
+        get_store(self._config, replace=True)
 
         # For GitHub, try to sync immediately
         if storage_type == "github":
-            sync_result = await self._store.sync(force=True)
-            if sync_result.get("success"):
-                # Check if there's already a profile
-                status = await self._store.status()
-                if status.get("profiles"):
-                    return {
-                        "success": True,
-                        "message": message,
-                        "synced": True,
-                        "profiles_found": status["profiles"],
-                        "next_step": "Your existing profile is ready to use!",
-                    }
-                else:
-                    return {
-                        "success": True,
-                        "message": message,
-                        "synced": True,
-                        "profiles_found": [],
-                        "next_step": "Storage connected but no profile found. Build one with voice-analyst.",
-                    }
-            else:
-                return {
-                    "success": True,
-                    "message": message,
-                    "synced": False,
-                    "sync_error": sync_result.get("error"),
-                    "next_step": "Configuration saved but sync failed. Check the repo URL and your git credentials.",
-                }
+            return await self._first_sync(self._store, message)
 
         return {
             "success": True,
@@ -234,3 +515,34 @@ Examples:
             "settings_path": str(settings_path),
             "next_step": next_step,
         }
+
+    async def _first_sync(self, store: ProfileStore, message: str) -> dict[str, Any]:
+        """Sync newly configured GitHub storage and say what was found."""
+        sync_result = await store.sync(force=True)
+        if sync_result.get("success"):
+            # Check if there's already a profile
+            status = await store.status()
+            if status.get("profiles"):
+                return {
+                    "success": True,
+                    "message": message,
+                    "synced": True,
+                    "profiles_found": status["profiles"],
+                    "next_step": "Your existing profile is ready to use!",
+                }
+            else:
+                return {
+                    "success": True,
+                    "message": message,
+                    "synced": True,
+                    "profiles_found": [],
+                    "next_step": "Storage connected but no profile found. Build one with voice-analyst.",
+                }
+        else:
+            return {
+                "success": True,
+                "message": message,
+                "synced": False,
+                "sync_error": sync_result.get("error"),
+                "next_step": "Configuration saved but sync failed. Check the repo URL and your git credentials.",
+            }
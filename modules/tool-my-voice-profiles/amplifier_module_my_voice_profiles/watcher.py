@@ -0,0 +1,262 @@
+"""File watching - tells the store when profile files or settings change.
+
+Watches a root directory and its immediate subdirectories (profiles/ and
+each profiles/<name>/), plus individual files such as settings.yaml. On
+Linux this uses inotify through ctypes, so nothing is polled and changes
+arrive as soon as they happen; elsewhere, or if inotify is unavailable, it
+falls back to comparing file signatures every poll_interval seconds.
+
+Changed paths are passed to the callback in batches. The root itself in a
+batch means "anything may have changed" (inotify queue overflow).
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds between scans when polling
+POLL_INTERVAL = 2.0
+
+# inotify event bits (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+
+# A directory appearing in root gets a watch of its own
+IN_CREATE_DIR = IN_CREATE | IN_MOVED_TO
+
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+OnChange = Callable[[set[Path]], None]
+
+
+def _load_inotify() -> Optional[ctypes.CDLL]:
+    """libc with inotify functions, or None where it isn't available."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class FileWatcher:
+    """Watch root (two levels deep) and some individual files for changes."""
+
+    def __init__(
+        self,
+        root: Path,
+        on_change: OnChange,
+        files: tuple[Path, ...] = (),
+        poll_interval: float = POLL_INTERVAL,
+        use_inotify: bool = True,
+    ):
+        self.root = root
+        self.files = tuple(files)
+        self._on_change = on_change
+        self._poll_interval = poll_interval
+        self._use_inotify = use_inotify
+        self.backend: Optional[str] = None  # "inotify" or "poll" once started
+        self.events = 0
+
+        # inotify state
+        self._libc: Optional[ctypes.CDLL] = None
+        self._fd: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Watch descriptor -> (directory, whether all its entries matter);
+        # parents of watched files only report those files
+        self._watches: dict[int, tuple[Path, bool]] = {}
+
+        # polling state
+        self._poll_task: Optional[asyncio.Task] = None
+        self._signatures: dict[Path, tuple[int, int]] = {}
+
+    @property
+    def running(self) -> bool:
+        return self.backend is not None
+
+    def start(self) -> bool:
+        """Start watching (needs a running event loop). False if root is missing."""
+        if self.running:
+            return True
+        if not self.root.is_dir():
+            return False
+        self._loop = asyncio.get_running_loop()
+        if self._use_inotify and self._start_inotify():
+            self.backend = "inotify"
+        else:
+            self._signatures = self._scan()
+            self._poll_task = self._loop.create_task(self._poll())
+            self.backend = "poll"
+        return True
+
+    def stop(self) -> None:
+        """Stop watching; safe to call more than once."""
+        if self._fd is not None:
+            try:
+                if self._loop is not None and not self._loop.is_closed():
+                    self._loop.remove_reader(self._fd)
+            except (RuntimeError, ValueError):
+                pass
+            os.close(self._fd)
+            self._fd = None
+        self._watches.clear()
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+        self.backend = None
+
+    def _notify(self, changed: set[Path]) -> None:
+        if not changed:
+            return
+        self.events += 1
+        try:
+            self._on_change(changed)
+        except Exception:
+            # A failing consumer must not stop the watcher
+            logger.warning("File change callback failed", exc_info=True)
+
+    # inotify backend
+
+    def _start_inotify(self) -> bool:
+        libc = _load_inotify()
+        if libc is None:
+            return False
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return False
+        self._libc, self._fd = libc, fd
+        if not self._add_watch(self.root, tree=True):
+            self.stop()
+            return False
+        for directory in self.root.iterdir():
+            if directory.is_dir():
+                self._add_watch(directory, tree=True)
+        for parent in {f.parent for f in self.files if f.parent.is_dir()}:
+            self._add_watch(parent, tree=False)
+        self._loop.add_reader(fd, self._read_events)
+        return True
+
+    def _add_watch(self, directory: Path, tree: bool) -> bool:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            return False
+        self._watches[wd] = (directory, tree)
+        return True
+
+    def _read_events(self) -> None:
+        """Reader callback - drain pending events and report the paths."""
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self.stop()
+            return
+
+        changed: set[Path] = set()
+        lost_root = False
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(buffer):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+            offset += EVENT_HEADER.size
+            name = buffer[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                changed.add(self.root)
+                continue
+            if wd not in self._watches:
+                continue
+            directory, tree = self._watches[wd]
+            if mask & IN_IGNORED:
+                del self._watches[wd]  # Directory deleted or moved away
+                lost_root = lost_root or directory == self.root
+                continue
+            path = directory / os.fsdecode(name) if name else directory
+            if not tree and path not in self.files:
+                continue
+            changed.add(path)
+            if directory == self.root and mask & IN_ISDIR and mask & IN_CREATE_DIR:
+                self._add_watch(path, tree=True)  # New profile directory
+        if lost_root:
+            changed.add(self.root)
+            self.stop()  # Caller restarts once root exists again
+        self._notify(changed)
+
+    # Polling backend
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        """(mtime_ns, size) of everything being watched.
+
+        Directories only count by presence - their mtime moves whenever a
+        file inside is replaced, which the file's own signature already shows.
+        """
+        signatures: dict[Path, tuple[int, int]] = {}
+        paths: list[Path] = list(self.files)
+        try:
+            for entry in self.root.iterdir():
+                if entry.is_dir():
+                    signatures[entry] = (0, 0)
+                    paths.extend(entry.iterdir())
+                else:
+                    paths.append(entry)
+        except OSError:
+            pass
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            signatures[path] = (stat.st_mtime_ns, stat.st_size)
+        return signatures
+
+    async def _poll(self) -> None:
+        while True:
+            await asyncio.sleep(self._poll_interval)
+            signatures = await asyncio.to_thread(self._scan)
+            changed = {
+                path
+                for path in signatures.keys() | self._signatures.keys()
+                if signatures.get(path) != self._signatures.get(path)
+            }
+            self._signatures = signatures
+            self._notify(changed)
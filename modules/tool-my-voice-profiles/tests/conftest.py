@@ -0,0 +1,81 @@
+"""Shared fixtures - a throwaway HOME and a bare git remote to sync against."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+PROFILE = "# Voice Profile\n\n## Quick Reference Card\nShort and direct.\n"
+
+
+def git(*args: str, cwd: Path) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    )
+    return result.stdout
+
+
+class Remote:
+    """A bare repo plus a second clone that plays another device."""
+
+    def __init__(self, root: Path):
+        self.path = root / "remote.git"
+        self.device = root / "other-device"
+        git("init", "-q", "--bare", "-b", "main", str(self.path), cwd=root)
+        git("clone", "-q", str(self.path), str(self.device), cwd=root)
+        self.push({"profiles/default/VOICE_PROFILE.md": PROFILE}, "Initial profile")
+
+    @property
+    def url(self) -> str:
+        return f"git+file://{self.path}"
+
+    def push(self, files: dict[str, str], message: str) -> None:
+        """Commit files from the other device and push them."""
+        if git("branch", "--list", cwd=self.device):  # Empty until the first push
+            git("pull", "-q", "--rebase", "origin", "main", cwd=self.device)
+        for name, content in files.items():
+            path = self.device / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        git("add", "-A", cwd=self.device)
+        git("commit", "-qm", message, cwd=self.device)
+        git("push", "-q", "origin", "HEAD:main", cwd=self.device)
+
+    def files(self) -> list[str]:
+        """Files at the tip of the remote's main branch."""
+        return git("ls-tree", "-r", "--name-only", "main", cwd=self.path).split()
+
+    def read(self, name: str) -> str:
+        """A file's content at the tip of the remote's main branch."""
+        return git("show", f"main:{name}", cwd=self.path)
+
+    def log(self) -> list[str]:
+        """Commit subjects on the remote, newest first."""
+        return git("log", "--format=%s", "main", cwd=self.path).splitlines()
+
+
+@pytest.fixture(autouse=True)
+def home(tmp_path, monkeypatch):
+    """Keep settings, clones and git identity out of the real home directory."""
+    home = tmp_path / "home"
+    (home / ".amplifier").mkdir(parents=True)
+    monkeypatch.setenv("HOME", str(home))
+    for key in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{key}_NAME", "Test")
+        monkeypatch.setenv(f"GIT_{key}_EMAIL", "test@example.com")
+    return home
+
+
+@pytest.fixture
+def remote(tmp_path):
+    return Remote(tmp_path)
+
+
+@pytest.fixture
+def git_config(remote, tmp_path):
+    """Store config for a clone of the remote, committing on every write."""
+    return {
+        "profile_source": remote.url,
+        "local_path": str(tmp_path / "profiles"),
+        "save_delay": 0,
+    }
@@ -0,0 +1,30 @@
+"""Profile content cache - hits until the file on disk changes."""
+
+import asyncio
+import os
+
+from amplifier_module_my_voice_profiles.store import ProfileStore
+
+
+def test_external_edit_invalidates_cache(tmp_path):
+    store = ProfileStore({"profile_source": "local", "local_path": str(tmp_path)})
+    path = tmp_path / "profiles" / "default" / "VOICE_PROFILE.md"
+    path.parent.mkdir(parents=True)
+    path.write_text("# Voice\n\nShort.\n")
+
+    async def read() -> str:
+        return (await store.read_profile())["content"]
+
+    assert asyncio.run(read()) == "# Voice\n\nShort.\n"
+    assert asyncio.run(read()) == "# Voice\n\nShort.\n"
+    assert store.cache_stats()["hits"] == 1
+
+    # Same size, so only the mtime tells the two apart
+    stat = path.stat()
+    path.write_text("# Voice\n\nTerse.\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert asyncio.run(read()) == "# Voice\n\nTerse.\n"
+
+    path.write_text("# Voice\n\nTerse, and direct.\n")
+    assert asyncio.run(read()) == "# Voice\n\nTerse, and direct.\n"
+    assert store.cache_stats()["hits"] == 1
@@ -0,0 +1,58 @@
+"""Feature counts sidecar - stays on the device and is never silently reset."""
+
+import asyncio
+
+from amplifier_module_my_voice_profiles.features import (
+    FEATURES_FILE,
+    UNREADABLE_FEATURES_FILE,
+    FeatureCounts,
+)
+from amplifier_module_my_voice_profiles.store import ProfileStore
+
+
+def local_store(tmp_path) -> ProfileStore:
+    return ProfileStore({"profile_source": "local", "local_path": str(tmp_path)})
+
+
+def test_unreadable_counts_without_corpus_are_left_alone(tmp_path):
+    store = local_store(tmp_path)
+    path = store._features_path("default")
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"not a counts file")
+
+    result = asyncio.run(store.add_samples(["fwiw that works for me"]))
+
+    assert not result["success"]
+    assert "can't be read" in result["error"]
+    assert path.read_bytes() == b"not a counts file"
+
+
+def test_unreadable_counts_are_rebuilt_from_corpus(tmp_path):
+    store = local_store(tmp_path)
+    text = tmp_path / "export.txt"
+    text.write_text("tbh I'd ship it\n\nlgtm, ship it\n")
+    asyncio.run(store.ingest_samples(str(text), fmt="text"))
+    path = store._features_path("default")
+    path.write_bytes(b"MVFC\x01garbage")
+
+    result = asyncio.run(store.add_samples(["one more, ship it"]))
+
+    assert result["success"]
+    assert "rebuilt" in result["warning"]
+    assert FeatureCounts.from_bytes(path.read_bytes()).samples == 3
+    kept = path.parent / UNREADABLE_FEATURES_FILE
+    assert kept.read_bytes() == b"MVFC\x01garbage"
+
+
+def test_counts_stay_out_of_the_profile_repo(git_config, remote):
+    async def main():
+        store = ProfileStore(git_config)
+        await store.sync()
+        await store.add_samples(["my pin is 4321, meet me at 12 Elm Street"])
+        await store.save("Update profile")
+        await store.drain_outbox()
+        store.close()
+        await store.wait_closed()
+
+    asyncio.run(main())
+    assert not any(FEATURES_FILE in name for name in remote.files())
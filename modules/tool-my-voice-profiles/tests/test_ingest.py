@@ -0,0 +1,96 @@
+"""Sample ingestion - only the user's own messages make it into the corpus."""
+
+import json
+
+from amplifier_module_my_voice_profiles.ingest import iter_mbox, iter_slack
+
+MBOX = """\
+From ada@example.com Mon Jan  5 09:00:00 2026
+From: Ada <ada@example.com>
+Subject: Rollout
+Date: Mon, 5 Jan 2026 09:00:00 +0000
+
+sounds good, let's ship thursday
+
+--
+Ada
+
+From bob@example.com Mon Jan  5 09:05:00 2026
+From: Bob <bob@example.com>
+Subject: Re: Rollout
+
+Thursday works for me.
+
+From ada@example.com Mon Jan  5 09:10:00 2026
+From: "Ada" <ADA@example.com>
+Subject: Re: Rollout
+
+fwiw I'd keep the flag on for a week
+> Thursday works for me.
+
+On Mon, 5 Jan 2026, Bob wrote:
+Thursday works for me.
+"""
+
+
+def test_mbox_keeps_own_messages_without_quotes(tmp_path):
+    path = tmp_path / "sent.mbox"
+    path.write_text(MBOX)
+
+    texts = [m["text"] for m in iter_mbox(path, ["ada@example.com"])]
+
+    assert texts == [
+        "sounds good, let's ship thursday",
+        "fwiw I'd keep the flag on for a week",
+    ]
+
+
+def test_slack_export_matches_users_json(tmp_path):
+    users = [
+        {"id": "U1", "name": "ada", "profile": {"email": "ada@example.com"}},
+        {"id": "U2", "name": "bob", "profile": {"email": "bob@example.com"}},
+    ]
+    messages = [
+        {"type": "message", "subtype": "channel_join", "user": "U1", "text": "joined"},
+        {"type": "message", "user": "U2", "text": "deploy is stuck"},
+        {
+            "type": "message",
+            "user": "U1",
+            "text": "<@U2> on it - see <https://example.com/run|the run>",
+            "ts": "1767603600.000100",
+        },
+    ]
+    (tmp_path / "users.json").write_text(json.dumps(users))
+    (tmp_path / "general").mkdir()
+    (tmp_path / "general" / "2026-01-05.json").write_text(json.dumps(messages))
+
+    samples = list(iter_slack(tmp_path, ["ada@example.com"]))
+
+    assert samples == [
+        {
+            "text": "@U2 on it - see the run",
+            "timestamp": "1767603600.000100",
+            "channel": "general",
+        }
+    ]
+
+
+def test_slack_message_file_matches_user_profile(tmp_path):
+    path = tmp_path / "messages.json"
+    messages = [
+        {
+            "type": "message",
+            "user": "U9",
+            "text": "lgtm",
+            "user_profile": {"real_name": "Ada"},
+        },
+        {
+            "type": "message",
+            "user": "U8",
+            "text": "nit",
+            "user_profile": {"real_name": "Bob"},
+        },
+    ]
+    path.write_text(json.dumps({"messages": messages}))
+
+    assert [m["text"] for m in iter_slack(path, ["ada"])] == ["lgtm"]
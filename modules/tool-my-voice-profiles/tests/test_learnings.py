@@ -0,0 +1,103 @@
+"""Learnings Log - rows appended in place, old ones archived."""
+
+import asyncio
+import datetime
+from pathlib import Path
+
+from amplifier_module_my_voice_profiles.learnings import ARCHIVE_FILE, count_learnings
+from amplifier_module_my_voice_profiles.sections import (
+    LEARNINGS_SECTION,
+    append_table_row,
+)
+from amplifier_module_my_voice_profiles.store import ProfileStore
+
+TEMPLATE = Path(__file__).parents[3] / "templates" / "VOICE_PROFILE_TEMPLATE.md"
+
+
+def local_store(tmp_path, profile: str) -> ProfileStore:
+    path = tmp_path / "profiles" / "default" / "VOICE_PROFILE.md"
+    path.parent.mkdir(parents=True)
+    path.write_text(profile)
+    return ProfileStore({"profile_source": "local", "local_path": str(tmp_path)})
+
+
+def test_append_replaces_template_placeholder(tmp_path):
+    template = TEMPLATE.read_text()
+    store = local_store(tmp_path, template)
+
+    result = asyncio.run(
+        store.append_learning("Long openers", "Lead with the ask", date="2026-01-05")
+    )
+
+    assert result["success"]
+    profile = (tmp_path / "profiles/default/VOICE_PROFILE.md").read_text()
+    row = "| 2026-01-05 | Long openers | Lead with the ask |\n"
+    assert profile == template.replace(
+        "| [DATE] | [What you learned] | [How to apply it] |\n", row
+    )
+
+
+def test_appended_rows_keep_order_and_escape_pipes(tmp_path):
+    store = local_store(tmp_path, TEMPLATE.read_text())
+
+    async def main():
+        await store.append_learning("First", "One", date="2026-01-05")
+        await store.append_learning("Uses a | b", "Two", date="2026-01-06")
+
+    asyncio.run(main())
+    profile = (tmp_path / "profiles/default/VOICE_PROFILE.md").read_text()
+    first = profile.index("| 2026-01-05 | First | One |")
+    second = profile.index("| 2026-01-06 | Uses a \\| b | Two |")
+    assert first < second
+    assert count_learnings(profile) == 2
+
+
+def with_entries(count: int) -> str:
+    """The template with count daily entries from 2026-01-01."""
+    profile = TEMPLATE.read_text()
+    for i in range(count):
+        day = datetime.date(2026, 1, 1) + datetime.timedelta(i)
+        profile = append_table_row(
+            profile, LEARNINGS_SECTION, [day.isoformat(), f"Entry {i}", "Adjust"]
+        )
+    return profile
+
+
+def test_append_compacts_above_threshold(tmp_path):
+    store = local_store(tmp_path, with_entries(49))
+    profile_dir = tmp_path / "profiles" / "default"
+
+    async def main():
+        at_threshold = await store.append_learning("Entry 49", "Adjust")
+        assert "compacted" not in at_threshold
+        return await store.append_learning("Entry 50", "Adjust")
+
+    result = asyncio.run(main())
+
+    # 51 entries, newest 20 kept - all of January is archived
+    assert result["compacted"] == 31
+    profile = (profile_dir / "VOICE_PROFILE.md").read_text()
+    assert count_learnings(profile) == 20
+    assert "| 2026-01 | 31 |" in profile
+    archive = (profile_dir / ARCHIVE_FILE).read_text()
+    assert "| 2026-01-01 | Entry 0 | Adjust |" in archive
+    assert "| 2026-01-31 | Entry 30 | Adjust |" in archive
+    assert "Entry 31 " not in archive
+
+
+def test_compaction_merges_summary(tmp_path):
+    store = local_store(tmp_path, with_entries(40))
+
+    async def main():
+        first = await store.compact_learnings(keep=20)
+        second = await store.compact_learnings(keep=5)
+        return first, second
+
+    first, second = asyncio.run(main())
+
+    assert (first["moved"], second["moved"]) == (20, 15)
+    assert second["remaining"] == 5
+    profile = (tmp_path / "profiles/default/VOICE_PROFILE.md").read_text()
+    assert "| 2026-01 | 31 |" in profile
+    assert "| 2026-02 | 4 |" in profile
+    assert profile.count("### Archived Summary") == 1
@@ -0,0 +1,82 @@
+"""Anti-pattern lint - quoted phrases in the profile are found in drafts."""
+
+import asyncio
+
+from amplifier_module_my_voice_profiles.lint import compile_lint_rules
+from amplifier_module_my_voice_profiles.sections import parse_sections
+from amplifier_module_my_voice_profiles.store import ProfileStore
+
+PROFILE = """\
+# Voice Profile
+
+### NEVER DO
+- Open with "I hope this email finds you well"
+- Use “circle back” or 'synergy'
+- Sound like a press release
+- [Formalizations to avoid]
+
+## Anti-Patterns (What NOT To Do)
+
+### Don't Hedge
+❌ "just wanted to ... check"
+✅ Ask directly
+
+### Don't Over-Thank
+❌ Thanks so much!!
+✅ thanks
+"""
+
+
+def lint(draft: str, profile: str = PROFILE) -> list[dict]:
+    return compile_lint_rules(profile, parse_sections(profile)).lint(draft)
+
+
+def test_quoted_phrases_match_case_and_whitespace_insensitively():
+    hits = lint("Hi team,\nI  hope this EMAIL finds you well. Let's circle back.")
+    assert [h["pattern"] for h in hits] == [
+        "I hope this email finds you well",
+        "circle back",
+    ]
+    assert hits[0]["section"] == "NEVER DO"
+    assert hits[0]["text"] == "I  hope this EMAIL finds you well"
+
+
+def test_single_quotes_and_word_boundaries():
+    assert [h["text"] for h in lint("pure synergy")] == ["synergy"]
+    assert lint("synergyless") == []
+
+
+def test_ellipsis_and_fix():
+    draft = "just wanted to quickly check in"
+    (hit,) = lint(draft)
+    assert hit["text"] == "just wanted to quickly check"
+    assert hit["fix"] == "Ask directly"
+    assert [h["text"] for h in lint("Thanks so much!! for this")] == [
+        "Thanks so much!!"
+    ]
+
+
+def test_prose_and_placeholder_rules():
+    matcher = compile_lint_rules(PROFILE, parse_sections(PROFILE))
+    assert matcher.unchecked == ["Sound like a press release"]
+    assert all("Formalizations" not in r.rule for r in matcher.rules)
+
+
+def test_lint_recompiles_after_profile_changes(tmp_path):
+    path = tmp_path / "profiles" / "default" / "VOICE_PROFILE.md"
+    path.parent.mkdir(parents=True)
+    path.write_text(PROFILE)
+    store = ProfileStore({"profile_source": "local", "local_path": str(tmp_path)})
+
+    async def main():
+        before = await store.lint_drafts(["per my last email"])
+        rules = PROFILE.replace(
+            "- Sound like", '- Say "per my last email"\n- Sound like'
+        )
+        await store.write_profile(rules)
+        after = await store.lint_drafts(["per my last email"])
+        return before, after
+
+    before, after = asyncio.run(main())
+    assert before["results"][0]["clean"]
+    assert not after["results"][0]["clean"]
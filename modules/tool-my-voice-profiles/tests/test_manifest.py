@@ -0,0 +1,35 @@
+"""Profile manifest - tracks profiles/ by stat, written only by status/sync."""
+
+import asyncio
+import json
+
+from amplifier_module_my_voice_profiles.store import MANIFEST_FILE, ProfileStore
+
+
+def test_manifest_follows_edits_inside_existing_profile(tmp_path):
+    config = {"profile_source": "local", "local_path": str(tmp_path)}
+    (tmp_path / "profiles" / "default").mkdir(parents=True)
+    reader = ProfileStore(config)
+    assert reader.configuration_state == "configured_no_profile"
+
+    (tmp_path / "profiles/default/VOICE_PROFILE.md").write_text("# Voice\n")
+    assert reader.configuration_state == "ready"
+
+    (tmp_path / "profiles/default/VOICE_PROFILE.md").unlink()
+    assert reader.configuration_state == "configured_no_profile"
+
+
+def test_configuration_state_does_not_write_manifest(tmp_path):
+    store = ProfileStore({"profile_source": "local", "local_path": str(tmp_path)})
+    (tmp_path / "profiles" / "default").mkdir(parents=True)
+    (tmp_path / "profiles/default/VOICE_PROFILE.md").write_text("# Voice\n")
+    manifest = store.meta_dir / MANIFEST_FILE
+
+    assert store.configuration_state == "ready"
+    assert not manifest.exists()
+
+    status = asyncio.run(store.status())
+    assert status["profiles"] == ["default"]
+    assert manifest.exists()
+    saved = json.loads(manifest.read_text())["profiles"]
+    assert saved == {"default": {"size": 8, "mtime_ns": saved["default"]["mtime_ns"]}}
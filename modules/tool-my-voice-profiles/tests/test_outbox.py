@@ -0,0 +1,47 @@
+"""Push outbox - unpushed commits and their backoff survive a restart."""
+
+import asyncio
+
+from amplifier_module_my_voice_profiles.store import (
+    OUTBOX_FILE,
+    PUSH_RETRY_BASE,
+    ProfileStore,
+)
+
+
+def test_outbox_and_backoff_survive_restart(git_config, remote):
+    config = {**git_config, "background_push": False}
+    offline = remote.path.with_suffix(".offline")
+
+    async def first_session():
+        store = ProfileStore(config)
+        await store.sync()
+        remote.path.rename(offline)
+        await store.append_learning("Long openers", "Lead with the ask")
+        retry = await store.flush()  # Fails again - the backoff doubles
+        assert not retry["success"]
+        store.close()
+        await store.wait_closed()
+        return retry
+
+    async def second_session():
+        store = ProfileStore(config)
+        outbox = (await store.status())["outbox"]
+        offline.rename(remote.path)
+        drained = await store.drain_outbox()
+        store.close()
+        await store.wait_closed()
+        return store, outbox, drained
+
+    retry = asyncio.run(first_session())
+    assert retry["outbox"] == 1
+
+    store, outbox, drained = asyncio.run(second_session())
+    assert outbox["depth"] == 1
+    assert outbox["attempts"] == 2
+    # Second failure backs off 2 * PUSH_RETRY_BASE, with +/-50% jitter
+    assert PUSH_RETRY_BASE - 1 <= outbox["next_retry_in"] <= 3 * PUSH_RETRY_BASE
+    assert outbox["last_error"]
+    assert drained == {"success": True, "outbox": 0, "error": None}
+    assert not (store.meta_dir / OUTBOX_FILE).exists()
+    assert remote.log()[0] == "Add learning to default voice profile"
@@ -0,0 +1,35 @@
+"""Store pool - an evicted store finishes with its checkout before reuse."""
+
+import asyncio
+
+from amplifier_module_my_voice_profiles.pool import ProfileStorePool
+
+
+def test_reacquire_waits_for_retiring_store(remote, tmp_path):
+    pool = ProfileStorePool(
+        {
+            "tenants_dir": str(tmp_path / "tenants"),
+            "max_tenants": 1,
+            "save_delay": 60,  # Left pending until the store is retired
+            "users": {
+                "ada": {"profile_source": remote.url},
+                "bob": {"profile_source": remote.url},
+            },
+        }
+    )
+
+    async def main():
+        async with pool.use("ada") as store:
+            await store.sync()
+            await store.append_learning("Long openers", "Lead with the ask")
+            evicted = store
+        async with pool.use("bob"):
+            pass  # Evicts ada's store, retiring it in the background
+        async with pool.use("ada") as store:
+            assert store is not evicted
+            assert not evicted._pending_saves
+            assert not evicted._outbox
+        await pool.close()
+
+    asyncio.run(main())
+    assert len(remote.log()) == 2
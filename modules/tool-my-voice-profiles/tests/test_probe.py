@@ -0,0 +1,30 @@
+"""Remote probe - a sync with nothing new on the remote skips the pull."""
+
+import asyncio
+
+from amplifier_module_my_voice_profiles.store import ProfileStore
+
+
+def pulls(store: ProfileStore) -> int:
+    return store.metrics.snapshot()["spans"].get("git.pull", {}).get("count", 0)
+
+
+def test_unchanged_remote_skips_pull(git_config, remote):
+    async def main():
+        store = ProfileStore(git_config)
+        await store.sync()  # Clone
+
+        result = await store.sync(force=True)
+        assert result["message"] == "Already up to date (remote unchanged)"
+        assert (await store.status())["last_sync_kind"] == "probe"
+        assert pulls(store) == 0
+
+        remote.push({"profiles/default/DECODER_RING.md": "# Ring\n"}, "Add ring")
+        result = await store.sync(force=True)
+        assert result["message"] == "Synced with remote"
+        assert (await store.status())["last_sync_kind"] == "fetch"
+        assert pulls(store) == 1
+        store.close()
+        await store.wait_closed()
+
+    asyncio.run(main())
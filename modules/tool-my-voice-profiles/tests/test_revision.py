@@ -0,0 +1,39 @@
+"""Reading a profile as committed at a revision."""
+
+import asyncio
+
+import pytest
+
+from amplifier_module_my_voice_profiles.store import ProfileStore
+
+
+def test_read_at_revision(git_config, remote):
+    async def main():
+        store = ProfileStore({**git_config, "background_push": False})
+        await store.sync()
+        await store.write_profile("# Voice Profile\n\nRewritten.\n")
+        result = await store.read_profile(revision="HEAD~1")
+        store.close()
+        await store.wait_closed()
+        return result
+
+    result = asyncio.run(main())
+    assert result["success"]
+    assert "Short and direct." in result["content"]
+
+
+@pytest.mark.parametrize("revision", ["HEAD:../../", "HEAD:README.md", "HEAD\n", " "])
+def test_invalid_revision_is_rejected(git_config, revision):
+    async def main():
+        store = ProfileStore(git_config)
+        await store.sync()
+        result = await store.read_profile(revision=revision)
+        starts = store._batch.starts
+        store.close()
+        await store.wait_closed()
+        return result, starts
+
+    result, starts = asyncio.run(main())
+    assert not result["success"]
+    assert result["error"].startswith("Invalid revision")
+    assert starts == 0  # Never reached cat-file
@@ -0,0 +1,58 @@
+"""Style vector calibration - the user's own unseen messages should match."""
+
+from amplifier_module_my_voice_profiles.style import StyleVector
+
+MESSAGES = [
+    "hey - quick one, can you take a look at the PR before standup? no rush tbh",
+    "yep, makes sense. I'd ship it as-is and fix the flaky test after",
+    "fwiw I think we're overthinking this. just bump the timeout and move on",
+    "sounds good! ping me if the deploy gets stuck again",
+    "ok so the cache thing was my fault - pushed a fix, should be green now",
+    "can we sync tmrw? I've got a couple of questions on the rollout plan",
+    "lgtm, one nit on the naming but not blocking",
+    "heads up: I'm out friday, so let's land the migration thursday if we can",
+    "honestly the old dashboard was fine. not sure we need the rewrite rn",
+    "nice work on the perf numbers - that's a big drop, well done",
+    "quick q - is the retry logic on the client or the server side?",
+    "I'll take a pass at the docs tonight, should be short",
+]
+
+FORMAL = (
+    "Dear Sir or Madam, I am writing to formally request a comprehensive "
+    "review of the quarterly financial statements at your earliest convenience."
+)
+
+
+def build(samples: list[str]) -> StyleVector:
+    vector = StyleVector().update(samples)
+    vector.calibrate(samples)
+    return vector
+
+
+def test_held_out_score_matches_vector_without_the_sample():
+    vector = StyleVector().update(MESSAGES)
+    for i, message in enumerate(MESSAGES):
+        without = StyleVector().update(MESSAGES[:i] + MESSAGES[i + 1 :])
+        assert (
+            abs(vector.held_out_score(message) - without.score(message)["score"])
+            < 0.002
+        )
+
+
+def test_unseen_own_messages_match():
+    matches = 0
+    for i, message in enumerate(MESSAGES):
+        vector = build(MESSAGES[:i] + MESSAGES[i + 1 :])
+        matches += vector.score(message)["matches"]
+    # p10 baseline - most of the user's own unseen messages should pass
+    assert matches >= len(MESSAGES) * 0.7
+
+
+def test_other_style_does_not_match():
+    assert build(MESSAGES).score(FORMAL)["matches"] is False
+
+
+def test_single_sample_has_no_baseline():
+    vector = build(MESSAGES[:1])
+    assert vector.baseline is None
+    assert "matches" not in vector.score(MESSAGES[1])
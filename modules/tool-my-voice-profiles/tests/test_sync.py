@@ -0,0 +1,44 @@
+"""Single-flight sync - concurrent callers share one pull."""
+
+import asyncio
+
+from amplifier_module_my_voice_profiles.store import ProfileStore
+
+
+def test_concurrent_syncs_share_one_pull(git_config, remote):
+    async def main():
+        store = ProfileStore(git_config)
+        await store.sync()  # Clone
+        before = (await store.status())["sync"]
+
+        remote.push({"profiles/default/DECODER_RING.md": "# Ring\n"}, "Add ring")
+        results = await asyncio.gather(*(store.sync(force=True) for _ in range(5)))
+
+        after = (await store.status())["sync"]
+        assert after["started"] - before["started"] == 1
+        assert after["coalesced"] - before["coalesced"] == 4
+        assert all(result == results[0] for result in results)
+        assert (store.local_path / "profiles/default/DECODER_RING.md").exists()
+        store.close()
+        await store.wait_closed()
+
+    asyncio.run(main())
+
+
+def test_forced_sync_does_not_settle_for_unforced_one(git_config, remote):
+    async def main():
+        store = ProfileStore(git_config)
+        await store.sync()  # Clone - the store is fresh, so not stale
+
+        remote.push({"profiles/default/DECODER_RING.md": "# Ring\n"}, "Add ring")
+        unforced = store.start_sync()  # Decides there's nothing to do
+        result = await store.sync(force=True)
+
+        assert (await unforced)["message"] == "Already up to date (not stale)"
+        assert result["success"]
+        assert result["message"] == "Synced with remote"
+        assert (store.local_path / "profiles/default/DECODER_RING.md").exists()
+        store.close()
+        await store.wait_closed()
+
+    asyncio.run(main())
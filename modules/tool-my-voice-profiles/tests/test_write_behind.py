@@ -0,0 +1,51 @@
+"""Write-behind saves - writes in a quiet period share one commit."""
+
+import asyncio
+
+from amplifier_module_my_voice_profiles.store import ProfileStore
+
+
+def test_writes_are_batched_until_flush(git_config, remote):
+    async def main():
+        store = ProfileStore({**git_config, "save_delay": 60})
+        await store.sync()
+        for observation in ("Long openers", "Too many hedges", "No sign-off"):
+            result = await store.append_learning(observation, "Trim it")
+            assert result["success"]
+        assert len(remote.log()) == 1  # Nothing committed yet
+
+        result = await store.flush()
+        assert result["success"]
+        assert (await store.drain_outbox())["outbox"] == 0
+        store.close()
+        await store.wait_closed()
+
+    asyncio.run(main())
+    assert len(remote.log()) == 2  # One commit for all three
+    profile = remote.read("profiles/default/VOICE_PROFILE.md")
+    assert all(o in profile for o in ("Long openers", "Too many hedges", "No sign-off"))
+
+
+def test_flush_pushes_commits_left_in_outbox(git_config, remote):
+    async def main():
+        store = ProfileStore({**git_config, "background_push": False})
+        await store.sync()
+        offline = remote.path.rename(remote.path.with_suffix(".offline"))
+        result = await store.append_learning("Long openers", "Lead with the ask")
+        assert result["save_result"]["queued"]
+
+        # No writes are pending, but the commit still hasn't been pushed
+        result = await store.flush()
+        assert not result["success"]
+        assert result["outbox"] == 1
+
+        offline.rename(remote.path)
+        result = await store.flush()
+        assert result["success"]
+        assert result["outbox"] == 0
+        assert (await store.flush())["message"] == "No pending writes"
+        store.close()
+        await store.wait_closed()
+
+    asyncio.run(main())
+    assert len(remote.log()) == 2